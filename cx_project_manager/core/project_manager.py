@@ -13,6 +13,7 @@ import re
 
 from PySide6.QtWidgets import QMessageBox
 
+from ..utils.constants import CUT_PATTERN
 from ..utils.models import ProjectPaths, ReuseCut
 from ..utils.utils import (
     ensure_dir, copy_file_safe, zero_pad, parse_cut_id, format_cut_id,
@@ -43,6 +44,17 @@ class ProjectManager:
         # 默认配置
         self.default_registry_path = Path("E:/3_Projects/_proj_settings/project_registry.json")
 
+    @property
+    def project_config(self) -> Optional[Dict[str, Any]]:
+        """当前项目配置"""
+        return self._project_config
+
+    @project_config.setter
+    def project_config(self, config: Optional[Dict[str, Any]]):
+        """替换项目配置时同时清空兼用卡索引"""
+        self._project_config = config
+        self._invalidate_reuse_cut_index()
+
     # ==================== 注册表管理 ====================
 
     def set_registry_path(self, registry_path: Path):
@@ -893,6 +905,7 @@ class ProjectManager:
             self.project_config["reuse_cuts"] = []
 
         self.project_config["reuse_cuts"].append(reuse_cut.to_dict())
+        self._invalidate_reuse_cut_index()
 
         # 保存配置（自动更新注册表）
         if not self.save_config():
@@ -958,16 +971,44 @@ class ProjectManager:
                 if not new_path.exists():
                     aep_file.rename(new_path)
 
+    @staticmethod
+    def _reuse_cut_key(cut_id: str) -> str:
+        """兼用卡索引键：与 ReuseCut.contains_cut 一致，按Cut数字部分匹配"""
+        match = CUT_PATTERN.match(cut_id)
+        return match.group(1) if match else cut_id
+
+    def _invalidate_reuse_cut_index(self):
+        """清空兼用卡索引（配置变更时调用）"""
+        self._reuse_cuts_map = None
+        self._reuse_cut_lookup = None
+
+    def _rebuild_reuse_cut_index(self):
+        """根据当前配置重建兼用卡索引"""
+        self._reuse_cuts_map = {}
+        self._reuse_cut_lookup = {}
+        if not self.project_config:
+            return
+
+        for cut_data in self.project_config.get("reuse_cuts", []):
+            reuse_cut = ReuseCut.from_dict(cut_data)
+            for cut_id in reuse_cut.cuts:
+                self._reuse_cuts_map[cut_id] = reuse_cut
+                self._reuse_cut_lookup.setdefault(self._reuse_cut_key(cut_id), reuse_cut)
+
+    def get_reuse_cuts_map(self) -> Dict[str, ReuseCut]:
+        """获取 {cut_id: 兼用卡} 映射"""
+        if self._reuse_cuts_map is None:
+            self._rebuild_reuse_cut_index()
+        return self._reuse_cuts_map
+
     def get_reuse_cut_for_cut(self, cut_id: str) -> Optional[ReuseCut]:
         """获取包含指定Cut的兼用卡"""
         if not self.project_config:
             return None
 
-        for cut_data in self.project_config.get("reuse_cuts", []):
-            cut = ReuseCut.from_dict(cut_data)
-            if cut.contains_cut(cut_id):
-                return cut
-        return None
+        if self._reuse_cut_lookup is None:
+            self._rebuild_reuse_cut_index()
+        return self._reuse_cut_lookup.get(self._reuse_cut_key(cut_id))
 
     # ==================== 工具方法 ====================
 
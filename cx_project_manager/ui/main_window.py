@@ -108,6 +108,9 @@ class CXProjectManager(QMainWindow, ProjectMixin, EpisodeCutMixin,
         # 初始化控件变量
         self._init_widget_variables()
 
+        # 最近项目
+        self._init_recent_projects()
+
         # 设置UI
         self._setup_ui()
         self._setup_menubar()
@@ -555,7 +558,7 @@ class CXProjectManager(QMainWindow, ProjectMixin, EpisodeCutMixin,
             # 添加右键菜单支持
             list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
             list_widget.customContextMenuRequested.connect(
-                lambda pos, n=name.lower(): self._show_file_context_menu(pos, n))
+                partial(self._show_file_context_menu, file_type=name.lower()))
             self.file_lists[name.lower()] = list_widget
             self.file_tabs.addTab(list_widget, name)
 
@@ -727,20 +730,20 @@ class CXProjectManager(QMainWindow, ProjectMixin, EpisodeCutMixin,
 
         # 打开文件夹
         act_open = QAction("在文件管理器中打开", self)
-        act_open.triggered.connect(lambda: open_in_file_manager(path))
+        act_open.triggered.connect(partial(open_in_file_manager, path))
         menu.addAction(act_open)
 
         menu.addSeparator()
 
         # 导入文件
         act_import = QAction("导入文件到此文件夹...", self)
-        act_import.triggered.connect(lambda: self._import_to_folder(path))
+        act_import.triggered.connect(partial(self._import_to_folder, path))
         menu.addAction(act_import)
 
         # 如果是aep_templates文件夹，添加导入AEP模板选项
         if path.name == "aep_templates" or path.parent.name == "aep_templates":
             act_import_aep = QAction("导入AEP模板...", self)
-            act_import_aep.triggered.connect(lambda: self._import_aep_template(path))
+            act_import_aep.triggered.connect(partial(self._import_aep_template, path))
             menu.addAction(act_import_aep)
 
         menu.exec_(self.tree.mapToGlobal(position))
@@ -764,10 +767,14 @@ class CXProjectManager(QMainWindow, ProjectMixin, EpisodeCutMixin,
     def _save_app_settings(self):
         """保存软件设置"""
         self.app_settings.setValue("window_geometry", self.saveGeometry())
+        self._flush_recent()
         if self.project_base:
             self.app_settings.setValue("last_project", str(self.project_base))
 
     def closeEvent(self, event):
         """窗口关闭事件"""
         self._save_app_settings()
+        if self._help_dialog is not None:
+            self._help_dialog.deleteLater()
+            self._help_dialog = None
         event.accept()
\ No newline at end of file
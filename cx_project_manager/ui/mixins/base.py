@@ -56,6 +56,14 @@ class MixinBase(ABC):
         """更新最近项目菜单"""
         raise NotImplementedError
 
+    def _on_recent_menu_about_to_show(self) -> None:
+        """最近项目菜单展开"""
+        raise NotImplementedError
+
+    def _open_latest_recent_project(self) -> None:
+        """打开最近项目"""
+        raise NotImplementedError
+
     def _refresh_tree(self) -> None:
         """刷新目录树"""
         raise NotImplementedError
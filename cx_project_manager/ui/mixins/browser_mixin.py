@@ -5,18 +5,47 @@ import os
 import platform
 import subprocess
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Set, Tuple
 
 from PySide6.QtWidgets import QApplication, QTreeWidget, QTreeWidgetItem, QListWidgetItem
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QBrush, QColor, QFont
 
 from cx_project_manager.utils.models import FileInfo, ReuseCut
-from cx_project_manager.utils.utils import open_in_file_manager, get_file_info, get_png_seq_info
+from cx_project_manager.utils.utils import (
+    open_in_file_manager, get_file_info, get_file_info_from_entry, get_png_seq_info
+)
 from cx_project_manager.utils.constants import VIDEO_EXTENSIONS, IMAGE_EXTENSIONS
 
 
+def _lock_names_in(directory: Path) -> Set[str]:
+    """一次 scandir 取得目录中已有的锁定文件名，之后用集合判断，无需逐个 stat"""
+    try:
+        with os.scandir(directory) as it:
+            return {e.name for e in it if e.name.startswith(".") and e.name.endswith(".lock")}
+    except OSError:
+        return set()
+
+
+def _scan_entries_and_locks(directory: Path) -> Tuple[List[os.DirEntry], Set[str]]:
+    """一次 scandir 返回目录条目（不含锁定文件）和锁定文件名集合"""
+    entries = []
+    lock_names = set()
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith(".") and name.endswith(".lock"):
+                    lock_names.add(name)
+                else:
+                    entries.append(entry)
+    except OSError:
+        pass
+    return entries, lock_names
+
+
 class BrowserMixin:
     """文件浏览器相关功能"""
 
@@ -281,11 +310,12 @@ class BrowserMixin:
         menu = QMenu(self)
 
         act_copy = QAction("复制路径", self)
+        # setText 是内置方法，PySide6 无法推断其参数个数，用 lambda 避免 checked 被当作 mode 传入
         act_copy.triggered.connect(lambda: QApplication.clipboard().setText(str(self.current_path)))
         menu.addAction(act_copy)
 
         act_open = QAction("在文件管理器中打开", self)
-        act_open.triggered.connect(lambda: open_in_file_manager(self.current_path))
+        act_open.triggered.connect(partial(open_in_file_manager, self.current_path))
         menu.addAction(act_open)
 
         menu.exec_(self.lbl_current_cut.mapToGlobal(position))
@@ -326,24 +356,19 @@ class BrowserMixin:
         if vfx_path.exists():
             # 获取所有AEP文件
             files = []
+            lock_names = _lock_names_in(vfx_path)
             for file in vfx_path.glob("*.aep"):
                 file_info = get_file_info(file)
                 # 检查是否有锁定文件
-                lock_file = file.parent / f".{file.name}.lock"
-                if lock_file.exists():
+                if f".{file.name}.lock" in lock_names:
                     file_info.is_locked = True
                 files.append(file_info)
 
             # 按修改时间排序
             files.sort(key=lambda f: f.modified_time, reverse=True)
 
-            # 添加到列表
-            for file_info in files:
-                if hasattr(file_info, 'is_locked') and file_info.is_locked:
-                    # 在文件名前加锁定图标
-                    original_name = file_info.name
-                    file_info.name = f"🔒 {original_name}"
-                list_widget.add_file_item(file_info)
+            # 批量添加到列表（锁定图标在绘制时根据 is_locked 添加）
+            list_widget.add_file_items(files)
 
         if list_widget.count() == 0:
             item = QListWidgetItem("(没有 AEP 文件)")
@@ -357,22 +382,21 @@ class BrowserMixin:
         if not cell_path.exists():
             return
 
+        # 一次 scandir 同时得到子文件夹和锁定文件，类型判断使用 DirEntry 缓存
+        entries, lock_names = _scan_entries_and_locks(cell_path)
         folders = []
-        for folder in cell_path.iterdir():
-            if folder.is_dir():
-                file_info = get_file_info(folder)
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                file_info = get_file_info_from_entry(entry)
                 if file_info.version is not None:
                     # 检查是否有锁定文件
-                    lock_file = folder.parent / f".{folder.name}.lock"
-                    if lock_file.exists():
+                    if f".{entry.name}.lock" in lock_names:
                         file_info.is_locked = True
-                        file_info.name = f"🔒 {file_info.name}"
                     folders.append(file_info)
 
         folders.sort(key=lambda f: f.modified_time, reverse=True)
 
-        for folder_info in folders:
-            list_widget.add_file_item(folder_info)
+        list_widget.add_file_items(folders)
 
         if list_widget.count() == 0:
             item = QListWidgetItem("(没有 Cell 文件夹)")
@@ -386,21 +410,19 @@ class BrowserMixin:
         if not bg_path.exists():
             return
 
+        entries, lock_names = _scan_entries_and_locks(bg_path)
         files = []
-        for file in bg_path.iterdir():
-            if file.is_file() and file.suffix.lower() in IMAGE_EXTENSIONS:
-                file_info = get_file_info(file)
+        for entry in entries:
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                file_info = get_file_info_from_entry(entry)
                 # 检查是否有锁定文件
-                lock_file = file.parent / f".{file.name}.lock"
-                if lock_file.exists():
+                if f".{entry.name}.lock" in lock_names:
                     file_info.is_locked = True
-                    file_info.name = f"🔒 {file_info.name}"
                 files.append(file_info)
 
         files.sort(key=lambda f: f.modified_time, reverse=True)
 
-        for file_info in files:
-            list_widget.add_file_item(file_info)
+        list_widget.add_file_items(files)
 
         if list_widget.count() == 0:
             item = QListWidgetItem("(没有 BG 文件)")
@@ -460,36 +482,33 @@ class BrowserMixin:
         # ProRes视频
         prores_path = render_path / "prores"
         if prores_path.exists():
+            lock_names = _lock_names_in(prores_path)
             for file in prores_path.glob("*.mov"):
                 file_info = get_file_info(file)
                 file_info.thumbnail_path = thumbnail_path  # 设置缩略图
                 # 检查是否有锁定文件
-                lock_file = file.parent / f".{file.name}.lock"
-                if lock_file.exists():
+                if f".{file.name}.lock" in lock_names:
                     file_info.is_locked = True
-                    file_info.name = f"🔒 {file_info.name}"
                 render_items.append(file_info)
                 has_any_render = True
 
         # MP4视频
         mp4_path = render_path / "mp4"
         if mp4_path.exists():
+            lock_names = _lock_names_in(mp4_path)
             for file in mp4_path.glob("*.mp4"):
                 file_info = get_file_info(file)
                 file_info.thumbnail_path = thumbnail_path  # 设置缩略图
                 # 检查是否有锁定文件
-                lock_file = file.parent / f".{file.name}.lock"
-                if lock_file.exists():
+                if f".{file.name}.lock" in lock_names:
                     file_info.is_locked = True
-                    file_info.name = f"🔒 {file_info.name}"
                 render_items.append(file_info)
                 has_any_render = True
 
         if has_any_render:
             render_items.sort(key=lambda f: f.modified_time, reverse=True)
 
-        for item_info in render_items:
-            list_widget.add_file_item(item_info)
+        list_widget.add_file_items(render_items)
 
     def _load_cg_files(self, cg_path: Path):
         """加载3DCG文件"""
@@ -498,20 +517,22 @@ class BrowserMixin:
             return
 
         files = []
+        # 每个子目录只扫描一次锁定文件
+        lock_names_by_dir = {}
         for item in cg_path.rglob("*"):
             if item.is_file():
                 file_info = get_file_info(item)
                 # 检查是否有锁定文件
-                lock_file = item.parent / f".{item.name}.lock"
-                if lock_file.exists():
+                lock_names = lock_names_by_dir.get(item.parent)
+                if lock_names is None:
+                    lock_names = lock_names_by_dir[item.parent] = _lock_names_in(item.parent)
+                if f".{item.name}.lock" in lock_names:
                     file_info.is_locked = True
-                    file_info.name = f"🔒 {file_info.name}"
                 files.append(file_info)
 
         files.sort(key=lambda f: f.modified_time, reverse=True)
 
-        for file_info in files:
-            list_widget.add_file_item(file_info)
+        list_widget.add_file_items(files)
 
         if list_widget.count() == 0:
             item = QListWidgetItem("(没有 3DCG 文件)")
@@ -1,7 +1,11 @@
 # -*- coding: utf-8 -*-
 """素材导入功能混入类"""
 
+import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional
 from functools import partial
@@ -9,13 +13,24 @@ from functools import partial
 from PySide6.QtWidgets import QMessageBox, QFileDialog, QDialog, QApplication, QProgressDialog
 from PySide6.QtCore import Qt
 
-from cx_project_manager.utils.utils import ensure_dir, copy_file_safe, open_in_file_manager, \
+from cx_project_manager.utils.utils import ensure_dir, copy_file_safe, clone_file_safe, copy_file_fast, \
+    open_in_file_manager, is_dir_not_empty, get_dir_signature, remove_extra_entries, \
     extract_version_from_filename, extract_version_string_from_filename
 from cx_project_manager.utils.models import ReuseCut
 from cx_project_manager.utils.constants import IMAGE_EXTENSIONS
 from cx_project_manager.ui.dialogs import VersionConfirmDialog, BatchAepDialog
 
 
+@dataclass(frozen=True)
+class _ImportTarget:
+    """素材导入目标（解析后的路径与命名）"""
+    cut_id: str
+    vfx_base: Path
+    cg_base: Path
+    base_name: str
+    reuse_cut: Optional[ReuseCut] = None
+
+
 class ImportMixin:
     """素材导入相关功能"""
 
@@ -93,9 +108,10 @@ class ImportMixin:
             return
 
         # 执行导入
+        import_target = self._resolve_import_target(target)
         success_count = 0
         for material_type, path in imports:
-            if self._import_material(material_type, path, target):
+            if self._import_material(material_type, path, import_target):
                 success_count += 1
 
         if success_count > 0:
@@ -117,103 +133,122 @@ class ImportMixin:
         """批量导入所有已选择的素材"""
         self.import_single()
 
-    def _import_material(self, material_type: str, source_path: str, target: str) -> bool:
-        """执行素材导入"""
-        try:
-            src = Path(source_path)
-            if not src.exists():
-                return False
+    def _resolve_import_target(self, target: str) -> _ImportTarget:
+        """解析导入目标（"ep|cut" 或 "cut"）"""
+        display_name = self.project_config.get("project_display_name", self.project_base.name)
 
-            display_name = self.project_config.get("project_display_name", self.project_base.name)
+        # 解析目标路径
+        if "|" in target:
+            ep_id, cut_id = target.split("|")
+            vfx_base = self.project_base / ep_id / "01_vfx"
+            cg_base = self.project_base / ep_id / "02_3dcg"
+            ep_part = ep_id.upper() + "_"
+        else:
+            cut_id = target
+            vfx_base = self.project_base / "01_vfx"
+            cg_base = self.project_base / "02_3dcg"
+            ep_part = ""
 
-            # 解析目标路径
-            if "|" in target:
-                ep_id, cut_id = target.split("|")
-                vfx_base = self.project_base / ep_id / "01_vfx"
-                cg_base = self.project_base / ep_id / "02_3dcg"
-                ep_part = ep_id.upper() + "_"
-            else:
-                cut_id = target
-                vfx_base = self.project_base / "01_vfx"
-                cg_base = self.project_base / "02_3dcg"
-                ep_part = ""
+        # 检查是否是兼用卡
+        reuse_cut = self.project_manager.get_reuse_cut_for_cut(cut_id)
+        if reuse_cut:
+            cut_id = reuse_cut.main_cut
+            base_name = f"{display_name}_{ep_part}{reuse_cut.get_display_name()}"
+        else:
+            base_name = f"{display_name}_{ep_part}{cut_id}"
 
-            # 检查是否是兼用卡
-            reuse_cut = self.project_manager.get_reuse_cut_for_cut(cut_id)
-            if reuse_cut:
-                cut_id = reuse_cut.main_cut
-                base_name = f"{display_name}_{ep_part}{reuse_cut.get_display_name()}"
-            else:
-                base_name = f"{display_name}_{ep_part}{cut_id}"
+        return _ImportTarget(cut_id, vfx_base, cg_base, base_name, reuse_cut)
 
-            # 根据类型处理
-            if material_type == "bg":
-                bg_dir = vfx_base / cut_id / "bg"
-                ensure_dir(bg_dir)
+    def _import_material(self, material_type: str, source_path: str, target: _ImportTarget) -> bool:
+        """执行素材导入"""
+        src = Path(source_path)
+        if not src.exists():
+            return False
 
-                version = self.project_manager.get_next_version(bg_dir, base_name)
+        handler = {
+            "bg": self._import_bg,
+            "cell": self._import_cell,
+            "3dcg": self._import_3dcg,
+        }.get(material_type, self._import_timesheet)
 
-                if not self.skip_version_confirmation["bg"] and bg_dir.exists() and any(bg_dir.iterdir()):
-                    dialog = VersionConfirmDialog("BG", version, self)
-                    if dialog.exec() == QDialog.Accepted:
-                        version = dialog.get_version()
-                        if dialog.should_skip_confirmation():
-                            self.skip_version_confirmation["bg"] = True
-                    else:
-                        return False
+        try:
+            return handler(src, target)
+        except (OSError, shutil.Error) as e:
+            print(f"导入失败 ({material_type}): {e}")
+            return False
 
-                file_name = f"{base_name}_T{version}{src.suffix.lower()}"
-                dst = bg_dir / file_name
-                copy_file_safe(src, dst)
+    def _import_bg(self, src: Path, target: _ImportTarget) -> bool:
+        """导入BG文件"""
+        bg_dir = target.vfx_base / target.cut_id / "bg"
+        ensure_dir(bg_dir)
 
-            elif material_type == "cell":
-                cell_dir = vfx_base / cut_id / "cell"
-                ensure_dir(cell_dir)
+        version = self.project_manager.get_next_version(bg_dir, target.base_name)
 
-                version = self.project_manager.get_next_version(cell_dir, base_name)
+        if not self.skip_version_confirmation["bg"] and is_dir_not_empty(bg_dir):
+            dialog = VersionConfirmDialog("BG", version, self)
+            if dialog.exec() == QDialog.Accepted:
+                version = dialog.get_version()
+                if dialog.should_skip_confirmation():
+                    self.skip_version_confirmation["bg"] = True
+            else:
+                return False
 
-                if not self.skip_version_confirmation["cell"] and cell_dir.exists() and any(cell_dir.iterdir()):
-                    dialog = VersionConfirmDialog("Cell", version, self)
-                    if dialog.exec() == QDialog.Accepted:
-                        version = dialog.get_version()
-                        if dialog.should_skip_confirmation():
-                            self.skip_version_confirmation["cell"] = True
-                    else:
-                        return False
-
-                folder_name = f"{base_name}_T{version}"
-                dst_folder = cell_dir / folder_name
-                if dst_folder.exists():
-                    shutil.rmtree(dst_folder)
-                shutil.copytree(src, dst_folder)
-
-            elif material_type == "3dcg":
-                ensure_dir(cg_base)
-                cg_cut_dir = cg_base / cut_id
-                ensure_dir(cg_cut_dir)
-
-                for item in src.iterdir():
-                    if item.is_file():
-                        copy_file_safe(item, cg_cut_dir / item.name)
-                    elif item.is_dir():
-                        target_dir = cg_cut_dir / item.name
-                        if target_dir.exists():
-                            shutil.rmtree(target_dir)
-                        shutil.copytree(item, target_dir)
-
-            else:  # timesheet
-                if reuse_cut:
-                    dst = vfx_base / "timesheets" / f"{reuse_cut.get_display_name()}.csv"
-                else:
-                    dst = vfx_base / "timesheets" / f"{cut_id}.csv"
-                ensure_dir(dst.parent)
-                copy_file_safe(src, dst)
+        file_name = f"{target.base_name}_T{version}{src.suffix.lower()}"
+        copy_file_safe(src, bg_dir / file_name)
+        return True
 
-            return True
+    def _import_cell(self, src: Path, target: _ImportTarget) -> bool:
+        """导入Cell文件夹"""
+        cell_dir = target.vfx_base / target.cut_id / "cell"
+        ensure_dir(cell_dir)
 
-        except Exception as e:
-            print(f"导入失败 ({material_type}): {e}")
-            return False
+        version = self.project_manager.get_next_version(cell_dir, target.base_name)
+
+        if not self.skip_version_confirmation["cell"] and is_dir_not_empty(cell_dir):
+            dialog = VersionConfirmDialog("Cell", version, self)
+            if dialog.exec() == QDialog.Accepted:
+                version = dialog.get_version()
+                if dialog.should_skip_confirmation():
+                    self.skip_version_confirmation["cell"] = True
+            else:
+                return False
+
+        folder_name = f"{target.base_name}_T{version}"
+        dst_folder = cell_dir / folder_name
+        if dst_folder.exists() and get_dir_signature(src) == get_dir_signature(dst_folder):
+            # 重复导入相同内容，无需复制
+            return True
+        if dst_folder.exists():
+            # 先删除源中没有的旧帧，避免新旧序列混在同一文件夹
+            remove_extra_entries(src, dst_folder)
+        shutil.copytree(src, dst_folder, dirs_exist_ok=True, copy_function=copy_file_fast)
+        return True
+
+    def _import_3dcg(self, src: Path, target: _ImportTarget) -> bool:
+        """导入3DCG文件夹内容"""
+        cg_cut_dir = target.cg_base / target.cut_id
+        ensure_dir(cg_cut_dir)
+
+        for item in src.iterdir():
+            if item.is_file():
+                copy_file_safe(item, cg_cut_dir / item.name)
+            elif item.is_dir():
+                dst_dir = cg_cut_dir / item.name
+                if dst_dir.exists():
+                    # 已存在的目录原地更新：先删除源中已没有的条目，未变化的文件直接跳过
+                    remove_extra_entries(item, dst_dir)
+                shutil.copytree(item, dst_dir, dirs_exist_ok=True, copy_function=copy_file_fast)
+        return True
+
+    def _import_timesheet(self, src: Path, target: _ImportTarget) -> bool:
+        """导入摄影表"""
+        if target.reuse_cut:
+            dst = target.vfx_base / "timesheets" / f"{target.reuse_cut.get_display_name()}.csv"
+        else:
+            dst = target.vfx_base / "timesheets" / f"{target.cut_id}.csv"
+        ensure_dir(dst.parent)
+        copy_file_safe(src, dst)
+        return True
 
     def copy_aep_template(self):
         """复制AEP模板"""
@@ -294,7 +329,7 @@ class ImportMixin:
             version_part = template_stem[template_stem.rfind('_v'):] if '_v' in template_stem else "_v0"
             aep_name = f"{base_name}{version_part}{template.suffix}"
 
-            if copy_file_safe(template, cut_path / aep_name):
+            if clone_file_safe(template, cut_path / aep_name):
                 copied += 1
 
         message = f"已复制 {copied} 个 AEP 模板到 {'兼用卡 ' + reuse_cut.get_display_name() if reuse_cut else 'Cut ' + cut_id}"
@@ -342,11 +377,7 @@ class ImportMixin:
         targets = []
 
         # 获取兼用卡信息
-        reuse_cuts_map = {}
-        for cut_data in self.project_config.get("reuse_cuts", []):
-            cut = ReuseCut.from_dict(cut_data)
-            for cut_id in cut.cuts:
-                reuse_cuts_map[cut_id] = cut
+        reuse_cuts_map = self.project_manager.get_reuse_cuts_map()
 
         if settings["scope"] == 0:  # 所有
             if self.project_config.get("no_episode", False):
@@ -375,57 +406,66 @@ class ImportMixin:
                 cut_to = settings["cut_to"]
                 cuts = [cut for cut in cuts if cut.isdigit() and cut_from <= int(cut) <= cut_to]
 
+            # 如果ep_id是空字符串且项目没有episode，传递None
+            episode_id = None if (not ep_id and self.project_config.get("no_episode", False)) else ep_id
             for cut_id in cuts:
                 if cut_id in reuse_cuts_map and reuse_cuts_map[cut_id].main_cut != cut_id:
                     continue
-                # 如果ep_id是空字符串且项目没有episode，传递None
-                episode_id = None if (not ep_id and self.project_config.get("no_episode", False)) else ep_id
                 targets.append((episode_id, cut_id))
 
         # 执行复制
         counts = {"success": 0, "skip": 0, "overwrite": 0, "reuse_skip": 0}
 
+        # 预先计算只与模板或Episode相关的部分，循环内使用局部变量
+        skip_reuse = settings["skip_reuse"]
+        skip_existing = settings["skip_existing"]
+        overwrite = settings["overwrite"]
+        clone_file = clone_file_safe
+        version_part = "_G1"
+        template_suffixes = [template.suffix for template in templates]
+        target_eps = {ep_id for ep_id, _ in targets}
+        ep_prefix = {ep_id: f"{ep_id.upper()}_" if ep_id else "" for ep_id in target_eps}
+        ep_vfx_base = {
+            ep_id: self.project_base / ep_id / "01_vfx" if ep_id else self.project_base / "01_vfx"
+            for ep_id in target_eps
+        }
+
         for ep_id, cut_id in targets:
-            is_reuse = cut_id in reuse_cuts_map
             reuse_cut = reuse_cuts_map.get(cut_id)
+            is_reuse = reuse_cut is not None
 
-            if settings["skip_reuse"] and is_reuse:
+            if skip_reuse and is_reuse:
                 counts["reuse_skip"] += 1
                 continue
 
             actual_cut_id = reuse_cut.main_cut if is_reuse else cut_id
-            cut_path = (self.project_base / ep_id / "01_vfx" / actual_cut_id if ep_id
-                        else self.project_base / "01_vfx" / actual_cut_id)
+            cut_path = ep_vfx_base[ep_id] / actual_cut_id
 
             if not cut_path.exists():
                 continue
 
-            if settings["skip_existing"] and list(cut_path.glob("*.aep")):
-                counts["skip"] += len(list(cut_path.glob("*.aep")))
-                continue
-
-            cut_copied = 0
-            for template in templates:
-                template_stem = template.stem
+            if skip_existing:
+                existing_aeps = sum(1 for _ in cut_path.glob("*.aep"))
+                if existing_aeps:
+                    counts["skip"] += existing_aeps
+                    continue
 
-                if is_reuse:
-                    cuts_str = reuse_cut.get_display_name()
-                    base_name = f"{display_name}_{ep_id.upper() + '_' if ep_id else ''}{cuts_str}"
-                else:
-                    base_name = f"{display_name}_{ep_id.upper() + '_' if ep_id else ''}{cut_id}"
+            cuts_str = reuse_cut.get_display_name() if is_reuse else cut_id
+            base_name = f"{display_name}_{ep_prefix[ep_id]}{cuts_str}"
 
-                version_part = "_G1"
-                aep_name = f"{base_name}{version_part}{template.suffix}"
+            cut_copied = 0
+            for template, suffix in zip(templates, template_suffixes):
+                aep_name = f"{base_name}{version_part}{suffix}"
                 dst = cut_path / aep_name
 
                 if dst.exists():
-                    if settings["overwrite"]:
+                    if overwrite:
                         counts["overwrite"] += 1
                     else:
                         counts["skip"] += 1
                         continue
 
-                if copy_file_safe(template, dst):
+                if clone_file(template, dst):
                     cut_copied += 1
 
             if cut_copied > 0:
@@ -459,20 +499,35 @@ class ImportMixin:
         ensure_dir(footage_dir)
 
         # 统计信息
-        mov_files_by_episode = {}  # {episode_id: [(source_path, filename), ...]}
+        mov_files_by_episode = {}  # {episode_id: [(source_path, source_stat), ...]}
         total_count = 0
         total_size = 0
 
         # 判断项目模式
-        no_episode = self.project_config.get("no_episode", False)
+        cfg = self.project_config
+        no_episode = cfg.get("no_episode", False)
+        episodes = cfg.get("episodes", {})
+        cuts = cfg.get("cuts", [])
 
         # 收集所有MOV文件并筛选最新版本
+        def scan_mov_files(prores_dir):
+            """扫描prores目录下的MOV文件，同时保留扫描得到的stat结果"""
+            mov_files = []
+            try:
+                with os.scandir(prores_dir) as it:
+                    for entry in it:
+                        if entry.name.lower().endswith(".mov") and entry.is_file():
+                            mov_files.append((Path(entry.path), entry.stat()))
+            except OSError:
+                pass
+            return mov_files
+
         def get_latest_versions(mov_files):
-            """从MOV文件列表中获取每个cut的最新版本"""
-            # 按基础名称（不含版本号）分组
-            files_by_base = {}
+            """从MOV文件列表中获取每个cut的最新版本，返回 (路径, stat) 列表"""
+            # 按基础名称（不含版本号）只保留版本号最高的文件
+            best = {}  # {base_name: (mov_file, mov_stat, version)}
 
-            for mov_file in mov_files:
+            for mov_file, mov_stat in mov_files:
                 filename = mov_file.stem
                 # 提取版本号
                 version = extract_version_from_filename(filename)
@@ -481,78 +536,36 @@ class ImportMixin:
                 if version is not None:
                     # 查找 _v 的位置
                     version_index = filename.rfind('_v')
-                    if version_index != -1:
-                        base_name = filename[:version_index]
-                    else:
-                        base_name = filename
+                    base_name = filename[:version_index] if version_index != -1 else filename
                 else:
                     base_name = filename
                     version = 0  # 没有版本号的文件视为版本0
 
-                # 分组存储
-                if base_name not in files_by_base:
-                    files_by_base[base_name] = []
-                files_by_base[base_name].append((mov_file, version))
-
-            # 选择每组中版本号最高的文件
-            latest_files = []
-            for base_name, file_versions in files_by_base.items():
-                # 按版本号排序，取最高版本
-                file_versions.sort(key=lambda x: x[1], reverse=True)
-                latest_files.append(file_versions[0][0])  # 只取文件路径
+                current = best.get(base_name)
+                if current is None or version > current[2]:
+                    best[base_name] = (mov_file, mov_stat, version)
 
-            return latest_files
+            return [(mov_file, mov_stat) for mov_file, mov_stat, _ in best.values()]
 
-        if no_episode:
-            # 单集模式：直接在06_render下查找cut文件夹
-            cuts = self.project_config.get("cuts", [])
+        def iter_render_groups():
+            """按分组产出 (分组ID, 渲染目录, cut列表)"""
+            if no_episode:
+                # 单集模式：根目录下的cuts直接位于06_render下
+                yield "root", render_dir, cuts
+            # 单集模式下为特殊episodes，标准模式下为所有episodes
+            for ep_id, ep_cuts in episodes.items():
+                yield ep_id, render_dir / ep_id, ep_cuts
 
-            # 处理根目录下的cuts
-            root_mov_files = []
-            for cut_id in cuts:
-                cut_render_path = render_dir / cut_id / "prores"
-                if cut_render_path.exists():
-                    root_mov_files.extend(cut_render_path.glob("*.mov"))
+        for group_id, group_render_path, group_cuts in iter_render_groups():
+            group_mov_files = []
+            for cut_id in group_cuts:
+                group_mov_files.extend(scan_mov_files(group_render_path / cut_id / "prores"))
 
-            if root_mov_files:
-                latest_files = get_latest_versions(root_mov_files)
-                mov_files_by_episode["root"] = [(f, f.name) for f in latest_files]
+            if group_mov_files:
+                latest_files = get_latest_versions(group_mov_files)
+                mov_files_by_episode[group_id] = latest_files
                 total_count += len(latest_files)
-                total_size += sum(f.stat().st_size for f in latest_files)
-
-            # 处理特殊episodes
-            episodes = self.project_config.get("episodes", {})
-            for ep_id, ep_cuts in episodes.items():
-                ep_render_path = render_dir / ep_id
-                if ep_render_path.exists():
-                    ep_mov_files = []
-                    for cut_id in ep_cuts:
-                        cut_render_path = ep_render_path / cut_id / "prores"
-                        if cut_render_path.exists():
-                            ep_mov_files.extend(cut_render_path.glob("*.mov"))
-
-                    if ep_mov_files:
-                        latest_files = get_latest_versions(ep_mov_files)
-                        mov_files_by_episode[ep_id] = [(f, f.name) for f in latest_files]
-                        total_count += len(latest_files)
-                        total_size += sum(f.stat().st_size for f in latest_files)
-        else:
-            # 标准Episode模式
-            episodes = self.project_config.get("episodes", {})
-            for ep_id, cuts in episodes.items():
-                ep_render_path = render_dir / ep_id
-                if ep_render_path.exists():
-                    ep_mov_files = []
-                    for cut_id in cuts:
-                        cut_render_path = ep_render_path / cut_id / "prores"
-                        if cut_render_path.exists():
-                            ep_mov_files.extend(cut_render_path.glob("*.mov"))
-
-                    if ep_mov_files:
-                        latest_files = get_latest_versions(ep_mov_files)
-                        mov_files_by_episode[ep_id] = [(f, f.name) for f in latest_files]
-                        total_count += len(latest_files)
-                        total_size += sum(f.stat().st_size for f in latest_files)
+                total_size += sum(st.st_size for _, st in latest_files)
 
         if total_count == 0:
             QMessageBox.information(self, "提示", "没有找到任何 MOV 文件")
@@ -592,6 +605,14 @@ class ImportMixin:
         progress.setMinimumDuration(0)
 
         file_index = 0
+        # 界面刷新节流：最多每 50ms 更新一次进度，避免事件循环占满CPU
+        ui_update_interval = 0.05
+        next_ui_update = 0.0
+        # 循环内使用的函数预先绑定为局部变量
+        monotonic = time.monotonic
+        was_canceled = progress.wasCanceled
+        process_events = QApplication.processEvents
+        copy_file = copy_file_safe
 
         try:
             for ep_id, files in mov_files_by_episode.items():
@@ -602,20 +623,24 @@ class ImportMixin:
                     target_dir = footage_dir / ep_id
                     ensure_dir(target_dir)
 
-                for source_path, filename in files:
-                    if progress.wasCanceled():
+                for source_path, source_stat in files:
+                    if was_canceled():
                         break
 
-                    progress.setValue(file_index)
-                    progress.setLabelText(f"正在复制: {filename}")
-                    QApplication.processEvents()
+                    filename = source_path.name
+
+                    now = monotonic()
+                    if now >= next_ui_update or file_index == total_count - 1:
+                        next_ui_update = now + ui_update_interval
+                        progress.setValue(file_index)
+                        progress.setLabelText(f"正在复制: {filename}")
+                        process_events()
 
                     target_path = target_dir / filename
 
                     # 处理重名文件
                     if target_path.exists():
-                        # 比较文件大小和修改时间
-                        source_stat = source_path.stat()
+                        # 比较文件大小和修改时间（源文件stat沿用扫描时的结果）
                         target_stat = target_path.stat()
 
                         if (source_stat.st_size == target_stat.st_size and
@@ -636,7 +661,7 @@ class ImportMixin:
 
                     # 复制文件
                     try:
-                        if copy_file_safe(source_path, target_path):
+                        if copy_file(source_path, target_path):
                             copied_count += 1
                         else:
                             error_count += 1
@@ -646,7 +671,7 @@ class ImportMixin:
 
                     file_index += 1
 
-                if progress.wasCanceled():
+                if was_canceled():
                     break
 
         finally:
@@ -702,6 +727,39 @@ class ImportMixin:
                 self.cmb_target_episode.addItems(sorted(episodes.keys()))
                 self.cmb_target_episode.setCurrentIndex(-1)
 
+    def _copy_files_to_folder(self, files, target_folder: Path, item_name: str) -> int:
+        """
+        复制文件到目标文件夹，已存在的文件只询问一次（全部覆盖/全部跳过）
+
+        Returns:
+            int: 成功复制的文件数，取消时返回 -1
+        """
+        copy_jobs = [(src, target_folder / src.name) for src in map(Path, files)]
+        collisions = [src.name for src, dst in copy_jobs if dst.exists()]
+
+        if collisions:
+            preview = "\n".join(collisions[:10])
+            if len(collisions) > 10:
+                preview += f"\n... 等共 {len(collisions)} 个"
+            reply = QMessageBox.question(
+                self, "文件已存在",
+                f"以下 {len(collisions)} 个{item_name}已存在：\n{preview}\n\n是否全部覆盖？",
+                QMessageBox.YesToAll | QMessageBox.NoToAll | QMessageBox.Cancel,
+                QMessageBox.NoToAll
+            )
+            if reply == QMessageBox.Cancel:
+                return -1
+            if reply != QMessageBox.YesToAll:
+                collision_set = set(collisions)
+                copy_jobs = [(src, dst) for src, dst in copy_jobs if src.name not in collision_set]
+
+        if not copy_jobs:
+            return 0
+
+        with ThreadPoolExecutor(max_workers=min(4, len(copy_jobs))) as executor:
+            results = executor.map(lambda job: copy_file_safe(*job), copy_jobs)
+            return sum(1 for ok in results if ok)
+
     def _import_to_folder(self, target_folder: Path):
         """导入文件到指定文件夹"""
         files, _ = QFileDialog.getOpenFileNames(
@@ -711,22 +769,7 @@ class ImportMixin:
         if not files:
             return
 
-        imported_count = 0
-        for file_path in files:
-            src = Path(file_path)
-            dst = target_folder / src.name
-
-            if dst.exists():
-                reply = QMessageBox.question(
-                    self, "文件已存在",
-                    f"文件 {src.name} 已存在，是否覆盖？",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if reply != QMessageBox.Yes:
-                    continue
-
-            if copy_file_safe(src, dst):
-                imported_count += 1
+        imported_count = self._copy_files_to_folder(files, target_folder, "文件")
 
         if imported_count > 0:
             QMessageBox.information(
@@ -752,26 +795,11 @@ class ImportMixin:
         if not files:
             return
 
-        imported_count = 0
-        for file_path in files:
-            src = Path(file_path)
-            dst = template_dir / src.name
-
-            if dst.exists():
-                reply = QMessageBox.question(
-                    self, "文件已存在",
-                    f"模板 {src.name} 已存在，是否覆盖？",
-                    QMessageBox.Yes | QMessageBox.No
-                )
-                if reply != QMessageBox.Yes:
-                    continue
-
-            if copy_file_safe(src, dst):
-                imported_count += 1
+        imported_count = self._copy_files_to_folder(files, template_dir, "模板")
 
         if imported_count > 0:
             QMessageBox.information(
                 self, "导入完成",
                 f"成功导入 {imported_count} 个AEP模板"
             )
-            self._refresh_tree()
\ No newline at end of file
+            self._refresh_tree()
@@ -1,11 +1,12 @@
 # -*- coding: utf-8 -*-
 """菜单和工具栏功能混入类"""
 
+from functools import lru_cache, partial
 from typing import TYPE_CHECKING
 from pathlib import Path
 
 from PySide6.QtWidgets import QMessageBox, QMenu, QMenuBar, QStatusBar
-from PySide6.QtGui import QAction
+from PySide6.QtGui import QAction, QKeySequence
 from PySide6.QtCore import Qt
 
 from cx_project_manager.utils.version_info import version_info
@@ -17,6 +18,137 @@ else:
     MixinBase = object
 
 
+# 菜单定义：(文本, 快捷键, 处理方法名)，None 表示分隔符
+_FILE_MENU_SPEC = (
+    ("✨ 新建项目", "Ctrl+N", "new_project"),
+    ("📂 打开项目", "Ctrl+O", "open_project"),
+    None,
+    ("🌐 浏览所有项目...", None, "browse_all_projects"),
+    None,
+    ("⚙️ 设置默认路径...", None, "set_default_path"),
+    None,
+    ("❌ 退出", "Ctrl+Q", "close"),
+)
+
+_TOOLS_MENU_SPEC = (
+    ("🔄 刷新目录树", "F5", "_refresh_tree"),
+    ("🔍 搜索Cut", "Ctrl+F", "_focus_cut_search"),
+    None,
+    ("📑 批量复制AEP模板...", None, "batch_copy_aep_template"),
+    ("✨ 创建兼用卡...", None, "create_reuse_cut"),
+    ("📑 复制MOV到剪辑文件夹", "Ctrl+M", "copy_mov_to_cut_folder"),
+    None,
+    ("📂 在文件管理器中打开", None, "open_in_explorer"),
+)
+
+_OPERATIONS_MENU_SPEC = (
+    ("🔒 锁定项目所有最新版本", None, "lock_all_latest_versions"),
+    ("🔓 解锁项目所有版本", None, "unlock_all_versions"),
+    None,
+    ("❌ 删除项目所有旧版本", None, "delete_all_old_versions"),
+    None,
+    ("📊 版本统计", "Ctrl+T", "show_version_statistics"),
+)
+
+_HELP_MENU_SPEC = (
+    ("📚 使用说明", None, "show_help"),
+    ("ℹ️ 关于", None, "show_about"),
+)
+
+# 首次展开时才填充的菜单
+_LAZY_MENU_SPECS = (
+    ("工具", _TOOLS_MENU_SPEC),
+    ("操作", _OPERATIONS_MENU_SPEC),
+    ("帮助", _HELP_MENU_SPEC),
+)
+
+
+@lru_cache(maxsize=None)
+def _key_sequence(shortcut: str) -> QKeySequence:
+    """解析快捷键字符串，同一快捷键只解析一次"""
+    return QKeySequence(shortcut)
+
+
+# 帮助与关于文本只依赖静态的版本信息，在模块加载时生成一次
+_HELP_TEXT = f"""
+CX Project Manager 使用说明
+========================
+
+版本: {version_info.get("version", "2.2")} {version_info.get("build-version", "")}
+
+## 新增功能
+- **项目注册管理**: 自动记录所有创建的项目信息
+- **项目浏览器**: 浏览和管理所有已注册的项目
+- **目录树双击**: 双击目录树节点直接打开文件夹
+- **右键菜单支持**: 
+  - 项目结构树支持右键导入文件和AEP模板
+  - 文件浏览器支持删除、锁定/解锁版本等操作
+- **中文注释**: 项目结构显示中文说明
+- **版本管理系统**:
+  - 🔒 锁定文件前会显示锁定图标
+  - 支持锁定/解锁单个版本或最新版本
+  - 批量删除旧版本（保护锁定版本）
+  - 项目级别批量操作（操作菜单）
+
+## 项目模式
+- **标准模式**: 支持创建多个Episode（ep01, ep02等）
+- **单集/PV模式**: 根目录下直接创建Cut，支持特殊Episode
+
+## 快捷键
+- Ctrl+N: 新建项目
+- Ctrl+O: 打开项目
+- Ctrl+F: 搜索Cut
+- F5: 刷新目录树
+- Ctrl+Q: 退出
+
+## 文件管理功能
+- **版本锁定**: 右键点击文件可锁定版本，防止被自动删除
+- **批量清理**: 可删除所有非最新版本的文件（保留锁定版本）
+- **导入文件**: 右键项目结构中的文件夹可直接导入文件
+- **项目级操作**: 
+  - 锁定所有最新版本
+  - 解锁所有版本
+  - 删除所有旧版本
+  - 查看版本统计
+
+## 项目注册
+- 创建项目时自动注册到项目管理系统
+- 记录项目名称、Episode数、创建时间、路径等信息
+- 通过"文件 > 浏览所有项目"查看所有已注册项目
+- 支持删除不需要的项目记录（仅删除记录，不删除文件）
+
+作者: {version_info.get("author", "千石まよひ")}
+"""
+
+_HELP_STYLESHEET = """
+    QMessageBox {
+        min-width: 700px;
+    }
+    QLabel {
+        font-family: Consolas, Monaco, monospace;
+        font-size: 12px;
+    }
+"""
+
+_ABOUT_TEXT = f"""CX Project Manager - 动画项目管理工具
+
+版本: {version_info.get("version", "Unknow")} {version_info.get("build-version", "")}
+作者: {version_info.get("author", "千石まよひ")}
+邮箱: {version_info.get("email", "tammcx@gmail.com")}
+GitHub: https://github.com/ChenxingM/CXProjectManager
+
+{version_info.get("description", "动画项目管理工具，专为动画制作流程优化设计。")}
+
+新增功能：
+- 项目注册管理系统
+- 文件版本管理（锁定、批量删除）
+- 右键菜单支持（导入文件、管理版本）
+- 项目结构中文注释
+- 项目级版本批量操作
+
+如有问题或建议，欢迎在GitHub提交Issue。"""
+
+
 class MenuMixin(MixinBase):
     """菜单和工具栏功能混入类"""
 
@@ -33,6 +165,8 @@ class MenuMixin(MixinBase):
 
         def setStatusBar(self, statusbar: 'QStatusBar') -> None: ...
 
+        def addAction(self, action: QAction) -> None: ...
+
         def close(self) -> None: ...
 
         # 来自其他 Mixin 的方法
@@ -46,6 +180,10 @@ class MenuMixin(MixinBase):
 
         def _update_recent_menu(self) -> None: ...
 
+        def _on_recent_menu_about_to_show(self) -> None: ...
+
+        def _open_latest_recent_project(self) -> None: ...
+
         def _refresh_tree(self) -> None: ...
 
         def _focus_cut_search(self) -> None: ...
@@ -67,96 +205,70 @@ class MenuMixin(MixinBase):
     def _setup_menubar(self):
         """設置菜單欄"""
         menubar = self.menuBar()
+        self._shortcut_actions = {}
+        self._built_menus = set()
 
         # 文件菜單
         file_menu = menubar.addMenu("文件")
-
-        actions = [
-            ("✨ 新建项目", "Ctrl+N", self.new_project),
-            ("📂 打开项目", "Ctrl+O", self.open_project),
-            None,  # 分隔符
-            ("🌐 浏览所有项目...", None, self.browse_all_projects),
-            None,
-            ("⚙️ 设置默认路径...", None, self.set_default_path),
-            None,
-            ("❌ 退出", "Ctrl+Q", self.close)
-        ]
-
-        # 添加基本操作
-        for i, action_data in enumerate(actions):
-            if action_data is None:
-                file_menu.addSeparator()
-            else:
-                action = QAction(action_data[0], self)  # type: ignore
-                if action_data[1]:
-                    action.setShortcut(action_data[1])
-                action.triggered.connect(action_data[2])  # type: ignore
-                file_menu.addAction(action)
-
-                # 在"浏览所有项目"后插入最近项目菜單
-                if i == 3:  # 在"浏览所有项目"之后
-                    self.recent_menu = QMenu("🕓 最近项目", self)  # type: ignore
-                    file_menu.insertMenu(action, self.recent_menu)
-                    self._update_recent_menu()  # type: ignore
-
-        # 工具菜單
-        tools_menu = menubar.addMenu("工具")
-
-        tool_actions = [
-            ("🔄 刷新目录树", "F5", self._refresh_tree),
-            ("🔍 搜索Cut", "Ctrl+F", self._focus_cut_search),
-            None,
-            ("📑 批量复制AEP模板...", None, self.batch_copy_aep_template),
-            ("✨ 创建兼用卡...", None, self.create_reuse_cut),
-            ("📑 复制MOV到剪辑文件夹", "Ctrl+M", self.copy_mov_to_cut_folder),
-            None,
-            ("📂 在文件管理器中打开", None, self.open_in_explorer)
-        ]
-
-        for action_data in tool_actions:
-            if action_data is None:
-                tools_menu.addSeparator()
-            else:
-                action = QAction(action_data[0], self)  # type: ignore
-                if action_data[1]:
-                    action.setShortcut(action_data[1])
-                action.triggered.connect(action_data[2])
-                tools_menu.addAction(action)
-
-        # 操作菜单
-        operations_menu = menubar.addMenu("操作")
-
-        version_actions = [
-            ("🔒 锁定项目所有最新版本", None, self.lock_all_latest_versions),
-            ("🔓 解锁项目所有版本", None, self.unlock_all_versions),
-            None,
-            ("❌ 删除项目所有旧版本", None, self.delete_all_old_versions),
-            None,
-            ("📊 版本统计", "Ctrl+T", self.show_version_statistics)
-        ]
-
-        for action_data in version_actions:
-            if action_data is None:
-                operations_menu.addSeparator()
-            else:
-                action = QAction(action_data[0], self)  # type: ignore
-                if action_data[1]:
-                    action.setShortcut(action_data[1])
-                action.triggered.connect(action_data[2])
-                operations_menu.addAction(action)
-
-        # 帮助菜單
-        help_menu = menubar.addMenu("帮助")
-
-        help_actions = [
-            ("📚 使用说明", self.show_help),
-            ("ℹ️ 关于", self.show_about)
-        ]
-
-        for text, handler in help_actions:
-            action = QAction(text, self)  # type: ignore
-            action.triggered.connect(handler)
-            help_menu.addAction(action)
+        file_actions = self._add_menu_actions(file_menu, _FILE_MENU_SPEC)
+
+        # 在"浏览所有项目"处插入最近项目菜單（展开时才构建内容）
+        self.recent_menu = QMenu("🕓 最近项目", self)  # type: ignore
+        file_menu.insertMenu(file_actions["browse_all_projects"], self.recent_menu)
+        self.recent_menu.aboutToShow.connect(self._on_recent_menu_about_to_show, Qt.UniqueConnection)
+
+        # Ctrl+R 打开最近项目：注册在窗口上，最近项目菜单未构建时也可用
+        act_open_latest = QAction(self)  # type: ignore
+        act_open_latest.setShortcut(_key_sequence("Ctrl+R"))
+        act_open_latest.triggered.connect(self._open_latest_recent_project, Qt.UniqueConnection)
+        self.addAction(act_open_latest)
+
+        # 其余菜单在首次展开时才填充；
+        # 带快捷键的动作在启动时创建并注册到窗口，保证菜单展开前快捷键可用
+        for title, spec in _LAZY_MENU_SPECS:
+            menu = menubar.addMenu(title)
+            # partial 无法使用 UniqueConnection，每个菜单只在此处连接一次
+            menu.aboutToShow.connect(partial(self._populate_menu, menu, spec))
+
+            for action_spec in spec:
+                if action_spec is not None and action_spec[1]:
+                    action = self._create_menu_action(action_spec)
+                    self.addAction(action)
+                    self._shortcut_actions[action_spec[2]] = action
+
+        self._help_dialog = None
+
+    def _create_menu_action(self, action_spec: tuple) -> QAction:
+        """根据 (文本, 快捷键, 处理方法名) 创建动作"""
+        text, shortcut, handler_name = action_spec
+        action = QAction(text, self)  # type: ignore
+        if shortcut:
+            action.setShortcut(_key_sequence(shortcut))
+        action.triggered.connect(getattr(self, handler_name), Qt.UniqueConnection)
+        return action
+
+    def _add_menu_actions(self, menu: QMenu, spec: tuple) -> dict:
+        """按菜单定义添加动作，已预先创建的快捷键动作直接复用"""
+        actions = {}
+        for action_spec in spec:
+            if action_spec is None:
+                menu.addSeparator()
+                continue
+
+            handler_name = action_spec[2]
+            action = self._shortcut_actions.get(handler_name)
+            if action is None:
+                action = self._create_menu_action(action_spec)
+            menu.addAction(action)
+            actions[handler_name] = action
+        return actions
+
+    def _populate_menu(self, menu: QMenu, spec: tuple):
+        """首次展开时填充菜单"""
+        if menu in self._built_menus:
+            return
+        self._built_menus.add(menu)
+        self._add_menu_actions(menu, spec)
 
     def _setup_statusbar(self):
         """设置状态栏"""
@@ -169,90 +281,20 @@ class MenuMixin(MixinBase):
             open_in_file_manager(self.project_base)
 
     def show_help(self):
-        """顯示帮助信息"""
-        help_text = f"""
-CX Project Manager 使用说明
-========================
-
-版本: {version_info.get("version", "2.2")} {version_info.get("build-version", "")}
-
-## 新增功能
-- **项目注册管理**: 自动记录所有创建的项目信息
-- **项目浏览器**: 浏览和管理所有已注册的项目
-- **目录树双击**: 双击目录树节点直接打开文件夹
-- **右键菜单支持**: 
-  - 项目结构树支持右键导入文件和AEP模板
-  - 文件浏览器支持删除、锁定/解锁版本等操作
-- **中文注释**: 项目结构显示中文说明
-- **版本管理系统**:
-  - 🔒 锁定文件前会显示锁定图标
-  - 支持锁定/解锁单个版本或最新版本
-  - 批量删除旧版本（保护锁定版本）
-  - 项目级别批量操作（操作菜单）
-
-## 项目模式
-- **标准模式**: 支持创建多个Episode（ep01, ep02等）
-- **单集/PV模式**: 根目录下直接创建Cut，支持特殊Episode
-
-## 快捷键
-- Ctrl+N: 新建项目
-- Ctrl+O: 打开项目
-- Ctrl+F: 搜索Cut
-- F5: 刷新目录树
-- Ctrl+Q: 退出
-
-## 文件管理功能
-- **版本锁定**: 右键点击文件可锁定版本，防止被自动删除
-- **批量清理**: 可删除所有非最新版本的文件（保留锁定版本）
-- **导入文件**: 右键项目结构中的文件夹可直接导入文件
-- **项目级操作**: 
-  - 锁定所有最新版本
-  - 解锁所有版本
-  - 删除所有旧版本
-  - 查看版本统计
-
-## 项目注册
-- 创建项目时自动注册到项目管理系统
-- 记录项目名称、Episode数、创建时间、路径等信息
-- 通过"文件 > 浏览所有项目"查看所有已注册项目
-- 支持删除不需要的项目记录（仅删除记录，不删除文件）
-
-作者: {version_info.get("author", "千石まよひ")}
-"""
-
-        dialog = QMessageBox(self)  # type: ignore
-        dialog.setWindowTitle("使用说明")
-        dialog.setText(help_text)
-        dialog.setTextFormat(Qt.PlainText)  # type: ignore
-        dialog.setStyleSheet("""
-            QMessageBox {
-                min-width: 700px;
-            }
-            QLabel {
-                font-family: Consolas, Monaco, monospace;
-                font-size: 12px;
-            }
-        """)
-        dialog.exec_()
+        """顯示帮助信息（对话框首次打开时创建，之后复用）"""
+        if self._help_dialog is None:
+            dialog = QMessageBox(self)  # type: ignore
+            dialog.setWindowTitle("使用说明")
+            dialog.setTextFormat(Qt.PlainText)  # type: ignore
+            dialog.setText(_HELP_TEXT)
+            dialog.setStyleSheet(_HELP_STYLESHEET)
+            dialog.setModal(False)
+            self._help_dialog = dialog
+
+        self._help_dialog.show()
+        self._help_dialog.raise_()
+        self._help_dialog.activateWindow()
 
     def show_about(self):
         """顯示关于对话框"""
-        about_text = f"""CX Project Manager - 动画项目管理工具
-
-版本: {version_info.get("version", "Unknow")} {version_info.get("build-version", "")}
-作者: {version_info.get("author", "千石まよひ")}
-邮箱: {version_info.get("email", "tammcx@gmail.com")}
-GitHub: https://github.com/ChenxingM/CXProjectManager
-
-{version_info.get("description", "动画项目管理工具，专为动画制作流程优化设计。")}
-
-新增功能：
-- 项目注册管理系统
-- 文件版本管理（锁定、批量删除）
-- 右键菜单支持（导入文件、管理版本）
-- 项目结构中文注释
-- 项目级版本批量操作
-
-如有问题或建议，欢迎在GitHub提交Issue。"""
-
-        QMessageBox.about(self, "关于", about_text)  # type: ignore
+        QMessageBox.about(self, "关于", _ABOUT_TEXT)  # type: ignore
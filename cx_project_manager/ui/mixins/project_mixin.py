@@ -1,15 +1,45 @@
 # -*- coding: utf-8 -*-
 """项目管理功能混入类"""
 
+import time
+from functools import partial
 from pathlib import Path
-from typing import Optional, cast
+from typing import Dict, Optional, Tuple, cast
 
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QMessageBox, QFileDialog
-from PySide6.QtCore import Signal
+from PySide6.QtCore import Qt, Signal, QTimer, QRunnable, QThreadPool
 
 from cx_project_manager.core import ProjectManager, ProjectRegistry
-from cx_project_manager.ui.dialogs import ProjectBrowserDialog
+
+
+# 最近项目路径存在性缓存 {路径: (检查时间, 是否存在)}
+_exists_cache: Dict[str, Tuple[float, bool]] = {}
+_EXISTS_TTL = 5.0
+
+
+def _path_exists_cached(path: str, ttl: float = _EXISTS_TTL) -> bool:
+    """带 TTL 的路径存在性检查，避免反复 stat 网络路径"""
+    now = time.monotonic()
+    cached = _exists_cache.get(path)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    exists = Path(path).exists()
+    _exists_cache[path] = (now, exists)
+    return exists
+
+
+class _RegistryCsvJob(QRunnable):
+    """在线程池中将项目注册表转换为CSV"""
+
+    def __init__(self, registry_dir: Path):
+        super().__init__()
+        self.registry_dir = registry_dir
+
+    def run(self):
+        from ...utils.convert_registry_to_csv import convert_registry_to_csv
+        convert_registry_to_csv(self.registry_dir)
 
 
 class ProjectMixin:
@@ -30,6 +60,9 @@ class ProjectMixin:
     statusbar: any
     recent_menu: any
 
+    # 是否已安排在下一轮事件循环中发出 project_changed
+    _project_changed_pending = False
+
     def new_project(self):
         """新建项目"""
         project_name = self.txt_project_name.text().strip()
@@ -43,13 +76,12 @@ class ProjectMixin:
         # 检查默认路径
         default_path = self.app_settings.value("default_project_path", "")
 
-        if default_path and Path(default_path).exists():
-            base_folder = Path(default_path)
-        else:
-            base_folder = QFileDialog.getExistingDirectory(self, "选择项目创建位置", "")
-            if not base_folder:
+        if not default_path or not Path(default_path).is_dir():
+            default_path = QFileDialog.getExistingDirectory(self, "选择项目创建位置", "")
+            if not default_path:
                 return
-            base_folder = Path(base_folder)
+        # 只构造一次绝对路径，之后的项目路径、注册表任务都复用它
+        base_folder = Path(default_path).absolute()
 
         # 确定项目路径名和显示名
         # 前缀只影响路径，不影响显示名称
@@ -86,15 +118,13 @@ class ProjectMixin:
             self.project_registry.register_project(self.project_config, self.project_base)
 
             # 更新注册表
-            if hasattr(self, 'project_registry'):
-                episodes = self.project_config.get("episodes", {})
-                self.project_config["episode_count"] = len(episodes)
-                self.project_config["episode_list"] = sorted(episodes.keys())
-                from ...utils.convert_registry_to_csv import convert_registry_to_csv
-                convert_registry_to_csv(base_folder)
-
-            self.project_changed.emit()
-            self._add_to_recent(str(self.project_base))
+            episodes = self.project_config.get("episodes", {})
+            self.project_config["episode_count"] = len(episodes)
+            self.project_config["episode_list"] = sorted(episodes.keys())
+            QThreadPool.globalInstance().start(_RegistryCsvJob(base_folder))
+
+            self._schedule_project_changed()
+            self._add_to_recent(str(project_path))
             self.txt_project_name.clear()
 
             # 清空前缀输入框（如果存在）
@@ -108,6 +138,18 @@ class ProjectMixin:
                 f"项目路径: {project_path}"
             )
 
+    def _schedule_project_changed(self):
+        """在下一轮事件循环中发出 project_changed，同一轮内多次调用只发出一次"""
+        if self._project_changed_pending:
+            return
+        self._project_changed_pending = True
+        QTimer.singleShot(0, self._emit_project_changed)
+
+    def _emit_project_changed(self):
+        """发出已安排的 project_changed 信号"""
+        self._project_changed_pending = False
+        self.project_changed.emit()
+
     def open_project(self):
         """打开已有项目"""
         folder = QFileDialog.getExistingDirectory(self, "选择项目文件夹", "")
@@ -116,13 +158,16 @@ class ProjectMixin:
 
     def browse_all_projects(self):
         """浏览所有项目"""
+        from cx_project_manager.ui.dialogs import ProjectBrowserDialog
+
         dialog = ProjectBrowserDialog(self.project_registry, self)
-        dialog.project_selected.connect(self._load_project)
+        dialog.project_selected.connect(self._load_project, Qt.UniqueConnection)
         dialog.exec_()
 
     def _load_project(self, folder: str):
         """加载项目"""
-        project_path = Path(folder)
+        # 只构造一次绝对路径；不使用 resolve()，避免逐级 lstat 以及映射盘被改写为 UNC 路径
+        project_path = Path(folder).absolute()
 
         if self.project_manager.load_project(project_path):
             self.project_base = self.project_manager.project_base
@@ -133,7 +178,7 @@ class ProjectMixin:
             if project_name:
                 self.project_registry.update_access_time(project_name)
 
-            self.project_changed.emit()
+            self._schedule_project_changed()
             self._add_to_recent(str(project_path))
         else:
             QMessageBox.warning(self, "错误", "所选文件夹不是有效的项目（缺少 project_config.json）")
@@ -154,29 +199,72 @@ class ProjectMixin:
             QMessageBox.information(self, "成功", f"默认项目路径已设置为:\n{folder}")
 
     # 最近项目相关方法
+    def _init_recent_projects(self):
+        """读取最近项目列表，并创建延迟写回设置的定时器"""
+        # 以有序字典作为去重队列：越新的项目越靠后，设置中仍按最新在前保存
+        # 只在启动时读取一次，之后 QSettings 仅作为写回目标
+        # type=list 保证单个条目时也返回列表而不是字符串
+        recent_paths = cast(list[str], self.app_settings.value("recent_projects", [], type=list) or [])
+        self._recent_cache: Dict[str, None] = dict.fromkeys(reversed(recent_paths))
+        self._recent_dirty = True
+        self._last_recent_hash = None
+        self._recent_built_at = 0.0
+
+        self._recent_flush_timer = QTimer(self)
+        self._recent_flush_timer.setSingleShot(True)
+        self._recent_flush_timer.setInterval(250)
+        self._recent_flush_timer.timeout.connect(self._flush_recent, Qt.UniqueConnection)
+
+    def _flush_recent(self):
+        """将最近项目列表一次性写回设置"""
+        self._recent_flush_timer.stop()
+        self.app_settings.setValue("recent_projects", list(reversed(self._recent_cache)))
+
+    def _on_recent_menu_about_to_show(self):
+        """最近项目菜单展开时，在列表变化或存在性缓存过期后重建"""
+        # 超过 TTL 后重新检查路径是否存在；结果不变时 _update_recent_menu 会保留现有菜单项
+        now = time.monotonic()
+        if self._recent_dirty or now - self._recent_built_at >= _EXISTS_TTL:
+            self._update_recent_menu()
+            self._recent_dirty = False
+            self._recent_built_at = now
+
     def _update_recent_menu(self):
         """刷新『最近项目』菜单"""
-        self.recent_menu.clear()
+        recent_list = [p for p in reversed(self._recent_cache) if _path_exists_cached(p)][:10]
+
+        # 内容未变化时保留现有菜单项
+        recent_hash = hash(tuple(recent_list))
+        if recent_hash == self._last_recent_hash and self.recent_menu.actions():
+            return
+        self._last_recent_hash = recent_hash
 
-        recent_paths = cast(list[str], self.app_settings.value("recent_projects", []))
-        recent_list = [p for p in recent_paths if Path(p).exists()]
+        self.recent_menu.clear()
 
         if not recent_list:
             action = self.recent_menu.addAction("(无最近项目)")
             action.setEnabled(False)
             return
 
-        for idx, path in enumerate(recent_list[:10]):
-            act = QAction(Path(path).name, self)
-            if idx == 0:
-                act.setShortcut("Ctrl+R")
+        for idx, path in enumerate(recent_list):
+            name = Path(path).name
+            # Ctrl+R 由窗口级动作处理，这里只显示快捷键提示
+            text = f"{name}\tCtrl+R" if idx == 0 else name
+            act = QAction(text, self)
             act.setToolTip(path)
-            act.triggered.connect(lambda _=False, p=path: self.open_recent_project(p))
+            act.triggered.connect(partial(self.open_recent_project, path))
             self.recent_menu.addAction(act)
 
+    def _open_latest_recent_project(self):
+        """打开最近一个仍存在的项目（Ctrl+R）"""
+        for path in reversed(self._recent_cache):
+            if _path_exists_cached(path):
+                self._load_project(path)
+                return
+
     def open_recent_project(self, path: str):
         """打开最近项目"""
-        if Path(path).exists():
+        if _path_exists_cached(path):
             self._load_project(path)
         else:
             QMessageBox.warning(self, "错误", f"项目路径不存在：\n{path}")
@@ -184,21 +272,22 @@ class ProjectMixin:
 
     def _add_to_recent(self, path: str):
         """添加到最近项目"""
-        recent = self.app_settings.value("recent_projects", [])
+        recent = self._recent_cache
+        _exists_cache.pop(path, None)
 
-        if path in recent:
-            recent.remove(path)
-
-        recent.insert(0, path)
-        recent = recent[:20]
+        recent.pop(path, None)
+        recent[path] = None
+        while len(recent) > 20:
+            del recent[next(iter(recent))]
 
-        self.app_settings.setValue("recent_projects", recent)
-        self._update_recent_menu()
+        self._recent_flush_timer.start()
+        self._recent_dirty = True
 
     def _remove_from_recent(self, path: str):
         """从最近项目中移除"""
-        recent = self.app_settings.value("recent_projects", [])
+        recent = self._recent_cache
+        _exists_cache.pop(path, None)
         if path in recent:
-            recent.remove(path)
-            self.app_settings.setValue("recent_projects", recent)
-            self._update_recent_menu()
+            del recent[path]
+            self._recent_flush_timer.start()
+            self._recent_dirty = True
@@ -1,17 +1,228 @@
 # -*- coding: utf-8 -*-
 """版本管理功能混入类"""
 
+import os
 import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, TYPE_CHECKING
+from typing import Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
 
-from PySide6.QtWidgets import QMessageBox, QApplication, QProgressDialog, QMenu
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QMessageBox, QProgressDialog, QMenu, QListWidgetItem
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QAction
 
 from cx_project_manager.utils.models import FileInfo
-from cx_project_manager.utils.utils import get_file_info
-from cx_project_manager.utils.constants import IMAGE_EXTENSIONS
+from cx_project_manager.utils.utils import get_dir_size, get_file_info, get_file_info_from_entry
+from cx_project_manager.utils.constants import IMAGE_EXTENSIONS, VERSION_PATTERN, VFX_DEPTH
+
+
+# 扫描时按后缀（小写）过滤的扩展名集合
+_IMAGE_EXT_SET = frozenset(ext.lower() for ext in IMAGE_EXTENSIONS)
+_RENDER_EXT_SET = frozenset(('.mov', '.mp4', '.png'))
+
+
+def _suffix_of(name: str) -> str:
+    """取文件名的小写后缀（含点）"""
+    idx = name.rfind('.')
+    return name[idx:].lower() if idx > 0 else ""
+
+
+def _base_name_of(stem: str) -> Optional[str]:
+    """取版本号之前的基础名称（优先 _T，其次 _v），没有版本标记时返回 None"""
+    head, sep, _ = stem.rpartition('_T')
+    if not sep:
+        head, sep, _ = stem.rpartition('_v')
+    return head if sep else None
+
+
+def _split_latest(files: List[FileInfo]) -> Tuple[FileInfo, List[FileInfo]]:
+    """一次遍历分出最新版本和旧版本；与最新版本号相同的其他文件不算旧版本"""
+    it = iter(files)
+    latest = next(it)
+    same = []
+    old = []
+    for f in it:
+        if f.version > latest.version:
+            old.append(latest)
+            old.extend(same)
+            same.clear()
+            latest = f
+        elif f.version == latest.version:
+            same.append(f)
+        else:
+            old.append(f)
+    return latest, old
+
+
+def _lock_path_of(path) -> str:
+    """锁定标记文件路径（同目录下的 .<文件名>.lock），直接拼接字符串而不构造 Path"""
+    head, tail = os.path.split(os.fspath(path))
+    return os.path.join(head, f".{tail}.lock")
+
+
+def _create_lock(lock_path: str):
+    """创建空的锁定标记文件，不必像 Path.touch 那样再更新时间戳"""
+    os.close(os.open(lock_path, os.O_WRONLY | os.O_CREAT, 0o644))
+
+
+def _remove_lock(lock_path: str):
+    """删除锁定标记文件，不存在时忽略"""
+    try:
+        os.unlink(lock_path)
+    except FileNotFoundError:
+        pass
+
+
+def _dirs_unchanged(dir_mtimes: Dict[str, int]) -> bool:
+    """记录过的目录修改时间均未变化（每个目录一次 stat）"""
+    for path, mtime in dir_mtimes.items():
+        try:
+            if os.stat(path).st_mtime_ns != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _scandir(path: str, mtimes: Optional[Dict[str, int]] = None) -> List[os.DirEntry]:
+    """列出目录条目，目录不存在或无法访问时返回空列表；传入 mtimes 时同时记录目录的修改时间"""
+    try:
+        if mtimes is not None:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _is_aep_entry(entry: os.DirEntry) -> bool:
+    """是否为AEP 文件"""
+    return _suffix_of(entry.name) == ".aep" and entry.is_file()
+
+
+def _is_image_entry(entry: os.DirEntry) -> bool:
+    """是否为BG 图片文件"""
+    return _suffix_of(entry.name) in _IMAGE_EXT_SET and entry.is_file()
+
+
+def _is_cell_entry(entry: os.DirEntry) -> bool:
+    """是否为Cell 文件夹"""
+    return entry.is_dir()
+
+
+def _is_render_entry(entry: os.DirEntry) -> bool:
+    """是否为渲染输出文件"""
+    return _suffix_of(entry.name) in _RENDER_EXT_SET and entry.is_file()
+
+
+@dataclass
+class _VersionIndex:
+    """一次扫描得到的项目版本索引，供统计、批量锁定和批量删除共用"""
+    # (类别, 所在目录, 分组名) -> 同一文件的各个版本
+    groups: Dict[Tuple[str, str, str], List[FileInfo]] = field(default_factory=dict)
+    # 没有版本号的条目 (类别, 文件信息)，只参与数量与大小统计
+    unversioned: List[Tuple[str, FileInfo]] = field(default_factory=list)
+    # 目录 -> 该目录中已存在的锁定文件名
+    lock_names: Dict[str, Set[str]] = field(default_factory=dict)
+    # 是否递归统计文件夹大小（批量锁定不需要，省去遍历每个Cell帧文件夹）
+    with_sizes: bool = False
+    # 文件夹路径 -> 文件夹总大小
+    sizes: Dict[Path, int] = field(default_factory=dict)
+    # 扫描过的目录 -> 扫描时的修改时间，用于判断统计结果是否仍然有效
+    dir_mtimes: Dict[str, int] = field(default_factory=dict)
+
+    def is_locked(self, directory: str, file_info: FileInfo) -> bool:
+        """判断文件是否已锁定（集合查找，无需访问磁盘）"""
+        return f".{file_info.name}.lock" in self.lock_names.get(directory, ())
+
+    def size_of(self, file_info: FileInfo) -> int:
+        """文件取自身大小，文件夹取递归总大小"""
+        return self.sizes.get(file_info.path, file_info.size)
+
+
+def _delete_version(file_info: FileInfo):
+    """删除一个版本（文件夹整个删除）"""
+    if file_info.is_folder:
+        shutil.rmtree(file_info.path)
+    else:
+        os.unlink(file_info.path)
+
+
+class _VersionBatchSignals(QObject):
+    """批量版本操作的进度信号"""
+    progress = Signal(int, str)  # (已处理数量, 当前文件名)
+    finished = Signal(int, int)  # (成功数量, 失败数量)
+
+
+class _VersionBatchWorker(QRunnable):
+    """在线程池中批量锁定或删除版本文件"""
+
+    # 两次进度信号之间的最短间隔（秒），界面刷新频率与文件数量无关
+    PROGRESS_PERIOD = 0.1
+    # 并行执行文件操作的线程数
+    IO_WORKERS = 8
+
+    def __init__(self, action: str, targets: List[FileInfo]):
+        super().__init__()
+        self.action = action
+        self.targets = targets
+        self.signals = _VersionBatchSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """请求停止（正在处理的文件完成后生效）"""
+        self._cancelled.set()
+
+    @staticmethod
+    def _lock(file_info: FileInfo):
+        _create_lock(_lock_path_of(file_info.path))
+
+    def run(self):
+        done = 0
+        failed = 0
+        period = self.PROGRESS_PERIOD
+        last_emit = -period
+        progress = self.signals.progress
+        operation = self._lock if self.action == "lock" else _delete_version
+
+        def tally(future: Future):
+            nonlocal done, failed
+            try:
+                future.result()
+                done += 1
+            except Exception as e:
+                print(f"处理失败 {futures[future].name}: {e}")
+                failed += 1
+
+        # 无论是否出错都要发出 finished，否则进度对话框会一直停留
+        try:
+            # 删除/创建文件主要在等待文件系统，多个请求并行可以重叠各自的系统调用延迟
+            with ThreadPoolExecutor(max_workers=self.IO_WORKERS) as pool:
+                futures = {pool.submit(operation, file_info): file_info for file_info in self.targets}
+                pending = set(futures)
+
+                for i, future in enumerate(as_completed(futures)):
+                    pending.discard(future)
+                    now = time.monotonic()
+                    if now - last_emit >= period:
+                        last_emit = now
+                        progress.emit(i, futures[future].name)
+                    tally(future)
+
+                    if self._cancelled.is_set():
+                        # 取消尚未开始的任务，已开始的等待完成并计入结果
+                        pool.shutdown(wait=True, cancel_futures=True)
+                        for rest in pending:
+                            if not rest.cancelled():
+                                tally(rest)
+                        break
+        except Exception as e:
+            print(f"批量处理失败: {e}")
+        finally:
+            self.signals.finished.emit(done, failed)
 
 
 class VersionMixin:
@@ -24,6 +235,14 @@ class VersionMixin:
     current_episode_id: any
     file_lists: dict
 
+    # 复用的文件右键菜单及其动作
+    _file_menu: Optional[QMenu] = None
+    _file_menu_actions: Dict[str, QAction]
+    _file_menu_context: Optional[tuple] = None
+
+    # 最近一次版本统计 (项目路径, 扫描过的目录修改时间, 统计结果)
+    _stats_cache: Optional[Tuple[Path, Dict[str, int], Dict[str, int]]] = None
+
     def _show_file_context_menu(self, position, file_type: str):
         """显示文件列表的右键菜单"""
         list_widget = self.file_lists[file_type]
@@ -43,87 +262,129 @@ class VersionMixin:
             if not file_path.exists():
                 return
             file_info = get_file_info(file_path)
-            # 检查是否有锁定文件
-            lock_file = file_path.parent / f".{file_path.name}.lock"
-            if lock_file.exists():
-                file_info.is_locked = True
         elif isinstance(user_data, FileInfo):
             # 如果已经是FileInfo对象
             file_info = user_data
         else:
             return
 
-        menu = QMenu(self)
-
-        # 打开文件/文件夹
-        act_open = QAction("🚀 打开", self)
-        act_open.triggered.connect(lambda: self._on_file_item_double_clicked(item))
-        menu.addAction(act_open)
-
-        # 在文件管理器中显示
-        act_show = QAction("📂 在文件管理器中显示", self)
-        act_show.triggered.connect(lambda: self._open_in_manager(file_info.path.parent))
-        menu.addAction(act_show)
-
-        menu.addSeparator()
-
-        # 删除操作
-        act_delete = QAction("❌ 删除", self)
-        act_delete.triggered.connect(lambda: self._delete_file(file_info, file_type))
-        menu.addAction(act_delete)
+        menu = self._get_file_context_menu()
+        actions = self._file_menu_actions
 
         # 检查文件是否已锁定
-        actual_filename = file_info.name.replace("🔒 ", "") if file_info.name.startswith("🔒 ") else file_info.name
-        lock_file = file_info.path.parent / f".{actual_filename}.lock"
-        is_locked = lock_file.exists()
+        is_locked = os.path.exists(_lock_path_of(file_info.path))
+        file_info.is_locked = is_locked
 
-        # 如果有版本号，添加版本相关操作
-        if file_info.version is not None:
-            menu.addSeparator()
+        all_versions = [file_info]
+        show_latest = False
+        lock_latest = False
+        show_delete_old = False
 
+        # 如果有版本号，显示版本相关操作
+        has_version = file_info.version is not None
+        if has_version:
             # 锁定/解锁当前版本
             if is_locked:
-                act_unlock = QAction(f"🔓 解锁版本 v{file_info.version}", self)
-                act_unlock.triggered.connect(lambda: self._unlock_version(file_info, file_type))
-                menu.addAction(act_unlock)
+                actions["lock"].setText(f"🔓 解锁版本 v{file_info.version}")
             else:
-                act_lock = QAction(f"🔒 锁定版本 v{file_info.version}", self)
-                act_lock.triggered.connect(lambda: self._lock_version(file_info, file_type))
-                menu.addAction(act_lock)
+                actions["lock"].setText(f"🔒 锁定版本 v{file_info.version}")
 
             # 获取所有版本
             all_versions = self._get_all_versions(file_info, file_type)
             if len(all_versions) > 1:
                 # 锁定最新版本
-                latest_version = max(v.version for v in all_versions)
-                latest_file = next(v for v in all_versions if v.version == latest_version)
-                latest_filename = latest_file.name.replace("🔒 ", "") if latest_file.name.startswith(
-                    "🔒 ") else latest_file.name
-                latest_lock_file = latest_file.path.parent / f".{latest_filename}.lock"
-
-                if not latest_lock_file.exists():
-                    act_lock_latest = QAction(f"🔒 锁定最新版本 v{latest_version}", self)
-                    act_lock_latest.triggered.connect(
-                        lambda: self._lock_latest_version(file_info, file_type, all_versions)
-                    )
-                    menu.addAction(act_lock_latest)
+                latest_file = _split_latest(all_versions)[0]
+                latest_version = latest_file.version
+                if not latest_file.is_locked:
+                    actions["latest"].setText(f"🔒 锁定最新版本 v{latest_version}")
+                    show_latest = True
+                    lock_latest = True
                 elif latest_file.path != file_info.path:
-                    act_unlock_latest = QAction(f"🔓 解锁最新版本 v{latest_version}", self)
-                    act_unlock_latest.triggered.connect(
-                        lambda: self._unlock_latest_version(file_info, file_type, all_versions)
-                    )
-                    menu.addAction(act_unlock_latest)
+                    actions["latest"].setText(f"🔓 解锁最新版本 v{latest_version}")
+                    show_latest = True
 
                 # 删除所有非最新版本
-                act_delete_old = QAction("❌ 删除所有非最新版本", self)
-                act_delete_old.triggered.connect(
-                    lambda: self._delete_old_versions(file_info, file_type, all_versions)
-                )
-                menu.addAction(act_delete_old)
+                show_delete_old = True
+
+        actions["version_separator"].setVisible(has_version)
+        actions["lock"].setVisible(has_version)
+        actions["latest"].setVisible(show_latest)
+        actions["delete_old"].setVisible(show_delete_old)
+
+        # 菜单动作执行时读取的上下文，菜单关闭后释放
+        self._file_menu_context = (item, file_info, file_type, all_versions, is_locked, lock_latest)
+        try:
+            menu.exec_(list_widget.mapToGlobal(position))
+        finally:
+            self._file_menu_context = None
+
+    def _get_file_context_menu(self) -> QMenu:
+        """文件列表右键菜单只创建一次，之后每次显示时更新文字和可见性"""
+        if self._file_menu is not None:
+            return self._file_menu
+
+        menu = QMenu(self)
+        actions = {}
+
+        # 打开文件/文件夹
+        actions["open"] = menu.addAction("🚀 打开")
+        actions["open"].triggered.connect(self._on_file_menu_open)
+
+        # 在文件管理器中显示
+        actions["show"] = menu.addAction("📂 在文件管理器中显示")
+        actions["show"].triggered.connect(self._on_file_menu_show)
+
+        menu.addSeparator()
+
+        # 删除操作
+        actions["delete"] = menu.addAction("❌ 删除")
+        actions["delete"].triggered.connect(self._on_file_menu_delete)
+
+        # 版本相关操作（文字在显示时设置）
+        actions["version_separator"] = menu.addSeparator()
+        actions["lock"] = menu.addAction("")
+        actions["lock"].triggered.connect(self._on_file_menu_lock)
+        actions["latest"] = menu.addAction("")
+        actions["latest"].triggered.connect(self._on_file_menu_latest)
+        actions["delete_old"] = menu.addAction("❌ 删除所有非最新版本")
+        actions["delete_old"].triggered.connect(self._on_file_menu_delete_old)
+
+        self._file_menu = menu
+        self._file_menu_actions = actions
+        return menu
+
+    def _on_file_menu_open(self):
+        item = self._file_menu_context[0]
+        self._on_file_item_double_clicked(item)
+
+    def _on_file_menu_show(self):
+        file_info = self._file_menu_context[1]
+        self._open_in_manager(file_info.path.parent)
+
+    def _on_file_menu_delete(self):
+        item, file_info, file_type = self._file_menu_context[:3]
+        self._delete_file(file_info, file_type, item)
+
+    def _on_file_menu_lock(self):
+        item, file_info, file_type, _, is_locked, _ = self._file_menu_context
+        if is_locked:
+            self._unlock_version(file_info, file_type, item)
+        else:
+            self._lock_version(file_info, file_type, item)
+
+    def _on_file_menu_latest(self):
+        _, file_info, file_type, all_versions, _, lock_latest = self._file_menu_context
+        if lock_latest:
+            self._lock_latest_version(file_info, file_type, all_versions)
+        else:
+            self._unlock_latest_version(file_info, file_type, all_versions)
 
-        menu.exec_(list_widget.mapToGlobal(position))
+    def _on_file_menu_delete_old(self):
+        _, file_info, file_type, all_versions = self._file_menu_context[:4]
+        self._delete_old_versions(file_info, file_type, all_versions)
 
-    def _delete_file(self, file_info: FileInfo, file_type: str):
+    def _delete_file(self, file_info: FileInfo, file_type: str,
+                     item: Optional[QListWidgetItem] = None):
         """删除文件"""
         # 检查是否有锁定
         if file_info.is_locked:
@@ -133,8 +394,7 @@ class VersionMixin:
             )
             return
 
-        # 获取实际文件名（去掉锁定图标）
-        actual_name = file_info.name.replace("🔒 ", "") if file_info.name.startswith("🔒 ") else file_info.name
+        actual_name = file_info.name
 
         msg = f"确定要删除 {actual_name} 吗？\n此操作不可恢复！"
         reply = QMessageBox.warning(
@@ -145,6 +405,7 @@ class VersionMixin:
         if reply != QMessageBox.Yes:
             return
 
+        self._invalidate_version_stats()
         try:
             if file_info.is_folder:
                 shutil.rmtree(file_info.path)
@@ -152,110 +413,142 @@ class VersionMixin:
                 file_info.path.unlink()
 
             # 如果有锁定文件，也删除它
-            lock_file = file_info.path.parent / f".{actual_name}.lock"
-            if lock_file.exists():
-                lock_file.unlink()
+            _remove_lock(_lock_path_of(file_info.path))
 
             QMessageBox.information(self, "成功", f"已删除 {actual_name}")
-            # 刷新文件列表
-            self._load_cut_files(self.current_cut_id, self.current_episode_id)
+            # 只移除对应的列表项
+            self._remove_file_item(file_type, file_info, item)
         except Exception as e:
             QMessageBox.critical(self, "错误", f"删除失败: {str(e)}")
 
-    def _lock_version(self, file_info: FileInfo, file_type: str):
+    def _lock_version(self, file_info: FileInfo, file_type: str,
+                      item: Optional[QListWidgetItem] = None):
         """锁定版本（添加.lock标记）"""
-        actual_filename = file_info.name.replace("🔒 ", "") if file_info.name.startswith("🔒 ") else file_info.name
-        lock_file = file_info.path.parent / f".{actual_filename}.lock"
+        actual_filename = file_info.name
 
+        self._invalidate_version_stats()
         try:
-            lock_file.touch()
+            _create_lock(_lock_path_of(file_info.path))
             QMessageBox.information(
                 self, "成功",
                 f"已锁定 {actual_filename}\n锁定后此版本将不会被自动删除"
             )
-            # 刷新文件列表
-            self._load_cut_files(self.current_cut_id, self.current_episode_id)
+            # 只更新对应列表项的锁定状态
+            self._set_file_item_locked(file_type, file_info, True, item)
         except Exception as e:
             QMessageBox.critical(self, "错误", f"锁定失败: {str(e)}")
 
-    def _unlock_version(self, file_info: FileInfo, file_type: str):
+    def _unlock_version(self, file_info: FileInfo, file_type: str,
+                        item: Optional[QListWidgetItem] = None):
         """解锁版本（删除.lock标记）"""
-        actual_filename = file_info.name.replace("🔒 ", "") if file_info.name.startswith("🔒 ") else file_info.name
-        lock_file = file_info.path.parent / f".{actual_filename}.lock"
+        actual_filename = file_info.name
 
+        self._invalidate_version_stats()
         try:
-            if lock_file.exists():
-                lock_file.unlink()
+            _remove_lock(_lock_path_of(file_info.path))
             QMessageBox.information(
                 self, "成功",
                 f"已解锁 {actual_filename}"
             )
-            # 刷新文件列表
-            self._load_cut_files(self.current_cut_id, self.current_episode_id)
+            # 只更新对应列表项的锁定状态
+            self._set_file_item_locked(file_type, file_info, False, item)
         except Exception as e:
             QMessageBox.critical(self, "错误", f"解锁失败: {str(e)}")
 
+    def _find_file_item(self, file_type: str, path: Path) -> Optional[QListWidgetItem]:
+        """按路径在文件列表中查找列表项"""
+        list_widget = self.file_lists[file_type]
+        target = str(path)
+        for row in range(list_widget.count()):
+            item = list_widget.item(row)
+            if item.data(Qt.UserRole) == target:
+                return item
+        return None
+
+    def _set_file_item_locked(self, file_type: str, file_info: FileInfo, is_locked: bool,
+                              item: Optional[QListWidgetItem] = None):
+        """单个文件锁定状态变化后就地更新列表项，不重新扫描目录"""
+        file_info.is_locked = is_locked
+        if item is None:
+            item = self._find_file_item(file_type, file_info.path)
+        if item is not None:
+            self._update_item_locked(item, is_locked)
+
+    @staticmethod
+    def _update_item_locked(item: QListWidgetItem, is_locked: bool):
+        """更新列表项的锁定状态并重绘（锁定图标由委托根据 is_locked 绘制）"""
+        item_info = item.data(Qt.UserRole + 1)
+        if item_info is None:
+            return
+        item_info.is_locked = is_locked
+        list_widget = item.listWidget()
+        if list_widget is not None:
+            list_widget.viewport().update(list_widget.visualItemRect(item))
+
+    def _remove_file_item(self, file_type: str, file_info: FileInfo,
+                          item: Optional[QListWidgetItem] = None):
+        """单个文件删除后移除对应列表项，列表变空时重新加载以显示占位项"""
+        list_widget = self.file_lists[file_type]
+        if item is None:
+            item = self._find_file_item(file_type, file_info.path)
+        if item is not None:
+            list_widget.takeItem(list_widget.row(item))
+
+        if list_widget.count() == 0:
+            self._load_cut_files(self.current_cut_id, self.current_episode_id)
+        else:
+            self._update_file_tab_titles()
+
     def _lock_latest_version(self, file_info: FileInfo, file_type: str, all_versions: List[FileInfo]):
         """锁定最新版本"""
-        latest_file = max(all_versions, key=lambda f: f.version)
+        latest_file = _split_latest(all_versions)[0]
         self._lock_version(latest_file, file_type)
 
     def _unlock_latest_version(self, file_info: FileInfo, file_type: str, all_versions: List[FileInfo]):
         """解锁最新版本"""
-        latest_file = max(all_versions, key=lambda f: f.version)
+        latest_file = _split_latest(all_versions)[0]
         self._unlock_version(latest_file, file_type)
 
     def _get_all_versions(self, file_info: FileInfo, file_type: str) -> List[FileInfo]:
         """获取同一文件的所有版本"""
         parent_dir = file_info.path.parent
 
-        # 去掉锁定图标获取实际文件名
-        actual_name = file_info.name.replace("🔒 ", "") if file_info.name.startswith("🔒 ") else file_info.name
-
         # 获取基础名称（去掉版本号部分）
-        if '_T' in actual_name:
-            base_name = actual_name[:actual_name.rfind('_T')]
-        elif '_v' in actual_name:
-            base_name = actual_name[:actual_name.rfind('_v')]
-        else:
+        base_name = _base_name_of(file_info.name)
+        if base_name is None:
             # 如果没有版本号，返回仅包含自身的列表
             return [file_info]
 
-        all_versions = []
-
+        # 一次 scandir 同时得到候选版本和已有的锁定文件
+        entries = _scandir(os.fspath(parent_dir))
         if file_type == "cell":
             # Cell文件夹
-            for item in parent_dir.iterdir():
-                if item.is_dir() and item.name.startswith(base_name):
-                    info = get_file_info(item)
-                    if info.version is not None:
-                        # 检查是否有锁定文件
-                        lock_file = item.parent / f".{item.name}.lock"
-                        if lock_file.exists():
-                            info.is_locked = True
-                            info.name = f"🔒 {info.name}"
-                        all_versions.append(info)
+            matches = [e for e in entries if e.name.startswith(base_name) and e.is_dir()]
         else:
             # 其他文件
-            pattern = f"{base_name}_*"
-            for item in parent_dir.glob(pattern):
-                if item.is_file():
-                    info = get_file_info(item)
-                    if info.version is not None:
-                        # 检查是否有锁定文件
-                        lock_file = item.parent / f".{item.name}.lock"
-                        if lock_file.exists():
-                            info.is_locked = True
-                            info.name = f"🔒 {info.name}"
-                        all_versions.append(info)
+            prefix = f"{base_name}_"
+            matches = [e for e in entries if e.name.startswith(prefix) and e.is_file()]
+
+        # 只有自身一个版本时无需再解析
+        if len(matches) <= 1:
+            return [file_info]
+
+        lock_names = {e.name for e in entries if e.name.startswith(".") and e.name.endswith(".lock")}
+        all_versions = []
+        for entry in matches:
+            info = get_file_info_from_entry(entry)
+            if info.version is not None:
+                # 检查是否有锁定文件
+                if f".{entry.name}.lock" in lock_names:
+                    info.is_locked = True
+                all_versions.append(info)
 
         return all_versions if all_versions else [file_info]
 
     def _delete_old_versions(self, file_info: FileInfo, file_type: str, all_versions: List[FileInfo]):
         """删除所有非最新版本"""
-        # 找出最新版本
-        latest_version = max(v.version for v in all_versions)
-        old_versions = [v for v in all_versions if v.version != latest_version]
+        # 一次遍历找出最新版本之外的旧版本
+        old_versions = _split_latest(all_versions)[1]
 
         if not old_versions:
             QMessageBox.information(self, "提示", "没有旧版本需要删除")
@@ -266,10 +559,7 @@ class VersionMixin:
         deletable_versions = []
 
         for v in old_versions:
-            # 获取实际文件名（去掉锁定图标）
-            actual_name = v.name.replace("🔒 ", "") if v.name.startswith("🔒 ") else v.name
-            lock_file = v.path.parent / f".{actual_name}.lock"
-            if lock_file.exists():
+            if v.is_locked:
                 locked_versions.append(v)
             else:
                 deletable_versions.append(v)
@@ -300,19 +590,20 @@ class VersionMixin:
             return
 
         # 执行删除
+        self._invalidate_version_stats()
         deleted_count = 0
         failed_count = 0
 
-        for v in deletable_versions:
-            try:
-                if v.is_folder:
-                    shutil.rmtree(v.path)
-                else:
-                    v.path.unlink()
-                deleted_count += 1
-            except Exception as e:
-                print(f"删除失败 {v.name}: {e}")
-                failed_count += 1
+        # 各版本互不依赖，并行删除以重叠文件系统的等待时间
+        with ThreadPoolExecutor(max_workers=_VersionBatchWorker.IO_WORKERS) as pool:
+            futures = {pool.submit(_delete_version, v): v for v in deletable_versions}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    deleted_count += 1
+                except Exception as e:
+                    print(f"删除失败 {futures[future].name}: {e}")
+                    failed_count += 1
 
         # 显示结果
         result_msg = f"删除完成:\n✅ 成功删除: {deleted_count} 个版本"
@@ -342,139 +633,17 @@ class VersionMixin:
         # if reply != QMessageBox.Yes:
         #     return
 
-        locked_count = 0
-        error_count = 0
-
-        # 遍历所有VFX目录
-        for vfx_dir in self.project_base.rglob("01_vfx"):
-            # 检查AEP文件
-            aep_files = list(vfx_dir.glob("*/*.aep"))
-            aep_by_cut = {}
-            for aep in aep_files:
-                cut_dir = aep.parent.name
-                if cut_dir not in aep_by_cut:
-                    aep_by_cut[cut_dir] = []
-                file_info = get_file_info(aep)
-                if file_info.version is not None:
-                    aep_by_cut[cut_dir].append(file_info)
-
-            # 锁定每个cut的最新版本
-            for cut, files in aep_by_cut.items():
-                if files:
-                    latest = max(files, key=lambda f: f.version)
-                    lock_file = latest.path.parent / f".{latest.path.name}.lock"
-                    try:
-                        if not lock_file.exists():
-                            lock_file.touch()
-                            locked_count += 1
-                    except:
-                        error_count += 1
-
-            # 检查BG文件
-            for bg_dir in vfx_dir.glob("*/bg"):
-                bg_files = []
-                for ext in IMAGE_EXTENSIONS:
-                    bg_files.extend(bg_dir.glob(f"*{ext}"))
-
-                bg_by_base = {}
-                for bg in bg_files:
-                    file_info = get_file_info(bg)
-                    if file_info.version is not None:
-                        base_name = bg.stem[:bg.stem.rfind('_T')] if '_T' in bg.stem else bg.stem
-                        if base_name not in bg_by_base:
-                            bg_by_base[base_name] = []
-                        bg_by_base[base_name].append(file_info)
-
-                for base, files in bg_by_base.items():
-                    if files:
-                        latest = max(files, key=lambda f: f.version)
-                        lock_file = latest.path.parent / f".{latest.path.name}.lock"
-                        try:
-                            if not lock_file.exists():
-                                lock_file.touch()
-                                locked_count += 1
-                        except:
-                            error_count += 1
-
-            # 检查Cell文件夹
-            for cell_dir in vfx_dir.glob("*/cell"):
-                cell_folders = [f for f in cell_dir.iterdir() if f.is_dir()]
-                cell_by_base = {}
-
-                for folder in cell_folders:
-                    file_info = get_file_info(folder)
-                    if file_info.version is not None:
-                        base_name = folder.name[:folder.name.rfind('_T')] if '_T' in folder.name else folder.name
-                        if base_name not in cell_by_base:
-                            cell_by_base[base_name] = []
-                        cell_by_base[base_name].append(file_info)
-
-                for base, folders in cell_by_base.items():
-                    if folders:
-                        latest = max(folders, key=lambda f: f.version)
-                        lock_file = latest.path.parent / f".{latest.path.name}.lock"
-                        try:
-                            if not lock_file.exists():
-                                lock_file.touch()
-                                locked_count += 1
-                        except:
-                            error_count += 1
-
-        # 处理06_render目录
-        for render_dir in self.project_base.rglob("06_render"):
-            # 定义需要处理的文件扩展名
-            render_extensions = ['.mov', '.mp4', '.png']
-
-            # 遍历所有子目录
-            for subdir in render_dir.rglob("*"):
-                if subdir.is_dir():
-                    # 收集该目录下的所有渲染文件
-                    render_files = []
-                    for ext in render_extensions:
-                        render_files.extend(subdir.glob(f"*{ext}"))
-
-                    # 按基础名称分组
-                    files_by_base = {}
-                    for file in render_files:
-                        file_info = get_file_info(file)
-                        if file_info.version is not None:
-                            # 获取基础名称
-                            if '_T' in file.stem:
-                                base_name = file.stem[:file.stem.rfind('_T')]
-                            elif '_v' in file.stem:
-                                base_name = file.stem[:file.stem.rfind('_v')]
-                            else:
-                                continue
-
-                            # 创建分组key（包含扩展名以区分不同类型的文件）
-                            group_key = f"{base_name}{file.suffix}"
-
-                            if group_key not in files_by_base:
-                                files_by_base[group_key] = []
-                            files_by_base[group_key].append(file_info)
-
-                    # 锁定每组的最新版本
-                    for group_key, files in files_by_base.items():
-                        if files:
-                            latest = max(files, key=lambda f: f.version)
-                            lock_file = latest.path.parent / f".{latest.path.name}.lock"
-                            try:
-                                if not lock_file.exists():
-                                    lock_file.touch()
-                                    locked_count += 1
-                            except:
-                                error_count += 1
+        # 一次扫描得到所有版本分组（包括06_render）及已有的锁定文件
+        index = self._build_version_index(include_render=True)
 
-        # 显示结果
-        msg = f"锁定完成:\n✅ 成功锁定: {locked_count} 个最新版本"
-        if error_count > 0:
-            msg += f"\n❌ 锁定失败: {error_count} 个文件"
-
-        QMessageBox.information(self, "完成", msg)
+        # 每组的最新版本中尚未锁定的部分
+        targets = []
+        for (kind, directory, group_name), files in index.groups.items():
+            latest = _split_latest(files)[0]
+            if not index.is_locked(directory, latest):
+                targets.append(latest)
 
-        # 刷新当前视图
-        if self.current_cut_id:
-            self._load_cut_files(self.current_cut_id, self.current_episode_id)
+        self._start_version_batch("lock", targets, "正在锁定最新版本...")
 
     def unlock_all_versions(self):
         """解锁项目中所有版本"""
@@ -491,15 +660,22 @@ class VersionMixin:
         # if reply != QMessageBox.Yes:
         #     return
 
+        self._invalidate_version_stats()
         unlocked_count = 0
 
-        # 查找所有锁定文件
-        for lock_file in self.project_base.rglob(".*.lock"):
-            try:
-                lock_file.unlink()
-                unlocked_count += 1
-            except:
-                pass
+        # 用 os.scandir 遍历整个项目，直接删除找到的锁定文件
+        pending = [os.fspath(self.project_base)]
+        while pending:
+            for entry in _scandir(pending.pop()):
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif name.startswith(".") and name.endswith(".lock"):
+                    try:
+                        os.unlink(entry.path)
+                        unlocked_count += 1
+                    except OSError:
+                        pass
 
         QMessageBox.information(
             self, "完成",
@@ -516,8 +692,15 @@ class VersionMixin:
             QMessageBox.warning(self, "错误", "请先打开或创建项目")
             return
 
-        # 先统计
-        stats = self._get_version_statistics()
+        # 先统计（统计与删除共用同一次扫描的结果）
+        index = self._build_version_index(with_sizes=True)
+
+        # 每组都只有一个版本时（常见于整理过的项目）无需再统计
+        if not any(len(files) > 1 for files in index.groups.values()):
+            QMessageBox.information(self, "提示", "项目中没有旧版本需要删除")
+            return
+
+        stats = self._get_version_statistics(index)
 
         if stats["old_versions"] == 0:
             QMessageBox.information(self, "提示", "项目中没有旧版本需要删除")
@@ -540,69 +723,63 @@ class VersionMixin:
         if reply != QMessageBox.Yes:
             return
 
-        # 执行删除
-        deleted_count = 0
-        failed_count = 0
+        self._start_version_batch("delete", self._collect_old_versions(index), "正在删除旧版本文件...")
+
+    @staticmethod
+    def _collect_old_versions(index: _VersionIndex) -> List[FileInfo]:
+        """收集可删除的旧版本（未锁定且不是最新版本），不涉及任何界面操作"""
+        targets = []
+        for (kind, directory, group_name), files in index.groups.items():
+            if len(files) < 2:
+                continue
+            targets.extend(
+                f for f in _split_latest(files)[1]
+                if not index.is_locked(directory, f)
+            )
+        return targets
 
-        # 创建进度对话框
-        progress = QProgressDialog(
-            "正在删除旧版本文件...", "取消",
-            0, stats['deletable_old'], self
-        )
+    def _start_version_batch(self, action: str, targets: List[FileInfo], label: str):
+        """在线程池中执行批量锁定/删除，界面通过信号更新进度"""
+        self._invalidate_version_stats()
+        progress = QProgressDialog(label, "取消", 0, len(targets), self)
         progress.setWindowModality(Qt.WindowModal)
         progress.setMinimumDuration(0)
 
-        file_index = 0
-
-        try:
-            # 遍历所有VFX目录
-            for vfx_dir in self.project_base.rglob("01_vfx"):
-                if progress.wasCanceled():
-                    break
-
-                # 处理AEP文件
-                result = self._delete_old_versions_in_dir(
-                    vfx_dir, "*.aep", progress, file_index
-                )
-                deleted_count += result[0]
-                failed_count += result[1]
-                file_index = result[2]
-
-                # 处理BG文件
-                for bg_dir in vfx_dir.glob("*/bg"):
-                    if progress.wasCanceled():
-                        break
-                    for ext in IMAGE_EXTENSIONS:
-                        result = self._delete_old_versions_in_dir(
-                            bg_dir, f"*{ext}", progress, file_index
-                        )
-                        deleted_count += result[0]
-                        failed_count += result[1]
-                        file_index = result[2]
-
-                # 处理Cell文件夹
-                for cell_dir in vfx_dir.glob("*/cell"):
-                    if progress.wasCanceled():
-                        break
-                    result = self._delete_old_cell_versions(
-                        cell_dir, progress, file_index
-                    )
-                    deleted_count += result[0]
-                    failed_count += result[1]
-                    file_index = result[2]
-
-        finally:
-            progress.close()
-
-        # 显示结果
-        result_msg = f"删除完成:\n✅ 成功删除: {deleted_count} 个旧版本"
-        if failed_count > 0:
-            result_msg += f"\n❌ 删除失败: {failed_count} 个文件"
+        worker = _VersionBatchWorker(action, targets)
+        worker.signals.progress.connect(self._on_version_batch_progress, Qt.QueuedConnection)
+        worker.signals.finished.connect(self._on_version_batch_finished, Qt.QueuedConnection)
+        progress.canceled.connect(worker.cancel)
+
+        # 保持引用直到任务结束
+        self._version_batch = (worker, progress)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_version_batch_progress(self, value: int, name: str):
+        """批量操作进度更新"""
+        progress = self._version_batch[1]
+        progress.setValue(value)
+        progress.setLabelText(f"正在处理: {name}")
+
+    def _on_version_batch_finished(self, done: int, failed: int):
+        """批量操作完成后显示结果并刷新视图"""
+        worker, progress = self._version_batch
+        self._version_batch = None
+        progress.close()
+
+        if worker.action == "lock":
+            msg = f"锁定完成:\n✅ 成功锁定: {done} 个最新版本"
+            if failed > 0:
+                msg += f"\n❌ 锁定失败: {failed} 个文件"
+        else:
+            msg = f"删除完成:\n✅ 成功删除: {done} 个旧版本"
+            if failed > 0:
+                msg += f"\n❌ 删除失败: {failed} 个文件"
 
-        QMessageBox.information(self, "完成", result_msg)
+        QMessageBox.information(self, "完成", msg)
 
         # 刷新视图
-        self._refresh_tree()
+        if worker.action == "delete":
+            self._refresh_tree()
         if self.current_cut_id:
             self._load_cut_files(self.current_cut_id, self.current_episode_id)
 
@@ -620,7 +797,7 @@ class VersionMixin:
         dialog = ProjectStatisticsDialog(self.project_config, version_stats, self.project_base, self)
         dialog.exec_()
 
-    def _get_version_statistics(self) -> Dict[str, int]:
+    def _get_version_statistics(self, index: Optional[_VersionIndex] = None) -> Dict[str, int]:
         """获取项目版本统计信息"""
         stats = {
             'total_files': 0,
@@ -640,224 +817,158 @@ class VersionMixin:
             'cell_count': 0
         }
 
-        # 遍历所有VFX目录
-        for vfx_dir in self.project_base.rglob("01_vfx"):
-            # AEP文件
-            for aep in vfx_dir.glob("*/*.aep"):
+        if index is None:
+            # 扫描过的目录都没有变化时直接复用上次的统计结果
+            cache = self._stats_cache
+            if cache is not None and cache[0] == self.project_base and _dirs_unchanged(cache[1]):
+                return dict(cache[2])
+            index = self._build_version_index(with_sizes=True)
+
+        # 无版本号的文件只计入数量和总大小
+        for kind, file_info in index.unversioned:
+            stats['total_files'] += 1
+            stats[f'{kind}_count'] += 1
+            stats['total_size_mb'] += index.size_of(file_info) / (1024 * 1024)
+
+        for (kind, directory, group_name), files in index.groups.items():
+            latest_version = max(f.version for f in files)
+            for file_info in files:
                 stats['total_files'] += 1
-                stats['aep_count'] += 1
-                file_info = get_file_info(aep)
-                self._update_file_stats(stats, file_info, aep)
-
-            # BG文件
-            for bg_dir in vfx_dir.glob("*/bg"):
-                for ext in IMAGE_EXTENSIONS:
-                    for bg in bg_dir.glob(f"*{ext}"):
-                        stats['total_files'] += 1
-                        stats['bg_count'] += 1
-                        file_info = get_file_info(bg)
-                        self._update_file_stats(stats, file_info, bg)
-
-            # Cell文件夹
-            for cell_dir in vfx_dir.glob("*/cell"):
-                for folder in cell_dir.iterdir():
-                    if folder.is_dir():
-                        stats['total_files'] += 1
-                        stats['cell_count'] += 1
-                        file_info = get_file_info(folder)
-                        self._update_folder_stats(stats, file_info, folder)
+                stats[f'{kind}_count'] += 1
+                self._update_file_stats(
+                    stats, file_info, index.size_of(file_info),
+                    file_info.version == latest_version,
+                    index.is_locked(directory, file_info)
+                )
 
+        self._stats_cache = (self.project_base, index.dir_mtimes, dict(stats))
         return stats
 
-    def _update_file_stats(self, stats: Dict, file_info: FileInfo, file_path: Path):
+    def _invalidate_version_stats(self):
+        """文件被修改后丢弃缓存的版本统计"""
+        self._stats_cache = None
+
+    @staticmethod
+    def _update_file_stats(stats: Dict, file_info: FileInfo, size: int, is_latest: bool, is_locked: bool):
         """更新文件统计信息"""
-        size_mb = file_path.stat().st_size / (1024 * 1024)
+        size_mb = size / (1024 * 1024)
         stats['total_size_mb'] += size_mb
+        stats['versioned_files'] += 1
 
-        if file_info.version is not None:
-            stats['versioned_files'] += 1
-
-            # 检查是否是最新版本
-            all_versions = self._get_all_versions_for_file(file_path)
-            is_latest = file_info.version == max(v.version for v in all_versions)
-
-            # 检查锁定状态
-            lock_file = file_path.parent / f".{file_path.name}.lock"
-            is_locked = lock_file.exists()
+        if is_locked:
+            stats['locked_files'] += 1
 
+        if is_latest:
+            stats['latest_versions'] += 1
+            stats['latest_size_mb'] += size_mb
             if is_locked:
-                stats['locked_files'] += 1
-
-            if is_latest:
-                stats['latest_versions'] += 1
-                stats['latest_size_mb'] += size_mb
-                if is_locked:
-                    stats['locked_latest'] += 1
+                stats['locked_latest'] += 1
+        else:
+            stats['old_versions'] += 1
+            stats['old_size_mb'] += size_mb
+            if is_locked:
+                stats['locked_old'] += 1
             else:
-                stats['old_versions'] += 1
-                stats['old_size_mb'] += size_mb
-                if is_locked:
-                    stats['locked_old'] += 1
-                else:
-                    stats['deletable_old'] += 1
-                    stats['deletable_size_mb'] += size_mb
-
-    def _update_folder_stats(self, stats: Dict, file_info: FileInfo, folder_path: Path):
-        """更新文件夹统计信息"""
-        # 计算文件夹大小
-        size_mb = sum(f.stat().st_size for f in folder_path.rglob("*") if f.is_file()) / (1024 * 1024)
-        stats['total_size_mb'] += size_mb
-
-        if file_info.version is not None:
-            stats['versioned_files'] += 1
-
-            # 检查是否是最新版本
-            all_versions = []
-            for item in folder_path.parent.iterdir():
-                if item.is_dir() and item.name.startswith(folder_path.name[:folder_path.name.rfind('_T')]):
-                    info = get_file_info(item)
-                    if info.version is not None:
-                        all_versions.append(info)
-
-            is_latest = file_info.version == max(v.version for v in all_versions) if all_versions else True
-
-            # 检查锁定状态
-            lock_file = folder_path.parent / f".{folder_path.name}.lock"
-            is_locked = lock_file.exists()
+                stats['deletable_old'] += 1
+                stats['deletable_size_mb'] += size_mb
+
+    def _build_version_index(self, include_render: bool = False, with_sizes: bool = False) -> _VersionIndex:
+        """
+        扫描一次项目，按版本分组收集 AEP、BG、Cell（可选渲染输出）文件
+        with_sizes 为 True 时递归计算文件夹版本的总大小，只有统计和删除需要
+        """
+        index = _VersionIndex(with_sizes=with_sizes)
+
+        # 01_vfx 与 06_render 在同一次遍历中找出
+        dir_names = ("01_vfx", "06_render") if include_render else ("01_vfx",)
+        mtimes = index.dir_mtimes
+        for root_entry in self._scan_vfx_dirs(dir_names, mtimes):
+            if root_entry.name == "06_render":
+                # 遍历所有子目录（不含06_render本身）
+                pending = [e for e in _scandir(root_entry.path, mtimes) if e.is_dir(follow_symlinks=False)]
+                while pending:
+                    pending.extend(
+                        self._index_directory(index, "render", pending.pop().path, _is_render_entry)
+                    )
+                continue
 
-            if is_locked:
-                stats['locked_files'] += 1
+            for cut_entry in _scandir(root_entry.path, mtimes):
+                if not cut_entry.is_dir():
+                    continue
 
-            if is_latest:
-                stats['latest_versions'] += 1
-                stats['latest_size_mb'] += size_mb
-                if is_locked:
-                    stats['locked_latest'] += 1
+                subdirs = self._index_directory(index, "aep", cut_entry.path, _is_aep_entry)
+                for entry in subdirs:
+                    if entry.name == "bg":
+                        self._index_directory(index, "bg", entry.path, _is_image_entry)
+                    elif entry.name == "cell":
+                        self._index_directory(index, "cell", entry.path, _is_cell_entry)
+
+        return index
+
+    def _scan_vfx_dirs(self, dir_names: Tuple[str, ...] = ("01_vfx",),
+                       mtimes: Optional[Dict[str, int]] = None) -> Iterator[os.DirEntry]:
+        """用 os.scandir 遍历项目，找出指定名称的目录（01_vfx / 06_render）
+
+        路径全程使用字符串；找到的目录交给调用方处理，不再进入其内部继续查找，
+        也不会深入到 VFX_DEPTH 层以下。
+        """
+        pending = [(os.fspath(self.project_base), 1)]
+        while pending:
+            path, depth = pending.pop()
+            for entry in _scandir(path, mtimes):
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in dir_names:
+                        yield entry
+                    elif depth < VFX_DEPTH:
+                        pending.append((entry.path, depth + 1))
+
+    def _index_directory(self, index: _VersionIndex, kind: str, directory: str, accept) -> List[os.DirEntry]:
+        """扫描单个目录：记录其中的锁定文件，将符合条件的条目按版本分组，返回子目录条目"""
+        lock_names = set()
+        subdirs = []
+
+        for entry in _scandir(directory, index.dir_mtimes):
+            name = entry.name
+            if name.startswith(".") and name.endswith(".lock"):
+                lock_names.add(name)
+                continue
+
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry)
+            if not accept(entry):
+                continue
+
+            file_info = get_file_info_from_entry(entry)
+            if file_info.is_folder:
+                if index.with_sizes:
+                    index.sizes[file_info.path] = get_dir_size(entry.path)
+                index.dir_mtimes[entry.path] = entry.stat().st_mtime_ns
+
+            if file_info.version is None:
+                index.unversioned.append((kind, file_info))
+                continue
+
+            # 一次 splitext 得到主干和后缀，不再经由 Path.stem / Path.suffix 重复解析
+            stem, suffix = os.path.splitext(name)
+            # 与版本号提取使用同一正则，_G / _S / _P / _V 等标记同样去掉
+            match = VERSION_PATTERN.search(stem)
+            if match:
+                group_name = stem[:match.start()] + suffix
+            elif kind == "render":
+                # 渲染输出只处理末尾带版本标记的文件
+                continue
+            elif kind == "aep":
+                # 无法确定基础名称的AEP按Cut目录归为一组
+                group_name = ""
             else:
-                stats['old_versions'] += 1
-                stats['old_size_mb'] += size_mb
-                if is_locked:
-                    stats['locked_old'] += 1
-                else:
-                    stats['deletable_old'] += 1
-                    stats['deletable_size_mb'] += size_mb
-
-    def _get_all_versions_for_file(self, file_path: Path) -> List[FileInfo]:
-        """获取文件的所有版本"""
-        if '_T' in file_path.stem:
-            base_name = file_path.stem[:file_path.stem.rfind('_T')]
-        elif '_v' in file_path.stem:
-            base_name = file_path.stem[:file_path.stem.rfind('_v')]
-        else:
-            return [get_file_info(file_path)]
+                # 无法确定基础名称时单独成组
+                group_name = name
 
-        all_versions = []
-        pattern = f"{base_name}_*{file_path.suffix}"
-        for item in file_path.parent.glob(pattern):
-            if item.is_file():
-                info = get_file_info(item)
-                if info.version is not None:
-                    all_versions.append(info)
-
-        return all_versions if all_versions else [get_file_info(file_path)]
-
-    def _delete_old_versions_in_dir(self, directory: Path, pattern: str,
-                                    progress: 'QProgressDialog', start_index: int) -> tuple:
-        """删除目录中的旧版本文件"""
-        deleted = 0
-        failed = 0
-        index = start_index
-
-        # 收集文件并按基础名称分组
-        files_by_base = {}
-        for file in directory.rglob(pattern):
-            file_info = get_file_info(file)
-            if file_info.version is not None:
-                if '_T' in file.stem:
-                    base_name = file.stem[:file.stem.rfind('_T')]
-                elif '_v' in file.stem:
-                    base_name = file.stem[:file.stem.rfind('_v')]
-                else:
-                    continue
+            index.groups.setdefault((kind, directory, group_name), []).append(file_info)
 
-                if base_name not in files_by_base:
-                    files_by_base[base_name] = []
-                files_by_base[base_name].append((file, file_info))
-
-        # 删除每组的旧版本
-        for base_name, files in files_by_base.items():
-            if len(files) > 1:
-                # 找出最新版本
-                latest_version = max(f[1].version for f in files)
-
-                for file_path, file_info in files:
-                    if file_info.version < latest_version:
-                        # 检查是否锁定
-                        lock_file = file_path.parent / f".{file_path.name}.lock"
-                        if not lock_file.exists():
-                            progress.setValue(index)
-                            progress.setLabelText(f"正在删除: {file_path.name}")
-                            QApplication.processEvents()
-
-                            try:
-                                file_path.unlink()
-                                deleted += 1
-                            except:
-                                failed += 1
-
-                            index += 1
-
-                            if progress.wasCanceled():
-                                return deleted, failed, index
-
-        return deleted, failed, index
-
-    def _delete_old_cell_versions(self, cell_dir: Path,
-                                  progress: 'QProgressDialog', start_index: int) -> tuple:
-        """删除Cell目录中的旧版本"""
-        deleted = 0
-        failed = 0
-        index = start_index
-
-        # 收集文件夹并按基础名称分组
-        folders_by_base = {}
-        for folder in cell_dir.iterdir():
-            if folder.is_dir():
-                file_info = get_file_info(folder)
-                if file_info.version is not None:
-                    base_name = folder.name[:folder.name.rfind('_T')] if '_T' in folder.name else folder.name
-
-                    if base_name not in folders_by_base:
-                        folders_by_base[base_name] = []
-                    folders_by_base[base_name].append((folder, file_info))
-
-        # 删除每组的旧版本
-        for base_name, folders in folders_by_base.items():
-            if len(folders) > 1:
-                # 找出最新版本
-                latest_version = max(f[1].version for f in folders)
-
-                for folder_path, file_info in folders:
-                    if file_info.version < latest_version:
-                        # 检查是否锁定
-                        lock_file = folder_path.parent / f".{folder_path.name}.lock"
-                        if not lock_file.exists():
-                            progress.setValue(index)
-                            progress.setLabelText(f"正在删除: {folder_path.name}")
-                            QApplication.processEvents()
-
-                            try:
-                                shutil.rmtree(folder_path)
-                                deleted += 1
-                            except:
-                                failed += 1
-
-                            index += 1
-
-                            if progress.wasCanceled():
-                                return deleted, failed, index
-
-        return deleted, failed, index
+        if lock_names:
+            index.lock_names[directory] = lock_names
+        return subdirs
 
     def _open_in_manager(self, path: Path):
         """在文件管理器中打开"""
@@ -1,15 +1,26 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                QWidget, QFrame, QPushButton, QScrollArea, QGroupBox,
-                               QGridLayout, QTabWidget, QTreeWidget, QTreeWidgetItem,
+                               QTabWidget, QTreeWidget, QTreeWidgetItem,
                                QHeaderView, QAbstractItemView, QProgressDialog, QApplication,
                                QCheckBox, QMessageBox)
-from PySide6.QtCore import Qt, QSize, QThread, Signal, QTimer, QPoint
-from PySide6.QtGui import QPainter, QColor, QBrush, QPixmap, QIcon, QFont
+from PySide6.QtCore import (Qt, QSize, QThread, Signal, QTimer, QPoint,
+                            QObject, QRunnable, QThreadPool)
+from PySide6.QtGui import QPainter, QColor, QBrush, QPixmap, QPixmapCache, QIcon, QFont
+import html
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 import subprocess
 import platform
 
+from cx_project_manager.utils.utils import get_dir_size_parallel, extract_version_string_from_filename
+
 
 # 主题颜色常量
 THEME_COLORS = {
@@ -50,6 +61,8 @@ UI_CONSTANTS = {
     'window_height_margin': 150,
     'hover_delay_ms': 300,
     'thread_start_delay_ms': 100,
+    'sync_load_max_cuts': 200,
+    'progress_dialog_min_cuts': 2000,
     'dialog_min_width': 1200,
     'dialog_min_height': 800,
     'progress_dialog_width': 400,
@@ -58,100 +71,526 @@ UI_CONSTANTS = {
     'close_button_height': 35,
     'size_warning_threshold_mb': 1000,
     'size_critical_threshold_mb': 5000,
+    'pixmap_cache_limit_kb': 32 * 1024,
+    'project_size_cache_ttl_s': 60,
     'bytes_per_kb': 1024,
     'bytes_per_mb': 1024 * 1024,
     'bytes_per_gb': 1024 * 1024 * 1024
 }
 
+# 文件大小显示单位，从大到小匹配
+_SIZE_UNITS = (
+    (UI_CONSTANTS['bytes_per_gb'], "GB"),
+    (UI_CONSTANTS['bytes_per_mb'], "MB"),
+    (UI_CONSTANTS['bytes_per_kb'], "KB"),
+)
+
+
+# 样式表常量：在模块加载时生成一次，各实例共用同一字符串
+# 对话框内所有控件的样式集中在一份样式表中，由对话框安装一次，
+# 子控件通过 objectName 或 role 属性匹配，不再各自调用 setStyleSheet
+_DIALOG_QSS = f"""
+    QDialog {{
+        background-color: {THEME_COLORS['bg_dark']};
+    }}
+    QLabel {{
+        font-family: "MiSans", "Microsoft YaHei", sans-serif;
+        color: {THEME_COLORS['text_white']};
+    }}
+    QScrollArea {{
+        background-color: {THEME_COLORS['transparent']};
+        border: none;
+    }}
+    QScrollBar:vertical {{
+        background-color: {THEME_COLORS['bg_medium']};
+        width: 10px;
+        border-radius: 5px;
+    }}
+    QScrollBar::handle:vertical {{
+        background-color: {THEME_COLORS['bg_lighter']};
+        border-radius: 5px;
+        min-height: 20px;
+    }}
+    QScrollBar::handle:vertical:hover {{
+        background-color: {THEME_COLORS['bg_lightest']};
+    }}
+    QWidget[role="transparent"], QLabel[role="stat-row"] {{
+        background-color: {THEME_COLORS['transparent']};
+    }}
+
+    StatGroupBox {{
+        font-size: 16px;
+        font-weight: bold;
+        color: {THEME_COLORS['primary_blue']};
+        border: 1px solid {THEME_COLORS['bg_light']};
+        border-radius: 8px;
+        margin-top: 12px;
+        padding-top: 15px;
+        background-color: {THEME_COLORS['bg_medium']};
+    }}
+    StatGroupBox::title {{
+        subcontrol-origin: margin;
+        left: 15px;
+        padding: 0 10px 0 10px;
+    }}
+
+    QLabel[role="episode-detail"] {{
+        color: #ccc;
+        font-size: 13px;
+        background-color: {THEME_COLORS['transparent']};
+    }}
+    QLabel[role="legend-label"] {{
+        color: {THEME_COLORS['text_gray']};
+        font-size: 12px;
+        background-color: {THEME_COLORS['transparent']};
+    }}
+
+    QTabWidget#statisticsTabs::pane {{
+        border: 1px solid {THEME_COLORS['bg_light']};
+        background-color: {THEME_COLORS['bg_dark']};
+    }}
+    QTabWidget#statisticsTabs QTabBar::tab {{
+        background-color: {THEME_COLORS['bg_medium']};
+        color: {THEME_COLORS['text_white']};
+        padding: 10px 20px;
+        margin-right: 2px;
+        border: 1px solid {THEME_COLORS['bg_light']};
+        border-bottom: none;
+    }}
+    QTabWidget#statisticsTabs QTabBar::tab:selected {{
+        background-color: {THEME_COLORS['primary_blue']};
+        color: {THEME_COLORS['bg_dark']};
+        font-weight: bold;
+    }}
+    QTabWidget#statisticsTabs QTabBar::tab:hover {{
+        background-color: {THEME_COLORS['bg_light']};
+    }}
+
+    QLabel#projectSizeLabel {{
+        font-size: 16px;
+        font-weight: bold;
+        color: #4FC3F7;
+        background-color: transparent;
+    }}
+    QPushButton#closeButton {{
+        background-color: #4FC3F7;
+        color: #1a1a1a;
+        border: none;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+    }}
+    QPushButton#closeButton:hover {{
+        background-color: #29B6F6;
+    }}
+
+    QCheckBox#hoverPreviewCheckbox {{
+        color: {THEME_COLORS['text_white']};
+        font-size: 14px;
+        spacing: 8px;
+    }}
+    QCheckBox#hoverPreviewCheckbox::indicator {{
+        width: 16px;
+        height: 16px;
+        border: 2px solid {THEME_COLORS['bg_lighter']};
+        border-radius: 3px;
+        background-color: {THEME_COLORS['bg_medium']};
+    }}
+    QCheckBox#hoverPreviewCheckbox::indicator:checked {{
+        background-color: {THEME_COLORS['primary_blue']};
+        border: 2px solid {THEME_COLORS['primary_blue']};
+    }}
+
+    QTreeWidget#cutTree {{
+        background-color: {THEME_COLORS['bg_medium']};
+        color: {THEME_COLORS['text_white']};
+        border: 1px solid {THEME_COLORS['bg_light']};
+        font-family: "MiSans", "Microsoft YaHei", sans-serif;
+        font-size: 13px;
+    }}
+    QTreeWidget#cutTree::item {{
+        height: 32px;
+        padding: 4px;
+    }}
+    QTreeWidget#cutTree::item:selected {{
+        background-color: {THEME_COLORS['primary_blue']};
+        color: {THEME_COLORS['bg_dark']};
+    }}
+    QTreeWidget#cutTree::item:hover {{
+        background-color: {THEME_COLORS['bg_disabled']};
+    }}
+    QTreeWidget#cutTree QHeaderView::section {{
+        background-color: {THEME_COLORS['bg_light']};
+        color: {THEME_COLORS['text_white']};
+        padding: 8px;
+        border: 1px solid {THEME_COLORS['bg_lighter']};
+        font-weight: bold;
+    }}
+"""
+
+_STAT_ROW_HTML = (
+    "<table width='100%' cellspacing='0' cellpadding='0'><tr>"
+    f"<td style='color: {THEME_COLORS['text_gray']}; font-size: 14px;'>{{label}}</td>"
+    "<td align='right' style='color: {color}; font-size: 15px; font-weight: bold;'>{value}</td>"
+    "</tr></table>"
+)
+
+_PROGRESS_DIALOG_QSS = f"""
+    QProgressDialog {{
+        background-color: {THEME_COLORS['bg_medium']};
+        color: {THEME_COLORS['text_white']};
+        border: 2px solid {THEME_COLORS['primary_blue']};
+        border-radius: 8px;
+    }}
+    QLabel {{
+        color: {THEME_COLORS['text_white']};
+        font-size: 14px;
+        font-weight: bold;
+        background-color: {THEME_COLORS['transparent']};
+        padding: 10px;
+    }}
+    QProgressBar {{
+        background-color: {THEME_COLORS['bg_light']};
+        border: 2px solid {THEME_COLORS['bg_lighter']};
+        border-radius: 6px;
+        text-align: center;
+        color: {THEME_COLORS['text_white']};
+        font-weight: bold;
+        height: 25px;
+    }}
+    QProgressBar::chunk {{
+        background-color: {THEME_COLORS['primary_blue']};
+        border-radius: 4px;
+        margin: 1px;
+    }}
+    QPushButton {{
+        background-color: {THEME_COLORS['bg_light']};
+        color: {THEME_COLORS['text_white']};
+        border: 2px solid {THEME_COLORS['bg_lighter']};
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-width: 80px;
+    }}
+    QPushButton:hover {{
+        background-color: {THEME_COLORS['bg_lighter']};
+        border-color: {THEME_COLORS['primary_blue']};
+    }}
+    QPushButton:pressed {{
+        background-color: {THEME_COLORS['primary_blue']};
+        color: {THEME_COLORS['bg_dark']};
+    }}
+"""
+
+_TOOLTIP_THUMBNAIL_QSS = f"""
+    QLabel {{
+        background-color: {THEME_COLORS['bg_light']};
+        border: 2px solid {THEME_COLORS['bg_lighter']};
+        border-radius: 8px;
+        color: {THEME_COLORS['text_gray']};
+    }}
+"""
+
+_TOOLTIP_INFO_QSS = f"""
+    QLabel {{
+        background-color: {THEME_COLORS['bg_medium']};
+        border: 1px solid {THEME_COLORS['bg_lighter']};
+        border-radius: 6px;
+        padding: 6px;
+        color: {THEME_COLORS['text_white']};
+        font-family: "MiSans", "Microsoft YaHei", sans-serif;
+        font-size: 11px;
+        line-height: 1.2;
+    }}
+"""
+
+_TOOLTIP_QSS = f"""
+    CutTooltipWidget {{
+        background-color: {THEME_COLORS['semi_transparent_dark']};
+        border: 2px solid {THEME_COLORS['primary_blue']};
+        border-radius: 10px;
+    }}
+"""
+
 
 # ======================== Utility Classes ========================
 
+# 缩略图文件名 (格式: "014+still_F0001.jpg")
+_THUMBNAIL_PATTERN = re.compile(r"^(?P<cut>[^+]+)\+still_F.*\.jpg$", re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def _scan_thumbnail_dir(still_path: str, mtime_ns: int) -> dict:
+    """扫描缩略图目录，按 Cut 编号取帧号最小的一张（mtime_ns 仅用作缓存键）"""
+    thumbnails = {}
+    try:
+        with os.scandir(still_path) as it:
+            for entry in it:
+                match = _THUMBNAIL_PATTERN.match(entry.name)
+                if match is None:
+                    continue
+                cut_id = match.group("cut")
+                current = thumbnails.get(cut_id)
+                if current is None or entry.name < current.name:
+                    thumbnails[cut_id] = Path(entry.path)
+    except OSError:
+        return {}
+    return thumbnails
+
+
+@lru_cache(maxsize=4096)
+def _scan_latest_file(search_path: str, mtime_ns: int, extensions: frozenset) -> Optional[dict]:
+    """
+    一次 scandir 找出指定扩展名中修改时间最新的文件，使用 DirEntry 缓存的 stat（mtime_ns 仅用作缓存键）
+    目录修改时间只在文件增删/改名时变化，原地覆盖写入不会使缓存失效，
+    因此结果中不保存文件大小等会随内容变化的信息；此时"最新"判断也可能滞后，直到目录再次变化
+    """
+    latest_entry = None
+    latest_mtime = 0.0
+    try:
+        with os.scandir(search_path) as it:
+            for entry in it:
+                _, dot, ext = entry.name.rpartition('.')
+                if not dot or f".{ext.lower()}" not in extensions:
+                    continue
+                if not entry.is_file():
+                    continue
+                mtime = entry.stat().st_mtime
+                if latest_entry is None or mtime > latest_mtime:
+                    latest_entry = entry
+                    latest_mtime = mtime
+    except OSError:
+        return None
+
+    if latest_entry is None:
+        return None
+
+    # 只为最终结果构造 Path
+    latest_file = Path(latest_entry.path)
+
+    # 提取版本信息
+    version_str = _extract_version_string(latest_file.stem)
+    if not version_str:
+        version_str = "v0"
+
+    return {
+        'path': latest_file,
+        'version': version_str
+    }
+
+
+# 版本字符串解析是纯函数，刷新时同一文件名会反复解析
+_extract_version_string = lru_cache(maxsize=4096)(extract_version_string_from_filename)
+
+# 悬浮提示中的 HTML 片段，颜色在导入时代入，悬浮时只需填入内容
+_NO_FILE_HTML = f"<span style='color: {THEME_COLORS['error_red']};'>无</span>"
+_FILE_SIZE_HTML = f"<br><span style='color: {THEME_COLORS['text_gray']}; font-size: 10px;'>{{}}</span>"
+_CUT_TITLE_HTML = f"<b style='color: {THEME_COLORS['primary_blue']};'>{{}}</b>"
+_VERSION_BADGE_HTML = (
+    f" <span style='color: {THEME_COLORS['version_green']}; font-size: 11px; "
+    f"background-color: {THEME_COLORS['bg_medium']}; padding: 2px 4px; border-radius: 3px;'>    {{}}</span>"
+)
+_EPISODE_LINE_HTML = f"<br><span style='color: {THEME_COLORS['text_gray']};'>Episode: {{}}</span>"
+
+# 文件名中版本号高亮的 HTML 片段
+_VERSION_HIGHLIGHT_PREFIX = f"_<span style='color: {THEME_COLORS['success_green']}; font-weight: bold;'>"
+_VERSION_HIGHLIGHT_SUFFIX = "</span>"
+
+
+@lru_cache(maxsize=16)
+def _color_swatch(hex_color: str, size: int = 12) -> QPixmap:
+    """图例用圆角色块，每种颜色只绘制一次（需要 QApplication 已存在，故不在导入时生成）"""
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(hex_color))
+    painter.drawRoundedRect(0, 0, size, size, 2, 2)
+    painter.end()
+    return pixmap
+
+
+@dataclass(frozen=True)
+class _CutRef:
+    """Cut项存储在 Qt.UserRole 中的数据，供双击打开和悬浮提示使用"""
+    __slots__ = ('cut_id', 'episode_id', 'aep_path', 'mov_path', 'thumbnail_path')
+    cut_id: str
+    episode_id: str
+    aep_path: Optional[Path]
+    mov_path: Optional[Path]
+    thumbnail_path: Optional[Path]
+
+
+def _collect_cut_groups(project_config: dict) -> list:
+    """
+    按界面显示顺序列出Cut分组 [(分组键, episode_id, Cut列表)]
+    单集模式：有Cut的根目录和特殊Episode；Episode模式：按编号排序的全部Episode（含空Episode）
+    """
+    episodes = project_config.get("episodes", {})
+    if project_config.get("no_episode", False):
+        groups = []
+        cuts = project_config.get("cuts", [])
+        if cuts:
+            groups.append(("root", None, cuts))
+        groups.extend((ep_id, ep_id, ep_cuts) for ep_id, ep_cuts in episodes.items() if ep_cuts)
+        return groups
+    return [(ep_id, ep_id, ep_cuts) for ep_id, ep_cuts in sorted(episodes.items())]
+
+
+def _group_label(parent_key: str) -> str:
+    """分组节点显示的名称"""
+    return "根目录" if parent_key == "root" else parent_key
+
+
+# 项目总体积缓存 {项目路径: (计算时间, 大小MB)}，跨对话框实例复用
+# 深层目录的变化不会反映到根目录的修改时间上，因此按时间过期而不是按 mtime 失效
+_project_size_cache: Dict[str, Tuple[float, float]] = {}
+
+
+def _get_cached_project_size(project_base: Path) -> Optional[float]:
+    """未过期的项目总体积（MB），没有时返回 None"""
+    cached = _project_size_cache.get(os.fspath(project_base))
+    if cached is not None and time.monotonic() - cached[0] < UI_CONSTANTS['project_size_cache_ttl_s']:
+        return cached[1]
+    return None
+
+
+def _store_project_size(project_base: Path, size_mb: float):
+    """记录项目总体积（MB）"""
+    _project_size_cache[os.fspath(project_base)] = (time.monotonic(), size_mb)
+
+
+class _ProjectSizeSignals(QObject):
+    """项目体积计算完成信号（QRunnable 本身不能定义信号）"""
+    finished = Signal(float)  # 项目总大小（MB）
+
+
+class _ProjectSizeWorker(QRunnable):
+    """在线程池中遍历项目目录计算总大小"""
+
+    def __init__(self, project_base: Path):
+        super().__init__()
+        self.project_base = project_base
+        self.signals = _ProjectSizeSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """对话框关闭时停止遍历（正在扫描的目录完成后生效）"""
+        self._cancelled.set()
+
+    def run(self):
+        total_size = get_dir_size_parallel(self.project_base, cancelled=self._cancelled) if self.project_base else 0
+        if not self._cancelled.is_set():
+            size_mb = total_size / UI_CONSTANTS['bytes_per_mb']
+            if self.project_base:
+                _store_project_size(self.project_base, size_mb)
+            self.signals.finished.emit(size_mb)
+
+
 class FileUtils:
     """文件操作工具类 - 提取公共文件查找逻辑"""
 
+    # 各类文件的扩展名集合（小写）
+    AEP_EXTENSIONS = frozenset(('.aep',))
+    VIDEO_EXTENSIONS = frozenset(('.mov', '.mp4', '.avi', '.mkv'))
+
     @staticmethod
     def find_latest_file(search_path: Path, file_patterns: list) -> dict:
-        """查找最新的文件（通用方法）"""
-        if not search_path.exists():
-            return None
-
-        files = []
-        for pattern in file_patterns:
-            files.extend(search_path.glob(pattern))
+        """查找最新的文件（通用方法），file_patterns 形如 ["*.aep"]"""
+        extensions = frozenset(pattern.rpartition('.')[2].lower() for pattern in file_patterns)
+        return FileUtils._find_latest_by_ext(search_path, frozenset(f".{ext}" for ext in extensions))
 
-        if not files:
+    @staticmethod
+    def _find_latest_by_ext(search_path, extensions: frozenset) -> dict:
+        """
+        找出指定扩展名中修改时间最新的文件（search_path 可以是 str 或 Path）
+        扫描结果按目录修改时间缓存，目录内文件未增删时只需一次 stat
+        """
+        try:
+            mtime_ns = os.stat(search_path).st_mtime_ns
+        except OSError:
             return None
-
-        # 按修改时间排序，取最新的
-        latest_file = max(files, key=lambda f: f.stat().st_mtime)
-
-        # 提取版本信息
-        from cx_project_manager.utils.utils import extract_version_string_from_filename
-        version_str = extract_version_string_from_filename(latest_file.stem)
-        if not version_str:
-            version_str = "v0"
-
-        return {
-            'path': latest_file,
-            'version': version_str
-        }
+        return _scan_latest_file(os.fspath(search_path), mtime_ns, extensions)
 
     @staticmethod
-    def find_latest_aep(vfx_path: Path) -> dict:
+    def find_latest_aep(vfx_path) -> dict:
         """查找最新的AEP文件"""
-        return FileUtils.find_latest_file(vfx_path, ["*.aep"])
+        return FileUtils._find_latest_by_ext(vfx_path, FileUtils.AEP_EXTENSIONS)
 
     @staticmethod
-    def find_latest_mov(render_path: Path) -> dict:
+    def find_latest_mov(render_path) -> dict:
         """查找最新的MOV文件"""
-        video_patterns = ["*.mov", "*.mp4", "*.avi", "*.mkv"]
-        return FileUtils.find_latest_file(render_path, video_patterns)
+        return FileUtils._find_latest_by_ext(render_path, FileUtils.VIDEO_EXTENSIONS)
 
     @staticmethod
-    def find_thumbnail(project_base: Path, cut_id: str, episode_id: str) -> Path:
-        """查找缩略图（第一帧）"""
+    def build_thumbnail_index(project_base, episode_id: str) -> dict:
+        """
+        返回 {cut_id: 第一帧缩略图路径}
+        每个缩略图目录只扫描一次；目录修改时间作为缓存键的一部分，新增缩略图后自动重新扫描
+        """
         if episode_id:
-            still_path = project_base / "05_stills" / episode_id
+            still_path = os.path.join(project_base, "05_stills", episode_id)
         else:
-            still_path = project_base / "05_stills"
+            still_path = os.path.join(project_base, "05_stills")
 
-        if not still_path.exists():
-            return None
+        try:
+            mtime_ns = os.stat(still_path).st_mtime_ns
+        except OSError:
+            return {}
+        return _scan_thumbnail_dir(still_path, mtime_ns)
 
-        # 查找第一帧缩略图 (格式: "014+still_F0001.jpg")
-        first_frame_pattern = f"{cut_id}+still_F*.jpg"
-        thumbnails = list(still_path.glob(first_frame_pattern))
+    @staticmethod
+    def find_thumbnail(project_base, cut_id: str, episode_id: str) -> Path:
+        """查找缩略图（第一帧）"""
+        return FileUtils.build_thumbnail_index(project_base, episode_id).get(cut_id)
 
-        if thumbnails:
-            return thumbnails[0]
+    @staticmethod
+    def scan_cut(project_root: str, cut_id: str, episode_id: str, thumbnail_index: dict = None) -> tuple:
+        """
+        扫描单个Cut，返回 (最新AEP信息, 最新MOV信息, 缩略图路径)
+        路径以字符串拼接，不为每个Cut构造 Path 对象
+        thumbnail_index 为该Cut所在分组的 build_thumbnail_index 结果，批量扫描时传入可省去逐Cut的目录检查
+        """
+        if thumbnail_index is None:
+            thumbnail_index = FileUtils.build_thumbnail_index(project_root, episode_id)
 
-        return None
+        if episode_id:
+            vfx_path = os.path.join(project_root, "01_vfx", episode_id, cut_id)
+            render_path = os.path.join(project_root, "06_render", episode_id, cut_id, "prores")
+        else:
+            vfx_path = os.path.join(project_root, "01_vfx", cut_id)
+            render_path = os.path.join(project_root, "06_render", cut_id, "prores")
+
+        return (
+            FileUtils.find_latest_aep(vfx_path),
+            FileUtils.find_latest_mov(render_path),
+            thumbnail_index.get(cut_id),
+        )
 
     @staticmethod
     def format_file_info_html(file_path: Path, file_size_func) -> str:
         """格式化文件信息为HTML字符串，高亮版本号"""
         if not file_path:
-            return f"<span style='color: {THEME_COLORS['error_red']};'>无</span>"
+            return _NO_FILE_HTML
 
         filename = file_path.name
         # 提取版本信息
-        from cx_project_manager.utils.utils import extract_version_string_from_filename
-        version_str = extract_version_string_from_filename(file_path.stem)
+        version_str = _extract_version_string(file_path.stem)
         file_size = file_size_func(file_path)
 
         # 高亮版本号
         highlighted_filename = filename
         if version_str and version_str != "v0" and version_str != "未知版本":
-            import re
-            version_pattern = re.compile(f"_{version_str[1:]}", re.IGNORECASE)  # 去掉v前缀查找
-            highlighted_filename = version_pattern.sub(
-                f"_<span style='color: {THEME_COLORS['success_green']}; font-weight: bold;'>{version_str[1:]}</span>",
-                filename
+            # 去掉前缀字母后只剩数字，不区分大小写的匹配等同于普通子串替换
+            number = version_str[1:]
+            highlighted_filename = filename.replace(
+                f"_{number}", f"{_VERSION_HIGHLIGHT_PREFIX}{number}{_VERSION_HIGHLIGHT_SUFFIX}"
             )
 
         result = highlighted_filename
         if file_size:
-            result += f"<br><span style='color: {THEME_COLORS['text_gray']}; font-size: 10px;'>{file_size}</span>"
+            result += _FILE_SIZE_HTML.format(file_size)
 
         return result
 
@@ -186,60 +625,40 @@ class CutTooltipWidget(QWidget):
         self.thumbnail_label = QLabel()
         self.thumbnail_label.setAlignment(Qt.AlignCenter)
         self.thumbnail_label.setFixedSize(self.thumbnail_size, self.thumbnail_size)
-        self.thumbnail_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {THEME_COLORS['bg_light']};
-                border: 2px solid {THEME_COLORS['bg_lighter']};
-                border-radius: 8px;
-                color: {THEME_COLORS['text_gray']};
-            }}
-        """)
+        self.thumbnail_label.setStyleSheet(_TOOLTIP_THUMBNAIL_QSS)
         layout.addWidget(self.thumbnail_label)
 
         # 信息标签
         self.info_label = QLabel()
         self.info_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.info_label.setWordWrap(True)
-        self.info_label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {THEME_COLORS['bg_medium']};
-                border: 1px solid {THEME_COLORS['bg_lighter']};
-                border-radius: 6px;
-                padding: 6px;
-                color: {THEME_COLORS['text_white']};
-                font-family: "MiSans", "Microsoft YaHei", sans-serif;
-                font-size: 11px;
-                line-height: 1.2;
-            }}
-        """)
+        self.info_label.setStyleSheet(_TOOLTIP_INFO_QSS)
         layout.addWidget(self.info_label)
 
         # 设置整体样式
-        self.setStyleSheet(f"""
-            CutTooltipWidget {{
-                background-color: {THEME_COLORS['semi_transparent_dark']};
-                border: 2px solid {THEME_COLORS['primary_blue']};
-                border-radius: 10px;
-            }}
-        """)
-
-    def show_cut_info(self, cut_data: dict, thumbnail_path: Path = None):
+        self.setStyleSheet(_TOOLTIP_QSS)
+
+    def show_cut_info(self, cut_ref: _CutRef, thumbnail_path: Path = None):
         """显示Cut信息"""
-        cut_id = cut_data.get('cut_id', 'Unknown')
-        episode_id = cut_data.get('episode_id', '')
-        aep_path = cut_data.get('aep_path')
-        mov_path = cut_data.get('mov_path')
+        cut_id = cut_ref.cut_id
+        episode_id = cut_ref.episode_id
+        aep_path = cut_ref.aep_path
+        mov_path = cut_ref.mov_path
 
         # 清除之前的缩略图
         self.thumbnail_label.clear()
 
         # 设置缩略图
-        if thumbnail_path and Path(thumbnail_path).exists():
-            # 强制重新加载图片，避免缓存问题
-            pixmap = QPixmap()
-            if pixmap.load(str(thumbnail_path)):
-                # 缩放到新尺寸，保持宽高比
-                scaled_pixmap = pixmap.scaled(self.thumbnail_size, self.thumbnail_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        mtime_ns = None
+        if thumbnail_path:
+            try:
+                mtime_ns = os.stat(thumbnail_path).st_mtime_ns
+            except OSError:
+                pass
+
+        if mtime_ns is not None:
+            scaled_pixmap = self._load_thumbnail(str(thumbnail_path), mtime_ns)
+            if scaled_pixmap is not None:
                 self.thumbnail_label.setPixmap(scaled_pixmap)
                 self.thumbnail_label.setText("")
             else:
@@ -261,13 +680,12 @@ class CutTooltipWidget(QWidget):
             version_label = self._get_version_label(latest_version)
 
         # 构建信息文本
+        info_text = _CUT_TITLE_HTML.format(cut_id)
         if version_label:
-            info_text = f"<b style='color: {THEME_COLORS['primary_blue']};'>{cut_id}</b> <span style='color: {THEME_COLORS['version_green']}; font-size: 11px; background-color: {THEME_COLORS['bg_medium']}; padding: 2px 4px; border-radius: 3px;'>    {version_label}</span>"
-        else:
-            info_text = f"<b style='color: {THEME_COLORS['primary_blue']};'>{cut_id}</b>"
+            info_text += _VERSION_BADGE_HTML.format(version_label)
 
         if episode_id:
-            info_text += f"<br><span style='color: {THEME_COLORS['text_gray']};'>Episode: {episode_id}</span>"
+            info_text += _EPISODE_LINE_HTML.format(episode_id)
 
         # AEP信息
         aep_info_html = FileUtils.format_file_info_html(aep_path, self._get_file_size)
@@ -279,38 +697,50 @@ class CutTooltipWidget(QWidget):
 
         self.info_label.setText(info_text)
 
-        # 强制刷新widget
-        self.update()
-        QApplication.processEvents()
+    def _load_thumbnail(self, path: str, mtime_ns: int):
+        """读取并缩放缩略图，结果存入 QPixmapCache；键中包含修改时间，文件更新后自动失效"""
+        scaled_key = f"{path}|{self.thumbnail_size}|{mtime_ns}"
+        scaled_pixmap = QPixmap()
+        if QPixmapCache.find(scaled_key, scaled_pixmap):
+            return scaled_pixmap
+
+        # 原图单独缓存，缩放尺寸变化时无需重新解码
+        source_key = f"{path}|{mtime_ns}"
+        pixmap = QPixmap()
+        if not QPixmapCache.find(source_key, pixmap):
+            if not pixmap.load(path):
+                return None
+            QPixmapCache.insert(source_key, pixmap)
+
+        # 缩放到新尺寸，保持宽高比
+        scaled_pixmap = pixmap.scaled(self.thumbnail_size, self.thumbnail_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(scaled_key, scaled_pixmap)
+        return scaled_pixmap
 
     def _extract_version_from_path(self, file_path):
         """从文件路径提取版本信息"""
         if not file_path:
             return "未知版本"
 
-        from cx_project_manager.utils.utils import extract_version_string_from_filename
         stem = Path(file_path).stem
-        version_str = extract_version_string_from_filename(stem)
+        version_str = _extract_version_string(stem)
         return version_str if version_str else "v0"
 
     def _get_file_size(self, file_path):
-        """获取文件大小"""
-        if not file_path or not Path(file_path).exists():
+        """获取文件大小，显示提示时才 stat，保证覆盖写入后大小仍然准确（文件不存在时返回空字符串）"""
+        if not file_path:
             return ""
 
         try:
-            size_bytes = Path(file_path).stat().st_size
-            if size_bytes < UI_CONSTANTS['bytes_per_kb']:
-                return f"{size_bytes} B"
-            elif size_bytes < UI_CONSTANTS['bytes_per_mb']:
-                return f"{size_bytes / UI_CONSTANTS['bytes_per_kb']:.1f} KB"
-            elif size_bytes < UI_CONSTANTS['bytes_per_gb']:
-                return f"{size_bytes / UI_CONSTANTS['bytes_per_mb']:.1f} MB"
-            else:
-                return f"{size_bytes / UI_CONSTANTS['bytes_per_gb']:.1f} GB"
-        except:
+            size_bytes = os.stat(file_path).st_size
+        except OSError:
             return ""
 
+        for threshold, unit in _SIZE_UNITS:
+            if size_bytes >= threshold:
+                return f"{size_bytes / threshold:.1f} {unit}"
+        return f"{size_bytes} B"
+
     def _get_version_label(self, version_str: str) -> str:
         """根据版本号生成显示标签"""
         return self.get_version_label(version_str)
@@ -332,36 +762,62 @@ class CutTreeWidget(QTreeWidget):
         self.current_hover_pos = QPoint()
         self.hover_enabled = True  # 悬浮功能启用状态
 
+        # 鼠标移动节流：约一帧处理一次，只处理最后一次的位置
+        self._pending_pos = QPoint()
+        self._pending_global_pos = QPoint()
+        self._last_processed_pos = None
+        # 上一次处理时鼠标下的条目（含非Cut项），用于避免重复发送隐藏信号
+        self._last_hover_target = None
+        self._move_throttle = QTimer(self)
+        self._move_throttle.setInterval(16)
+        self._move_throttle.setSingleShot(True)
+        self._move_throttle.timeout.connect(self._process_move)
+
     def mouseMoveEvent(self, event):
-        """鼠标移动事件"""
+        """鼠标移动事件：只记录位置，由节流定时器统一处理"""
         super().mouseMoveEvent(event)
 
         # 如果悬浮功能被禁用，直接返回
         if not self.hover_enabled:
             return
 
-        item = self.itemAt(event.pos())
-        if item != self.current_hover_item:
-            # 先清除之前的悬浮状态
-            self._clear_hover()
+        self._pending_pos = event.pos()
+        self._pending_global_pos = event.globalPos()
+        if not self._move_throttle.isActive():
+            self._move_throttle.start()
+
+    def _process_move(self):
+        """处理最近一次鼠标位置"""
+        if not self.hover_enabled or self._pending_pos == self._last_processed_pos:
+            return
+        self._last_processed_pos = QPoint(self._pending_pos)
+
+        item = self.itemAt(self._pending_pos)
+        if item is self._last_hover_target:
+            return
+        self._last_hover_target = item
 
-            if item:
-                # 检查是否是Cut项（有UserRole数据）
-                cut_data = item.data(0, Qt.UserRole)
-                if cut_data:
-                    self.current_hover_item = item
-                    self.current_hover_pos = event.globalPos()
-                    self.hover_timer.start(UI_CONSTANTS['hover_delay_ms'])
-                else:
-                    # 如果是Episode项，发送信号隐藏tooltip
-                    self.mouse_left.emit()
+        # 先清除之前的悬浮状态
+        self._clear_hover()
+
+        if item:
+            # 检查是否是Cut项（有UserRole数据）
+            cut_data = item.data(0, Qt.UserRole)
+            if cut_data:
+                self.current_hover_item = item
+                self.current_hover_pos = QPoint(self._pending_global_pos)
+                self.hover_timer.start(UI_CONSTANTS['hover_delay_ms'])
             else:
-                # 鼠标移动到空白区域
+                # 如果是Episode项，发送信号隐藏tooltip
                 self.mouse_left.emit()
+        else:
+            # 鼠标移动到空白区域
+            self.mouse_left.emit()
 
     def leaveEvent(self, event):
         """鼠标离开事件"""
         super().leaveEvent(event)
+        self._reset_move_state()
         self._clear_hover()
         self.mouse_left.emit()
 
@@ -375,9 +831,16 @@ class CutTreeWidget(QTreeWidget):
         self.hover_timer.stop()
         self.current_hover_item = None
 
+    def _reset_move_state(self):
+        """丢弃尚未处理的鼠标移动，下次移动时重新判断"""
+        self._move_throttle.stop()
+        self._last_processed_pos = None
+        self._last_hover_target = None
+
     def set_hover_enabled(self, enabled: bool):
         """设置悬浮功能启用状态"""
         self.hover_enabled = enabled
+        self._reset_move_state()
 
         if not enabled:
             # 如果禁用悬浮，清除当前状态并发送隐藏信号
@@ -394,97 +857,106 @@ class StatGroupBox(QGroupBox):
     """深色主题统计分组框"""
 
     def __init__(self, title: str, parent=None):
+        # 样式由对话框样式表按类名统一匹配
         super().__init__(title, parent)
-        self.setStyleSheet("""
-            QGroupBox {
-                font-size: 16px;
-                font-weight: bold;
-                color: #4FC3F7;
-                border: 1px solid #3a3a3a;
-                border-radius: 8px;
-                margin-top: 12px;
-                padding-top: 15px;
-                background-color: #2a2a2a;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 10px 0 10px;
-            }
-        """)
-
-
-class StatRow(QWidget):
-    """统计行组件"""
+
+
+class StatRow(QLabel):
+    """统计行组件：单个 QLabel 以富文本绘制「标签 …… 数值」，不再为每行创建布局和两个子控件"""
 
     def __init__(self, label: str, value: str, value_color: str = None, parent=None):
         if value_color is None:
             value_color = THEME_COLORS['text_white']
         super().__init__(parent)
-        self.setStyleSheet(f"background-color: {THEME_COLORS['transparent']};")
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(15, 5, 15, 5)
-
-        label_widget = QLabel(label)
-        label_widget.setStyleSheet(f"""
-            color: {THEME_COLORS['text_gray']};
-            font-size: 14px;
-            background-color: {THEME_COLORS['transparent']};
-        """)
-
-        value_widget = QLabel(value)
-        value_widget.setStyleSheet(f"""
-            font-weight: bold;
-            font-size: 15px;
-            color: {value_color};
-            background-color: {THEME_COLORS['transparent']};
-        """)
-
-        layout.addWidget(label_widget)
-        layout.addStretch()
-        layout.addWidget(value_widget)
+        # 背景样式由对话框样式表按 role 属性统一匹配
+        self.setProperty("role", "stat-row")
+        self.setTextFormat(Qt.RichText)
+        self.setContentsMargins(15, 5, 15, 5)
+        self.setText(_STAT_ROW_HTML.format(
+            label=html.escape(label), value=html.escape(value), color=value_color
+        ))
 
 
 class StorageBarWidget(QWidget):
     """深色主题存储空间可视化条形图"""
 
+    # 绘制用颜色只解析一次
+    _BG_COLOR = QColor(THEME_COLORS['bg_dark'])
+    _LATEST_COLOR = QColor(THEME_COLORS['primary_blue'])
+    _OLD_COLOR = QColor(THEME_COLORS['old_orange'])
+    # 文字字体在首次绘制时创建（需要 QApplication 已存在）
+    _text_font = None
+
     def __init__(self, latest_mb: float, old_mb: float, total_mb: float, parent=None):
         super().__init__(parent)
         self.latest_mb = latest_mb
         self.old_mb = old_mb
         self.total_mb = max(total_mb, 0.1)
+        # 渲染好的条形图，尺寸变化时失效
+        self._cache: Optional[QPixmap] = None
         self.setFixedHeight(25)
-        self.setStyleSheet(f"background-color: {THEME_COLORS['transparent']};")
+        self.setProperty("role", "transparent")
+
+    def resizeEvent(self, event):
+        # 尺寸变化后重新生成缓存
+        self._cache = None
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
+        if self.width() - 30 <= 0:  # 留出边距后没有可绘制区域
+            return
+
+        # 条形图内容在构造后不再变化，只在首次绘制或尺寸变化时渲染一次
+        if self._cache is None:
+            self._cache = self._render_bar()
+
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache)
+
+    def _render_bar(self) -> QPixmap:
+        """将条形图渲染到与控件同尺寸的 QPixmap（考虑高分屏缩放）"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
 
         width = self.width() - 30  # 留出边距
         height = self.height()
         x_offset = 15
 
-        # 计算比例
-        latest_percent = (self.latest_mb / self.total_mb)
-        old_percent = (self.old_mb / self.total_mb)
-
         # 背景
-        painter.fillRect(x_offset, 0, width, height, QColor(THEME_COLORS['bg_dark']))
+        painter.fillRect(x_offset, 0, width, height, self._BG_COLOR)
+
+        # 没有数据时只绘制背景
+        if self.latest_mb > 0 or self.old_mb > 0:
+            self._draw_segments(painter, x_offset, width, height)
+
+        painter.end()
+        return pixmap
 
+    def _draw_segments(self, painter: QPainter, x_offset: int, width: int, height: int):
+        """绘制最新/旧版本两段及其文字"""
         # 最新版本部分（蓝色）
-        latest_width = int(width * latest_percent)
-        painter.fillRect(x_offset, 0, latest_width, height, QColor(THEME_COLORS['primary_blue']))
+        latest_width = int(width * (self.latest_mb / self.total_mb))
+        painter.fillRect(x_offset, 0, latest_width, height, self._LATEST_COLOR)
 
         # 旧版本部分（橙色）
-        old_width = int(width * old_percent)
-        painter.fillRect(x_offset + latest_width, 0, old_width, height, QColor(THEME_COLORS['old_orange']))
+        old_width = int(width * (self.old_mb / self.total_mb))
+        painter.fillRect(x_offset + latest_width, 0, old_width, height, self._OLD_COLOR)
 
         # 绘制文字（如果空间足够）
+        if latest_width <= 40 and old_width <= 40:
+            return
+
         painter.setPen(Qt.white)
-        font = painter.font()
-        font.setPixelSize(11)
-        painter.setFont(font)
+        if StorageBarWidget._text_font is None:
+            font = painter.font()
+            font.setPixelSize(11)
+            StorageBarWidget._text_font = font
+        painter.setFont(self._text_font)
 
         if latest_width > 40:
             painter.drawText(x_offset, 0, latest_width, height,
@@ -500,6 +972,26 @@ class StorageBarWidget(QWidget):
 class ProjectStatisticsDialog(QDialog):
     """项目综合统计对话框 - Tab布局"""
 
+    # 正在后台计算项目体积的任务，以及计算完成后的结果（MB）
+    _size_worker = None
+    _project_size_mb: Optional[float] = None
+
+    # Cut悬浮提示框，随Cut详情Tab创建，之后一直复用
+    tooltip_widget = None
+
+    # 懒加载：尚未加载的分组 {分组键: 任务列表}，以及正在加载的 (分组键, 任务列表)
+    _pending_groups: Optional[dict] = None
+    _loading_group: Optional[tuple] = None
+    # 等待加载的分组 [(分组键, 任务列表)]，以及仅在Cut很多时创建的进度对话框
+    _queued_groups: Optional[list] = None
+    progress_dialog: Optional[QProgressDialog] = None
+    # 当前分组的加载线程，结束或取消后置空
+    loader_thread: Optional['CutDataLoader'] = None
+
+    # Cut详情Tab的位置与标题
+    CUT_TAB_INDEX = 1
+    CUT_TAB_TITLE = "🎬 Cut详情"
+
     def __init__(self, project_config: dict, version_stats: dict, project_base: Path, parent=None):
         super().__init__(parent)
         self.project_config = project_config
@@ -507,32 +999,11 @@ class ProjectStatisticsDialog(QDialog):
         self.project_base = project_base
         self.setWindowTitle("项目统计")
         self.setMinimumSize(UI_CONSTANTS['dialog_min_width'], UI_CONSTANTS['dialog_min_height'])
-        self.setStyleSheet(f"""
-            QDialog {{
-                background-color: {THEME_COLORS['bg_dark']};
-            }}
-            QLabel {{
-                font-family: "MiSans", "Microsoft YaHei", sans-serif;
-                color: {THEME_COLORS['text_white']};
-            }}
-            QScrollArea {{
-                background-color: {THEME_COLORS['transparent']};
-                border: none;
-            }}
-            QScrollBar:vertical {{
-                background-color: {THEME_COLORS['bg_medium']};
-                width: 10px;
-                border-radius: 5px;
-            }}
-            QScrollBar::handle:vertical {{
-                background-color: {THEME_COLORS['bg_lighter']};
-                border-radius: 5px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{
-                background-color: {THEME_COLORS['bg_lightest']};
-            }}
-        """)
+        # 整个对话框只安装一次样式表，子控件按 objectName / role 匹配
+        self.setStyleSheet(_DIALOG_QSS)
+
+        # 缩略图缓存上限（KB）；只放大不缩小，文件列表图标共用同一个缓存
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), UI_CONSTANTS['pixmap_cache_limit_kb']))
 
         self.setup_ui()
 
@@ -546,39 +1017,19 @@ class ProjectStatisticsDialog(QDialog):
 
         # 创建Tab控件
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet(f"""
-            QTabWidget::pane {{
-                border: 1px solid {THEME_COLORS['bg_light']};
-                background-color: {THEME_COLORS['bg_dark']};
-            }}
-            QTabBar::tab {{
-                background-color: {THEME_COLORS['bg_medium']};
-                color: {THEME_COLORS['text_white']};
-                padding: 10px 20px;
-                margin-right: 2px;
-                border: 1px solid {THEME_COLORS['bg_light']};
-                border-bottom: none;
-            }}
-            QTabBar::tab:selected {{
-                background-color: {THEME_COLORS['primary_blue']};
-                color: {THEME_COLORS['bg_dark']};
-                font-weight: bold;
-            }}
-            QTabBar::tab:hover {{
-                background-color: {THEME_COLORS['bg_light']};
-            }}
-        """)
+        self.tab_widget.setObjectName("statisticsTabs")
 
         # Tab 1: 项目概览
         overview_widget = self.create_overview_tab()
         self.tab_widget.addTab(overview_widget, "📊 项目概览")
 
-        # Tab 2: Cut详情
-        cut_details_widget = self.create_cut_details_tab()
-        self.tab_widget.addTab(cut_details_widget, "🎬 Cut详情")
+        # Tab 2: Cut详情（大项目中构建代价较高，首次切换到该页时才创建）
+        self._cut_tab_built = False
+        self.tab_widget.addTab(QWidget(), self.CUT_TAB_TITLE)
+        self.tab_widget.currentChanged.connect(self._maybe_build_cut_tab)
 
-        # 默认显示Cut详情Tab
-        self.tab_widget.setCurrentIndex(1)
+        # 默认显示项目概览Tab
+        self.tab_widget.setCurrentIndex(0)
 
         main_layout.addWidget(self.tab_widget)
 
@@ -586,31 +1037,13 @@ class ProjectStatisticsDialog(QDialog):
         button_layout = QHBoxLayout()
         button_layout.setContentsMargins(0, 10, 0, 0)
 
-        # 显示项目总体积
-        total_size_gb = self.calculate_project_size() / UI_CONSTANTS['bytes_per_kb']
-        size_label = QLabel(f"项目总体积: {total_size_gb:.2f} GB")
-        size_label.setStyleSheet("""
-            font-size: 16px;
-            font-weight: bold;
-            color: #4FC3F7;
-            background-color: transparent;
-        """)
+        # 显示项目总体积（在线程池中计算，完成后再填入）
+        self.size_label = size_label = QLabel("项目总体积: 计算中…")
+        size_label.setObjectName("projectSizeLabel")
 
         close_btn = QPushButton("关闭")
         close_btn.setFixedSize(UI_CONSTANTS['close_button_width'], UI_CONSTANTS['close_button_height'])
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #4FC3F7;
-                color: #1a1a1a;
-                border: none;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #29B6F6;
-            }
-        """)
+        close_btn.setObjectName("closeButton")
         close_btn.clicked.connect(self.accept)
 
         button_layout.addWidget(size_label)
@@ -619,30 +1052,73 @@ class ProjectStatisticsDialog(QDialog):
 
         main_layout.addLayout(button_layout)
 
-    def closeEvent(self, event):
-        """对话框关闭事件"""
-        # 清理加载线程
-        if hasattr(self, 'loader_thread') and self.loader_thread.isRunning():
-            self.loader_thread.terminate()
-            self.loader_thread.wait()
-            self.loader_thread.deleteLater()
+        self._start_project_size_worker()
+
+    def _start_project_size_worker(self):
+        """在后台计算项目总体积，对话框无需等待目录遍历即可显示"""
+        # 最近打开过同一项目时直接使用缓存结果
+        if self.project_base:
+            cached_mb = _get_cached_project_size(self.project_base)
+            if cached_mb is not None:
+                self._on_project_size_ready(cached_mb)
+                return
+
+        worker = _ProjectSizeWorker(self.project_base)
+        worker.signals.finished.connect(self._on_project_size_ready, Qt.QueuedConnection)
+        self._size_worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_project_size_ready(self, size_mb: float):
+        """项目总体积计算完成"""
+        self._size_worker = None
+        # 记录结果，之后调用 calculate_project_size 不再遍历
+        self._project_size_mb = size_mb
+        total_size_gb = size_mb / UI_CONSTANTS['bytes_per_kb']
+        self.size_label.setText(f"项目总体积: {total_size_gb:.2f} GB")
+
+    def _maybe_build_cut_tab(self, index: int):
+        """切换到Cut详情Tab时，用真正的内容替换占位页"""
+        if index != self.CUT_TAB_INDEX or self._cut_tab_built:
+            return
+        # 先置位，removeTab/insertTab 再次触发 currentChanged 时直接返回
+        self._cut_tab_built = True
+
+        placeholder = self.tab_widget.widget(self.CUT_TAB_INDEX)
+        cut_details_widget = self.create_cut_details_tab()
+        self.tab_widget.removeTab(self.CUT_TAB_INDEX)
+        self.tab_widget.insertTab(self.CUT_TAB_INDEX, cut_details_widget, self.CUT_TAB_TITLE)
+        self.tab_widget.setCurrentIndex(self.CUT_TAB_INDEX)
+        placeholder.deleteLater()
+
+    def done(self, result: int):
+        """
+        对话框结束（关闭按钮的 accept、Esc 的 reject 以及标题栏关闭都会经过这里）
+        对话框由 exec_() 打开且不会被销毁，必须在此停止后台任务
+        """
+        self._stop_background_work()
+        super().done(result)
+
+    def _stop_background_work(self):
+        """停止加载线程和体积计算，关闭进度对话框与tooltip"""
+        # 清理加载线程，排队中的分组不再加载
+        self._queued_groups = []
+        self._stop_loader_thread()
+
+        # 停止仍在进行的项目体积计算
+        if self._size_worker is not None:
+            self._size_worker.cancel()
+            self._size_worker = None
 
         # 关闭进度对话框
-        if hasattr(self, 'progress_dialog'):
-            self.progress_dialog.close()
+        self._close_loading_feedback()
 
-        # 隐藏tooltip
-        if hasattr(self, 'tooltip_widget') and self.tooltip_widget:
-            self.tooltip_widget.hide()
-            self.tooltip_widget.deleteLater()
-            self.tooltip_widget = None
-
-        super().closeEvent(event)
+        # 隐藏tooltip（作为子窗口随对话框一起销毁）
+        self._hide_tooltip()
 
     def create_overview_tab(self) -> QWidget:
         """创建项目概览Tab"""
         tab = QWidget()
-        tab.setStyleSheet("background-color: transparent;")
+        tab.setProperty("role", "transparent")
         layout = QHBoxLayout(tab)
         layout.setSpacing(20)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -660,7 +1136,7 @@ class ProjectStatisticsDialog(QDialog):
     def create_project_stats_panel(self) -> QWidget:
         """创建项目统计面板"""
         panel = QWidget()
-        panel.setStyleSheet("background-color: transparent;")
+        panel.setProperty("role", "transparent")
         layout = QVBoxLayout(panel)
         layout.setSpacing(15)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -688,20 +1164,21 @@ class ProjectStatisticsDialog(QDialog):
         episode_layout = QVBoxLayout(episode_group)
         episode_layout.setSpacing(5)
 
+        # Episode 数与其中的 Cut 总数只计算一次，两种模式共用
         episodes = self.project_config.get("episodes", {})
+        episode_count = len(episodes)
+        episode_cut_total = sum(map(len, episodes.values()))
 
         if self.project_config.get("no_episode", False):
             cuts = self.project_config.get("cuts", [])
             episode_layout.addWidget(StatRow("根目录 Cut 数", str(len(cuts))))
 
             if episodes:
-                special_count = sum(len(cuts) for cuts in episodes.values())
-                episode_layout.addWidget(StatRow("特殊 Episode 数", str(len(episodes)), THEME_COLORS['warning_orange']))
-                episode_layout.addWidget(StatRow("特殊 Episode 内 Cut 数", str(special_count)))
+                episode_layout.addWidget(StatRow("特殊 Episode 数", str(episode_count), THEME_COLORS['warning_orange']))
+                episode_layout.addWidget(StatRow("特殊 Episode 内 Cut 数", str(episode_cut_total)))
         else:
-            total_cuts = sum(len(cuts) for cuts in episodes.values())
-            episode_layout.addWidget(StatRow("Episode 总数", str(len(episodes))))
-            episode_layout.addWidget(StatRow("Cut 总数", str(total_cuts), THEME_COLORS['success_green']))
+            episode_layout.addWidget(StatRow("Episode 总数", str(episode_count)))
+            episode_layout.addWidget(StatRow("Cut 总数", str(episode_cut_total), THEME_COLORS['success_green']))
 
         layout.addWidget(episode_group)
 
@@ -729,42 +1206,42 @@ class ProjectStatisticsDialog(QDialog):
             reuse_layout = QVBoxLayout(reuse_group)
             reuse_layout.setSpacing(5)
 
-            total_reuse_cuts = sum(len(cut["cuts"]) for cut in reuse_cuts)
+            total_reuse_cuts = sum(map(len, (cut["cuts"] for cut in reuse_cuts)))
             reuse_layout.addWidget(StatRow("兼用卡数量", str(len(reuse_cuts)), THEME_COLORS['purple']))
             reuse_layout.addWidget(StatRow("兼用 Cut 总数", str(total_reuse_cuts)))
 
             layout.addWidget(reuse_group)
 
         # Episode详情（小于18集时显示，分3栏）
-        if episodes and len(episodes) <= 18:
+        if episodes and episode_count <= 18:
             detail_group = StatGroupBox("📄 Episode 详情")
-            detail_widget = QWidget()
-            detail_widget.setStyleSheet("background-color: transparent;")
-            detail_grid = QGridLayout(detail_widget)
-            detail_grid.setContentsMargins(15, 10, 15, 10)
-            detail_grid.setSpacing(10)
-
-            sorted_episodes = sorted(episodes.keys())
             items_per_column = 6  # 每栏6个，3栏共18个
 
-            for idx, ep_id in enumerate(sorted_episodes):
-                row = idx % items_per_column
-                col = idx // items_per_column
-
-                cut_count = len(episodes[ep_id])
-                text = f"{ep_id}: {cut_count} cuts" if cut_count > 0 else f"{ep_id}: (空)"
-
-                detail_label = QLabel(text)
-                detail_label.setStyleSheet("""
-                    color: #ccc; 
-                    font-size: 13px;
-                    background-color: transparent;
-                """)
-
-                detail_grid.addWidget(detail_label, row, col)
+            texts = []
+            for ep_id, ep_cuts in sorted(episodes.items()):
+                cut_count = len(ep_cuts)
+                texts.append(f"{ep_id}: {cut_count} cuts" if cut_count > 0 else f"{ep_id}: (空)")
+
+            # 用一个 QLabel 的 HTML 表格代替网格中的多个 QLabel，按列优先排列
+            column_count = (len(texts) + items_per_column - 1) // items_per_column
+            rows_html = []
+            for row in range(min(items_per_column, len(texts))):
+                cells = []
+                for col in range(column_count):
+                    idx = col * items_per_column + row
+                    cells.append(f"<td>{html.escape(texts[idx])}</td>" if idx < len(texts) else "<td></td>")
+                rows_html.append(f"<tr>{''.join(cells)}</tr>")
+
+            detail_label = QLabel(
+                "<table width='100%' cellspacing='10' cellpadding='0'>"
+                f"{''.join(rows_html)}</table>"
+            )
+            detail_label.setTextFormat(Qt.RichText)
+            detail_label.setContentsMargins(5, 0, 5, 0)
+            detail_label.setProperty("role", "episode-detail")
 
             detail_group_layout = QVBoxLayout(detail_group)
-            detail_group_layout.addWidget(detail_widget)
+            detail_group_layout.addWidget(detail_label)
 
             layout.addWidget(detail_group)
 
@@ -775,7 +1252,7 @@ class ProjectStatisticsDialog(QDialog):
     def create_version_stats_panel(self) -> QWidget:
         """创建版本统计面板"""
         panel = QWidget()
-        panel.setStyleSheet("background-color: transparent;")
+        panel.setProperty("role", "transparent")
         layout = QVBoxLayout(panel)
         layout.setSpacing(15)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -844,23 +1321,23 @@ class ProjectStatisticsDialog(QDialog):
 
         # 图例
         legend_widget = QWidget()
-        legend_widget.setStyleSheet(f"background-color: {THEME_COLORS['transparent']};")
+        legend_widget.setProperty("role", "transparent")
         legend_layout = QHBoxLayout(legend_widget)
         legend_layout.setContentsMargins(15, 5, 15, 5)
 
         # 最新版本图例
         latest_icon = QLabel()
         latest_icon.setFixedSize(12, 12)
-        latest_icon.setStyleSheet(f"background-color: {THEME_COLORS['primary_blue']}; border-radius: 2px;")
+        latest_icon.setPixmap(_color_swatch(THEME_COLORS['primary_blue']))
         latest_label = QLabel("最新版本")
-        latest_label.setStyleSheet(f"color: {THEME_COLORS['text_gray']}; font-size: 12px; background-color: {THEME_COLORS['transparent']};")
+        latest_label.setProperty("role", "legend-label")
 
         # 历史版本图例
         old_icon = QLabel()
         old_icon.setFixedSize(12, 12)
-        old_icon.setStyleSheet(f"background-color: {THEME_COLORS['old_orange']}; border-radius: 2px;")
+        old_icon.setPixmap(_color_swatch(THEME_COLORS['old_orange']))
         old_label = QLabel("历史版本")
-        old_label.setStyleSheet(f"color: {THEME_COLORS['text_gray']}; font-size: 12px; background-color: {THEME_COLORS['transparent']};")
+        old_label.setProperty("role", "legend-label")
 
         legend_layout.addWidget(latest_icon)
         legend_layout.addWidget(latest_label)
@@ -882,25 +1359,30 @@ class ProjectStatisticsDialog(QDialog):
         return panel
 
     def calculate_project_size(self) -> float:
-        """计算项目总大小（MB）"""
-        if not hasattr(self.parent(), 'project_base') or not self.parent().project_base:
+        """计算项目总大小（MB），对话框生命周期内只遍历一次"""
+        if self._project_size_mb is not None:
+            return self._project_size_mb
+
+        # 使用构造时传入的项目路径，不再依赖 parent()
+        if not self.project_base:
             return 0.0
 
-        total_size = 0
-        for root, dirs, files in os.walk(self.parent().project_base):
-            for file in files:
-                try:
-                    file_path = os.path.join(root, file)
-                    total_size += os.path.getsize(file_path)
-                except:
-                    continue
+        cached_mb = _get_cached_project_size(self.project_base)
+        if cached_mb is not None:
+            return cached_mb
+
+        # scandir 遍历，直接使用 DirEntry 缓存的 stat 结果，不跟随符号链接
+        total_size = get_dir_size_parallel(self.project_base)
 
-        return total_size / UI_CONSTANTS['bytes_per_mb']  # 转换为MB
+        size_mb = total_size / UI_CONSTANTS['bytes_per_mb']  # 转换为MB
+        _store_project_size(self.project_base, size_mb)
+        self._project_size_mb = size_mb
+        return size_mb
 
     def create_cut_details_tab(self) -> QWidget:
         """创建Cut详情Tab"""
         tab = QWidget()
-        tab.setStyleSheet(f"background-color: {THEME_COLORS['transparent']};")
+        tab.setProperty("role", "transparent")
         layout = QVBoxLayout(tab)
         layout.setContentsMargins(0, 0, 0, 0)
 
@@ -911,30 +1393,7 @@ class ProjectStatisticsDialog(QDialog):
         # 悬浮预览开关
         self.hover_preview_checkbox = QCheckBox("启用悬浮预览")
         self.hover_preview_checkbox.setChecked(True)  # 默认启用
-        self.hover_preview_checkbox.setStyleSheet(f"""
-            QCheckBox {{
-                color: {THEME_COLORS['text_white']};
-                font-size: 14px;
-                spacing: 8px;
-            }}
-            QCheckBox::indicator {{
-                width: 16px;
-                height: 16px;
-                border: 2px solid {THEME_COLORS['bg_lighter']};
-                border-radius: 3px;
-                background-color: {THEME_COLORS['bg_medium']};
-            }}
-            QCheckBox::indicator:checked {{
-                background-color: {THEME_COLORS['primary_blue']};
-                border: 2px solid {THEME_COLORS['primary_blue']};
-            }}
-            QCheckBox::indicator:checked::after {{
-                content: "✓";
-                color: {THEME_COLORS['bg_dark']};
-                font-weight: bold;
-                font-size: 12px;
-            }}
-        """)
+        self.hover_preview_checkbox.setObjectName("hoverPreviewCheckbox")
         self.hover_preview_checkbox.stateChanged.connect(self._on_hover_preview_toggled)
 
         control_layout.addWidget(self.hover_preview_checkbox)
@@ -944,14 +1403,15 @@ class ProjectStatisticsDialog(QDialog):
 
         # 创建树形控件
         self.cut_tree = CutTreeWidget()
+        self.cut_tree.setObjectName("cutTree")
         self.cut_tree.setHeaderLabels(['Cut', 'AEP版本', 'MOV版本', 'AEP路径', 'MOV路径'])
         self.cut_tree.setAlternatingRowColors(True)
         self.cut_tree.setRootIsDecorated(True)
         self.cut_tree.setIndentation(20)
         self.cut_tree.itemDoubleClicked.connect(self._on_cut_item_double_clicked)
 
-        # tooltip widget将根据需要动态创建
-        self.tooltip_widget = None
+        # tooltip widget只创建一次，悬浮时仅更新内容和位置
+        self.tooltip_widget = CutTooltipWidget(self)
 
         # 连接鼠标事件
         self.cut_tree.item_hovered.connect(self._on_item_hovered)
@@ -969,35 +1429,6 @@ class ProjectStatisticsDialog(QDialog):
         header.setSectionResizeMode(3, QHeaderView.Stretch)  # AEP路径列拉伸
         header.setSectionResizeMode(4, QHeaderView.Stretch)  # MOV路径列拉伸
 
-        # 设置样式
-        self.cut_tree.setStyleSheet(f"""
-            QTreeWidget {{
-                background-color: {THEME_COLORS['bg_medium']};
-                color: {THEME_COLORS['text_white']};
-                border: 1px solid {THEME_COLORS['bg_light']};
-                font-family: "MiSans", "Microsoft YaHei", sans-serif;
-                font-size: 13px;
-            }}
-            QTreeWidget::item {{
-                height: 32px;
-                padding: 4px;
-            }}
-            QTreeWidget::item:selected {{
-                background-color: {THEME_COLORS['primary_blue']};
-                color: {THEME_COLORS['bg_dark']};
-            }}
-            QTreeWidget::item:hover {{
-                background-color: {THEME_COLORS['bg_disabled']};
-            }}
-            QHeaderView::section {{
-                background-color: {THEME_COLORS['bg_light']};
-                color: {THEME_COLORS['text_white']};
-                padding: 8px;
-                border: 1px solid {THEME_COLORS['bg_lighter']};
-                font-weight: bold;
-            }}
-        """)
-
         layout.addWidget(self.cut_tree)
 
         # 填充cut数据
@@ -1007,58 +1438,135 @@ class ProjectStatisticsDialog(QDialog):
 
     def _populate_cut_data(self):
         """填充Cut数据"""
-        # 计算总数以决定是否显示进度条
-        episodes = self.project_config.get("episodes", {})
-        total_cuts = 0
-
-        if self.project_config.get("no_episode", False):
-            cuts = self.project_config.get("cuts", [])
-            total_cuts += len(cuts)
-            for ep_cuts in episodes.values():
-                total_cuts += len(ep_cuts)
-        else:
-            for ep_cuts in episodes.values():
-                total_cuts += len(ep_cuts)
+        # 分组和Cut总数只计算一次，同步与懒加载两条路径共用
+        groups = _collect_cut_groups(self.project_config)
+        total_cuts = sum(len(cut_ids) for _, _, cut_ids in groups)
 
         # 如果Cut数量较少，直接同步加载
-        if total_cuts < 20:
-            self._populate_cut_data_sync()
+        if total_cuts < UI_CONSTANTS['sync_load_max_cuts']:
+            self._begin_bulk_tree_update()
+            try:
+                self._populate_cut_data_sync(groups)
+            finally:
+                self._end_bulk_tree_update()
         else:
-            self._populate_cut_data_async()
-
-    def _populate_cut_data_sync(self):
+            # 只创建分组节点；各分组展开时再加载，批量模式由加载过程自行管理
+            self._populate_cut_data_async(groups)
+
+    # 自适应内容宽度的列，批量填充时临时固定宽度
+    _AUTO_SIZED_COLUMNS = (0, 1, 2)
+
+    def _begin_bulk_tree_update(self):
+        """批量填充前暂停重绘、信号和逐项的列宽计算"""
+        tree = self.cut_tree
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
+        header = tree.header()
+        for column in self._AUTO_SIZED_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.Fixed)
+
+    def _end_bulk_tree_update(self):
+        """批量填充结束后恢复列宽自适应，并统一重绘一次"""
+        tree = self.cut_tree
+        header = tree.header()
+        for column in self._AUTO_SIZED_COLUMNS:
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        tree.blockSignals(False)
+        tree.setUpdatesEnabled(True)
+        tree.viewport().update()
+
+    def _populate_cut_data_sync(self, groups: list):
         """同步填充Cut数据（适用于小项目）"""
-        episodes = self.project_config.get("episodes", {})
+        project_root = os.fspath(self.project_base)
+        for parent_key, episode_id, cut_ids in groups:
+            group_item = QTreeWidgetItem(self.cut_tree, [_group_label(parent_key), "", "", "", ""])
+            # 同一分组的缩略图目录只检查一次
+            thumbnail_index = FileUtils.build_thumbnail_index(project_root, episode_id)
+            for cut_id in cut_ids:
+                self._add_cut_item(group_item, cut_id, episode_id, thumbnail_index)
+
+        # 全部填充后一次性展开，避免逐项展开时反复重新布局
+        self.cut_tree.expandAll()
+
+    # 分组节点上保存分组键的数据角色（Qt.UserRole 留给Cut项的文件信息）
+    GROUP_KEY_ROLE = Qt.UserRole + 1
+
+    def _populate_cut_data_async(self, groups: list):
+        """
+        懒加载Cut数据（适用于大项目）
+        只创建分组节点，展开某个分组时才扫描其中的Cut；只有一个分组时直接展开
+        """
+        self.episode_items = {}
+        self._pending_groups = {}
+        self._queued_groups = []
+        for parent_key, episode_id, cut_ids in groups:
+            group_item = QTreeWidgetItem(self.cut_tree, [_group_label(parent_key), "", "", "", ""])
+            group_item.setData(0, self.GROUP_KEY_ROLE, parent_key)
+            if cut_ids:
+                # 子项尚未创建，仍显示展开箭头
+                group_item.setChildIndicatorPolicy(QTreeWidgetItem.ShowIndicator)
+                self._pending_groups[parent_key] = [(parent_key, cut_id, episode_id) for cut_id in cut_ids]
+            self.episode_items[parent_key] = group_item
+
+        self.cut_tree.itemExpanded.connect(self._on_group_expanded)
+
+        if len(self.episode_items) == 1:
+            next(iter(self.episode_items.values())).setExpanded(True)
+
+    def _on_group_expanded(self, item: QTreeWidgetItem):
+        """分组首次展开时加载其中的Cut"""
+        parent_key = item.data(0, self.GROUP_KEY_ROLE)
+        tasks = self._pending_groups.pop(parent_key, None) if parent_key else None
+        if not tasks:
+            return
+        # 不显示模态进度框时仍可展开其他分组，排队等待当前分组加载完成
+        if self._loading_group is not None:
+            self._queued_groups.append((parent_key, tasks))
+        else:
+            self._load_group_async(parent_key, tasks)
 
-        if self.project_config.get("no_episode", False):
-            # 单集模式
-            cuts = self.project_config.get("cuts", [])
-            if cuts:
-                root_item = QTreeWidgetItem(self.cut_tree, ["根目录", "", "", "", ""])
-                root_item.setExpanded(True)
-                for cut_id in cuts:
-                    self._add_cut_item(root_item, cut_id, None)
-
-            # 处理特殊episode
-            for ep_id in episodes:
-                ep_cuts = episodes[ep_id]
-                if ep_cuts:
-                    ep_item = QTreeWidgetItem(self.cut_tree, [ep_id, "", "", "", ""])
-                    ep_item.setExpanded(True)
-                    for cut_id in ep_cuts:
-                        self._add_cut_item(ep_item, cut_id, ep_id)
+    def _load_group_async(self, parent_key: str, tasks: list):
+        """在后台线程中扫描一个分组的Cut，Cut很多时显示进度对话框，否则在Tab标题上显示进度"""
+        self._loading_group = (parent_key, tasks)
+
+        self.loader_thread = CutDataLoader(self.project_config, self.project_base, tasks)
+        self.loader_thread.cut_batch_ready.connect(self._add_cut_batch_async)
+        self.loader_thread.finished.connect(self._on_loading_finished)
+
+        if len(tasks) >= UI_CONSTANTS['progress_dialog_min_cuts']:
+            # 模态加载期间保持批量模式，加载结束或取消时恢复
+            self._begin_bulk_tree_update()
+            self._show_progress_dialog()
         else:
-            # Episode模式
-            for ep_id in sorted(episodes.keys()):
-                ep_cuts = episodes[ep_id]
-                ep_item = QTreeWidgetItem(self.cut_tree, [ep_id, "", "", "", ""])
-                ep_item.setExpanded(True)
-                for cut_id in ep_cuts:
-                    self._add_cut_item(ep_item, cut_id, ep_id)
-
-    def _populate_cut_data_async(self):
-        """异步填充Cut数据（适用于大项目）"""
-        # 创建进度对话框
+            # 非模态加载时树仍可交互，只在添加每一批时进入批量模式
+            self.progress_dialog = None
+            self.loader_thread.progress_updated.connect(self._show_tab_progress)
+            self._show_tab_progress(0)
+
+        # 启动加载线程
+        QTimer.singleShot(UI_CONSTANTS['thread_start_delay_ms'], self._start_loader_thread)
+
+    def _start_loader_thread(self):
+        """延迟启动加载线程；启动前已取消或对话框已关闭时不再启动"""
+        if self.loader_thread is not None and not self.loader_thread.isRunning():
+            self.loader_thread.start()
+
+    def _stop_loader_thread(self):
+        """协作式停止加载线程：正在扫描的目录完成后线程退出，不再强行终止"""
+        loader = self.loader_thread
+        if loader is None:
+            return
+        self.loader_thread = None
+        loader.cancel()
+        loader.wait()
+        loader.deleteLater()
+
+    def _show_tab_progress(self, percent: int):
+        """在Cut详情Tab标题上显示加载进度"""
+        self.tab_widget.setTabText(self.CUT_TAB_INDEX, f"{self.CUT_TAB_TITLE} (加载中 {percent}%)")
+
+    def _show_progress_dialog(self):
+        """为当前加载线程创建并显示模态进度对话框"""
         self.progress_dialog = QProgressDialog("正在加载Cut数据...", "取消", 0, 100, self)
         self.progress_dialog.setWindowTitle("加载中...")
         self.progress_dialog.setWindowModality(Qt.WindowModal)
@@ -1070,104 +1578,42 @@ class ProjectStatisticsDialog(QDialog):
         self.progress_dialog.raise_()
         self.progress_dialog.activateWindow()
 
-        # 设置初始进度值
+        # 设置初始进度值；只重绘对话框本身，不重入事件循环
         self.progress_dialog.setValue(0)
-        QApplication.processEvents()
-
-        self.progress_dialog.setStyleSheet(f"""
-            QProgressDialog {{
-                background-color: {THEME_COLORS['bg_medium']};
-                color: {THEME_COLORS['text_white']};
-                border: 2px solid {THEME_COLORS['primary_blue']};
-                border-radius: 8px;
-            }}
-            QLabel {{
-                color: {THEME_COLORS['text_white']};
-                font-size: 14px;
-                font-weight: bold;
-                background-color: {THEME_COLORS['transparent']};
-                padding: 10px;
-            }}
-            QProgressBar {{
-                background-color: {THEME_COLORS['bg_light']};
-                border: 2px solid {THEME_COLORS['bg_lighter']};
-                border-radius: 6px;
-                text-align: center;
-                color: {THEME_COLORS['text_white']};
-                font-weight: bold;
-                height: 25px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {THEME_COLORS['primary_blue']};
-                border-radius: 4px;
-                margin: 1px;
-            }}
-            QPushButton {{
-                background-color: {THEME_COLORS['bg_light']};
-                color: {THEME_COLORS['text_white']};
-                border: 2px solid {THEME_COLORS['bg_lighter']};
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-width: 80px;
-            }}
-            QPushButton:hover {{
-                background-color: {THEME_COLORS['bg_lighter']};
-                border-color: {THEME_COLORS['primary_blue']};
-            }}
-            QPushButton:pressed {{
-                background-color: {THEME_COLORS['primary_blue']};
-                color: {THEME_COLORS['bg_dark']};
-            }}
-        """)
-
-        # 创建episode根节点
-        self.episode_items = {}
-        episodes = self.project_config.get("episodes", {})
+        self.progress_dialog.repaint()
+
+        self.progress_dialog.setStyleSheet(_PROGRESS_DIALOG_QSS)
 
-        if self.project_config.get("no_episode", False):
-            # 单集模式
-            cuts = self.project_config.get("cuts", [])
-            if cuts:
-                root_item = QTreeWidgetItem(self.cut_tree, ["根目录", "", "", "", ""])
-                root_item.setExpanded(True)
-                self.episode_items["root"] = root_item
-
-            # 处理特殊episode
-            for ep_id in episodes:
-                ep_cuts = episodes[ep_id]
-                if ep_cuts:
-                    ep_item = QTreeWidgetItem(self.cut_tree, [ep_id, "", "", "", ""])
-                    ep_item.setExpanded(True)
-                    self.episode_items[ep_id] = ep_item
-        else:
-            # Episode模式
-            for ep_id in sorted(episodes.keys()):
-                ep_cuts = episodes[ep_id]
-                ep_item = QTreeWidgetItem(self.cut_tree, [ep_id, "", "", "", ""])
-                ep_item.setExpanded(True)
-                self.episode_items[ep_id] = ep_item
-
-        # 创建并启动加载线程
-        self.loader_thread = CutDataLoader(self.project_config, self.project_base)
         self.loader_thread.progress_updated.connect(self.progress_dialog.setValue)
         self.loader_thread.status_updated.connect(self.progress_dialog.setLabelText)
-        self.loader_thread.cut_item_ready.connect(self._add_cut_item_async)
-        self.loader_thread.finished.connect(self._on_loading_finished)
 
         # 连接取消按钮
         self.progress_dialog.canceled.connect(self._cancel_loading)
 
-        # 启动加载线程
-        QTimer.singleShot(UI_CONSTANTS['thread_start_delay_ms'], self.loader_thread.start)
-
-    def _add_cut_item_async(self, parent_key: str, cut_id: str, episode_id: str, aep_info: dict, mov_info: dict, thumbnail: Path):
-        """异步添加Cut项"""
-        parent_item = self.episode_items.get(parent_key)
+    def _add_cut_batch_async(self, batch: list):
+        """异步添加一批Cut项，batch 中每项为 (父节点键, cut_id, episode_id, aep_info, mov_info, thumbnail)"""
+        # 取消后仍在队列中的结果直接丢弃
+        if self._loading_group is None:
+            return
+        loading_key = self._loading_group[0]
+        parent_item = self.episode_items.get(loading_key)
         if not parent_item:
             return
 
-        # 创建Cut项
+        per_batch = self.progress_dialog is None
+        if per_batch:
+            self._begin_bulk_tree_update()
+        try:
+            for parent_key, cut_id, episode_id, aep_info, mov_info, thumbnail in batch:
+                if parent_key == loading_key:
+                    self._create_cut_item(parent_item, cut_id, episode_id, aep_info, mov_info, thumbnail)
+        finally:
+            if per_batch:
+                self._end_bulk_tree_update()
+
+    def _create_cut_item(self, parent_item: QTreeWidgetItem, cut_id: str, episode_id: str,
+                         aep_info: dict, mov_info: dict, thumbnail: Path) -> QTreeWidgetItem:
+        """根据扫描结果创建Cut项"""
         cut_item = QTreeWidgetItem(parent_item, [
             cut_id,
             aep_info['version'] if aep_info else "无",
@@ -1179,80 +1625,76 @@ class ProjectStatisticsDialog(QDialog):
         # 不在列表中显示缩略图，缩略图仅用于悬浮提示
 
         # 存储文件路径信息供双击使用和悬浮提示
-        cut_item.setData(0, Qt.UserRole, {
-            'aep_path': aep_info['path'] if aep_info else None,
-            'mov_path': mov_info['path'] if mov_info else None,
-            'cut_id': cut_id,
-            'episode_id': episode_id,
-            'thumbnail_path': thumbnail
-        })
+        cut_item.setData(0, Qt.UserRole, _CutRef(
+            cut_id=cut_id,
+            episode_id=episode_id,
+            aep_path=aep_info['path'] if aep_info else None,
+            mov_path=mov_info['path'] if mov_info else None,
+            thumbnail_path=thumbnail
+        ))
+        return cut_item
 
     def _on_loading_finished(self):
-        """加载完成"""
-        self.progress_dialog.close()
-        if hasattr(self, 'loader_thread'):
-            self.loader_thread.deleteLater()
+        """加载完成，继续加载排队中的分组"""
+        self._loading_group = None
+        self._end_bulk_tree_update()
+        self._close_loading_feedback()
+        # finished 是 run() 的最后一步，等待线程真正退出后再释放
+        self._stop_loader_thread()
+        if self._queued_groups:
+            self._load_group_async(*self._queued_groups.pop(0))
+
+    def _close_loading_feedback(self):
+        """关闭进度对话框并恢复Tab标题"""
+        if self.progress_dialog is not None:
+            # QProgressDialog.close() 会发出 canceled，先断开，避免加载成功后被当作取消处理
+            self.progress_dialog.canceled.disconnect(self._cancel_loading)
+            self.progress_dialog.close()
+            self.progress_dialog.deleteLater()
+            self.progress_dialog = None
+        self.tab_widget.setTabText(self.CUT_TAB_INDEX, self.CUT_TAB_TITLE)
 
     def _cancel_loading(self):
         """取消加载"""
-        if hasattr(self, 'loader_thread') and self.loader_thread.isRunning():
-            self.loader_thread.terminate()
-            self.loader_thread.wait()
-            self.loader_thread.deleteLater()
-        self.progress_dialog.close()
-
-    def _add_cut_item(self, parent_item: QTreeWidgetItem, cut_id: str, episode_id: str):
+        self._stop_loader_thread()
+
+        # 丢弃已加载的部分，分组恢复为未加载状态，下次展开时重新加载
+        if self._loading_group is not None:
+            parent_key, tasks = self._loading_group
+            self._loading_group = None
+            group_item = self.episode_items[parent_key]
+            group_item.takeChildren()
+            group_item.setExpanded(False)
+            self._pending_groups[parent_key] = tasks
+
+        # 排队中的分组同样恢复为未加载状态
+        for parent_key, tasks in self._queued_groups:
+            self.episode_items[parent_key].setExpanded(False)
+            self._pending_groups[parent_key] = tasks
+        self._queued_groups.clear()
+
+        self._end_bulk_tree_update()
+        self._close_loading_feedback()
+
+    def _add_cut_item(self, parent_item: QTreeWidgetItem, cut_id: str, episode_id: str, thumbnail_index: dict = None):
         """添加Cut项"""
-        # 构建路径
-        if episode_id:
-            vfx_path = self.project_base / "01_vfx" / episode_id / cut_id
-            render_path = self.project_base / "06_render" / episode_id / cut_id / "prores"
-        else:
-            vfx_path = self.project_base / "01_vfx" / cut_id
-            render_path = self.project_base / "06_render" / cut_id / "prores"
-
-        # 查找AEP文件
-        aep_info = FileUtils.find_latest_aep(vfx_path)
-
-        # 查找MOV文件
-        mov_info = FileUtils.find_latest_mov(render_path)
-
-        # 查找缩略图
-        thumbnail = FileUtils.find_thumbnail(self.project_base, cut_id, episode_id)
-
-        # 创建Cut项
-        cut_item = QTreeWidgetItem(parent_item, [
-            cut_id,
-            aep_info['version'] if aep_info else "无",
-            mov_info['version'] if mov_info else "无",
-            str(aep_info['path']) if aep_info else "",
-            str(mov_info['path']) if mov_info else ""
-        ])
-
-        # 不在列表中显示缩略图，缩略图仅用于悬浮提示
-
-        # 存储文件路径信息供双击使用和悬浮提示
-        cut_item.setData(0, Qt.UserRole, {
-            'aep_path': aep_info['path'] if aep_info else None,
-            'mov_path': mov_info['path'] if mov_info else None,
-            'cut_id': cut_id,
-            'episode_id': episode_id,
-            'thumbnail_path': thumbnail
-        })
-
+        aep_info, mov_info, thumbnail = FileUtils.scan_cut(
+            os.fspath(self.project_base), cut_id, episode_id, thumbnail_index
+        )
+        self._create_cut_item(parent_item, cut_id, episode_id, aep_info, mov_info, thumbnail)
 
     def _on_cut_item_double_clicked(self, item: QTreeWidgetItem, column: int):
         """Cut项双击事件"""
-        data = item.data(0, Qt.UserRole)
-        if not data:
+        cut_ref = item.data(0, Qt.UserRole)
+        if not cut_ref:
             return
 
         if column == 1 or column == 3:  # AEP版本列或AEP路径列
-            aep_path = data.get('aep_path')
+            aep_path = cut_ref.aep_path
             if aep_path and aep_path.exists():
                 self._open_file(aep_path)
         elif column == 2 or column == 4:  # MOV版本列或MOV路径列
-            mov_path = data.get('mov_path')
+            mov_path = cut_ref.mov_path
             if mov_path and mov_path.exists():
                 self._open_file(mov_path)
 
@@ -1270,37 +1712,18 @@ class ProjectStatisticsDialog(QDialog):
 
     def _on_item_hovered(self, item: QTreeWidgetItem, global_pos: QPoint):
         """处理项目悬浮事件"""
-        cut_data = item.data(0, Qt.UserRole)
-        if not cut_data:
+        cut_ref = item.data(0, Qt.UserRole)
+        if not cut_ref:
             return
 
-        # 从存储的数据中获取缩略图路径
-        thumbnail_path = cut_data.get('thumbnail_path')
-        cut_id = cut_data.get('cut_id')
-
-
-        # 销毁之前的tooltip
-        if self.tooltip_widget:
-            self.tooltip_widget.hide()
-            self.tooltip_widget.deleteLater()
-            self.tooltip_widget = None
-
-        # 重新创建tooltip widget
-        self.tooltip_widget = CutTooltipWidget()
+        # 复用同一个tooltip，只更新内容
+        self.tooltip_widget.show_cut_info(cut_ref, cut_ref.thumbnail_path)
 
-        # tooltip会自动使用全局版本映射器，无需手动设置
-
-        # 显示新的tooltip内容
-        self.tooltip_widget.show_cut_info(cut_data, thumbnail_path)
-
-        # 使用定时器延迟显示，确保内容更新完成
-        QTimer.singleShot(50, lambda: self._show_tooltip_delayed(global_pos))
-
-    def _show_tooltip_delayed(self, global_pos: QPoint):
-        """延迟显示tooltip"""
-        if not self.tooltip_widget:
-            return
+        # tooltip为固定尺寸，无需等待布局即可直接定位显示
+        self._show_tooltip_at(global_pos)
 
+    def _show_tooltip_at(self, global_pos: QPoint):
+        """在鼠标旁显示tooltip"""
         # 调整tooltip位置，避免超出屏幕
         tooltip_size = self.tooltip_widget.size()
         screen_geometry = QApplication.primaryScreen().geometry()
@@ -1323,11 +1746,9 @@ class ProjectStatisticsDialog(QDialog):
         self.tooltip_widget.raise_()
 
     def _hide_tooltip(self):
-        """隐藏tooltip"""
-        if hasattr(self, 'tooltip_widget') and self.tooltip_widget:
+        """隐藏tooltip（不销毁，下次悬浮时复用）"""
+        if self.tooltip_widget:
             self.tooltip_widget.hide()
-            self.tooltip_widget.deleteLater()
-            self.tooltip_widget = None
 
     def _on_hover_preview_toggled(self, state):
         """悬浮预览开关状态变化"""
@@ -1355,82 +1776,86 @@ class CutDataLoader(QThread):
     """Cut数据加载线程"""
     progress_updated = Signal(int)
     status_updated = Signal(str)
-    cut_item_ready = Signal(object, str, str, dict, dict, object)  # parent_item, cut_id, episode_id, aep_info, mov_info, thumbnail
+    # [(parent_key, cut_id, episode_id, aep_info, mov_info, thumbnail), ...]
+    cut_batch_ready = Signal(list)
     finished = Signal()
 
-    def __init__(self, project_config, project_base, parent=None):
+    # 并行扫描Cut目录的线程数（目录扫描以 I/O 等待为主）
+    IO_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+    # 进度信号的最短发送间隔（秒），避免逐Cut跨线程发送
+    PROGRESS_PERIOD = 0.05
+    # 每批发送的Cut数，合并跨线程信号
+    BATCH_SIZE = 50
+
+    def __init__(self, project_config, project_base, tasks: list, parent=None):
         super().__init__(parent)
         self.project_config = project_config
         self.project_base = project_base
+        # 项目路径字符串只转换一次，逐Cut拼接路径时直接使用
+        self.project_root = os.fspath(project_base)
+        # 要加载的 (父节点键, cut_id, episode_id)，按界面顺序排列
+        self.tasks = tasks
+        self.total_cuts = len(tasks)
+        self._cancelled = threading.Event()
+        # 本次加载中各分组的缩略图索引 {episode_id: {cut_id: 路径}}，每个分组只查一次
+        self._thumbnail_indexes = {}
+
+    def cancel(self):
+        """请求停止加载，已提交但未开始的扫描会被取消"""
+        self._cancelled.set()
 
     def run(self):
-        """运行数据加载"""
-        episodes = self.project_config.get("episodes", {})
-        total_cuts = 0
-
-        # 计算总数
-        if self.project_config.get("no_episode", False):
-            cuts = self.project_config.get("cuts", [])
-            total_cuts += len(cuts)
-            for ep_cuts in episodes.values():
-                total_cuts += len(ep_cuts)
-        else:
-            for ep_cuts in episodes.values():
-                total_cuts += len(ep_cuts)
-
-        current_cut = 0
-
-        if self.project_config.get("no_episode", False):
-            # 单集模式
-            cuts = self.project_config.get("cuts", [])
-            if cuts:
-                for cut_id in cuts:
-                    self.status_updated.emit(f"正在处理根目录 Cut: {cut_id}")
-                    aep_info, mov_info, thumbnail = self._process_cut(cut_id, None)
-                    self.cut_item_ready.emit("root", cut_id, None, aep_info, mov_info, thumbnail)
-                    current_cut += 1
-                    self.progress_updated.emit(int((current_cut / total_cuts) * 100))
-
-            # 处理特殊episode
-            for ep_id in episodes:
-                ep_cuts = episodes[ep_id]
-                for cut_id in ep_cuts:
-                    self.status_updated.emit(f"正在处理 {ep_id} Cut: {cut_id}")
-                    aep_info, mov_info, thumbnail = self._process_cut(cut_id, ep_id)
-                    self.cut_item_ready.emit(ep_id, cut_id, ep_id, aep_info, mov_info, thumbnail)
-                    current_cut += 1
-                    self.progress_updated.emit(int((current_cut / total_cuts) * 100))
-        else:
-            # Episode模式
-            for ep_id in sorted(episodes.keys()):
-                ep_cuts = episodes[ep_id]
-                for cut_id in ep_cuts:
-                    self.status_updated.emit(f"正在处理 {ep_id} Cut: {cut_id}")
-                    aep_info, mov_info, thumbnail = self._process_cut(cut_id, ep_id)
-                    self.cut_item_ready.emit(ep_id, cut_id, ep_id, aep_info, mov_info, thumbnail)
-                    current_cut += 1
-                    self.progress_updated.emit(int((current_cut / total_cuts) * 100))
+        """运行数据加载：各Cut的目录扫描在线程池中并行进行，结果按原顺序发出"""
+        tasks = self.tasks
+        total_cuts = self.total_cuts
+        if not total_cuts:
+            self.finished.emit()
+            return
 
+        period = self.PROGRESS_PERIOD
+        last_emit = -period
+        last_percent = -1
+        last_parent_key = None
+        batch = []
+
+        with ThreadPoolExecutor(max_workers=self.IO_WORKERS) as pool:
+            # map 按提交顺序返回结果，树中的Cut顺序与串行加载时一致
+            results = pool.map(self._process_task, tasks)
+            for current_cut, ((parent_key, cut_id, episode_id), result) in enumerate(zip(tasks, results), 1):
+                if self._cancelled.is_set():
+                    pool.shutdown(cancel_futures=True)
+                    return
+                batch.append((parent_key, cut_id, episode_id) + result)
+                if len(batch) >= self.BATCH_SIZE:
+                    self.cut_batch_ready.emit(batch)
+                    batch = []
+
+                # 状态文字只在切换分组时更新，进度在百分比变化且超过发送间隔时更新
+                if parent_key != last_parent_key:
+                    last_parent_key = parent_key
+                    self.status_updated.emit(f"正在加载 {episode_id or '根目录'} 的Cut…")
+                percent = current_cut * 100 // total_cuts
+                now = time.monotonic()
+                if percent != last_percent and (now - last_emit >= period or current_cut == total_cuts):
+                    last_emit = now
+                    last_percent = percent
+                    self.progress_updated.emit(percent)
+
+        if batch:
+            self.cut_batch_ready.emit(batch)
         self.finished.emit()
 
+    def _process_task(self, task: tuple):
+        """处理 tasks 中的一项"""
+        _, cut_id, episode_id = task
+        return self._process_cut(cut_id, episode_id)
+
     def _process_cut(self, cut_id: str, episode_id: str):
         """处理单个Cut"""
-        # 构建路径
-        if episode_id:
-            vfx_path = self.project_base / "01_vfx" / episode_id / cut_id
-            render_path = self.project_base / "06_render" / episode_id / cut_id / "prores"
-        else:
-            vfx_path = self.project_base / "01_vfx" / cut_id
-            render_path = self.project_base / "06_render" / cut_id / "prores"
-
-        # 查找AEP文件
-        aep_info = FileUtils.find_latest_aep(vfx_path)
-
-        # 查找MOV文件
-        mov_info = FileUtils.find_latest_mov(render_path)
-
-        # 查找缩略图
-        thumbnail = FileUtils.find_thumbnail(self.project_base, cut_id, episode_id)
-
-        return aep_info, mov_info, thumbnail
+        thumbnail_index = self._thumbnail_indexes.get(episode_id)
+        if thumbnail_index is None:
+            # 多个线程可能同时建立同一索引，结果相同，后写入的覆盖即可
+            thumbnail_index = FileUtils.build_thumbnail_index(self.project_root, episode_id)
+            self._thumbnail_indexes[episode_id] = thumbnail_index
+        return FileUtils.scan_cut(self.project_root, cut_id, episode_id, thumbnail_index)
 
@@ -3,19 +3,127 @@
 自定义控件模块
 """
 
+import fnmatch
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from PySide6.QtCore import Qt, QSize, QRect
-from PySide6.QtGui import QFont, QIcon, QColor, QPainter, QPixmap, QFontMetrics
+from PySide6.QtCore import Qt, QSize, QRect, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QFont, QIcon, QColor, QImage, QPainter, QPixmap, QPixmapCache, QFontMetrics
 from PySide6.QtWidgets import (
     QLineEdit, QListWidget, QListWidgetItem, QStyledItemDelegate,
     QAbstractItemView, QStyle, QStyleOptionViewItem
 )
 
-from cx_project_manager.utils.constants import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, THREED_EXTENSIONS
+from cx_project_manager.utils.constants import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS, THREED_EXTENSIONS, LOCK_PREFIX
 from cx_project_manager.utils.models import FileInfo, ProjectPaths, ProjectInfo
-from cx_project_manager.utils.utils import get_file_info, format_file_size
+from cx_project_manager.utils.utils import get_file_info_from_entry, format_file_size
+from cx_project_manager.utils.thumb_cache import load_cached_thumbnail
+
+# 文件列表图标边长，以及缩放后图标的 QPixmapCache 上限（KB）
+_ICON_SIZE = 64
+_ICON_CACHE_LIMIT_KB = 128 * 1024
+# 后台生成缩略图的线程数
+_THUMBNAIL_THREADS = 4
+
+
+# 文件类型图标所在目录，文件名形如 {类型}_icon.png
+_ICON_DIR = "cx_project_manager/ui/_icons"
+_ICON_SUFFIX = "_icon.png"
+
+
+@lru_cache(maxsize=1)
+def _icons() -> Dict[str, QIcon]:
+    """文件类型图标 {类型: QIcon}，首次使用时扫描一次图标目录，所有列表控件共享"""
+    icons = {}
+    try:
+        with os.scandir(_ICON_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(_ICON_SUFFIX) and entry.is_file():
+                    icon = QIcon(entry.path)
+                    if not icon.isNull():
+                        icons[entry.name[:-len(_ICON_SUFFIX)]] = icon
+    except OSError as e:
+        print(f"加载图标失败: {e}")
+    return icons
+
+
+# 特定文件类型对应的图标
+_EXT_TO_ICON = {
+    '.aep': 'aep',
+    '.psd': 'psd',
+    '.clip': 'clip',
+    '.ma': 'maya', '.mb': 'maya',
+    '.max': '3dsmax', '.3ds': '3dsmax',
+    '.blend': 'blender',
+    '.c4d': 'c4d',
+    '.pld': 'pld'
+}
+# 通用三维交换格式
+_EXCHANGE_3D_EXTENSIONS = ('.fbx', '.obj', '.dae', '.abc', '.usd', '.usda', '.usdc')
+
+
+@lru_cache(maxsize=1)
+def _ext_icons() -> Dict[str, Optional[QIcon]]:
+    """
+    扩展名 -> 最终图标，一次查表即可确定图标
+    按优先级从低到高写入：视频 < 三维 < 通用三维格式 < 特定文件类型；图片需加载缩略图，不在表中
+    """
+    icons = _icons()
+    ext_icons = {}
+    for ext in VIDEO_EXTENSIONS - IMAGE_EXTENSIONS:
+        ext_icons[ext] = icons.get('video')
+    for ext in THREED_EXTENSIONS:
+        ext_icons[ext] = icons.get('3d')
+    for ext in _EXCHANGE_3D_EXTENSIONS:
+        ext_icons[ext] = icons.get('fbx', icons.get('3d'))
+    for ext, icon_name in _EXT_TO_ICON.items():
+        ext_icons[ext] = icons.get(icon_name, icons.get('3d' if ext in THREED_EXTENSIONS else 'file'))
+    return ext_icons
+
+
+def _icon_cache_key(path: Path, mtime_ns: int) -> str:
+    """缩放后图标的 QPixmapCache 键；包含修改时间，文件更新后自动失效"""
+    return f"{path}|{mtime_ns}|{_ICON_SIZE}"
+
+
+@lru_cache(maxsize=1)
+def _thumbnail_pool() -> QThreadPool:
+    """缩略图专用线程池，避免大量缩略图任务占满全局线程池"""
+    pool = QThreadPool()
+    pool.setMaxThreadCount(_THUMBNAIL_THREADS)
+    return pool
+
+
+class _ThumbnailSignals(QObject):
+    """缩略图生成完成信号（QRunnable 本身不能定义信号）"""
+    loaded = Signal(int, int, str, str, QImage)  # 列表代次, 行号, 文件路径, 缓存键, 缩略图
+
+
+class _ThumbnailJob(QRunnable):
+    """在线程池中读取缩略图（优先磁盘缓存），完成后通知列表更新图标"""
+
+    def __init__(self, signals: _ThumbnailSignals, generation: int, row: int, item_path: str,
+                 path: Path, mtime_ns: int):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        self.row = row
+        self.item_path = item_path
+        self.path = path
+        self.mtime_ns = mtime_ns
+
+    def run(self):
+        try:
+            image = load_cached_thumbnail(self.path, self.mtime_ns, _ICON_SIZE)
+        except Exception as e:
+            print(f"加载缩略图失败: {e}")
+            return
+        if image is not None:
+            self.signals.loaded.emit(self.generation, self.row, self.item_path,
+                                     _icon_cache_key(self.path, self.mtime_ns), image)
 
 
 class SearchLineEdit(QLineEdit):
@@ -31,6 +139,15 @@ class SearchLineEdit(QLineEdit):
 class FileItemDelegate(QStyledItemDelegate):
     """文件列表项委托，用于自定义绘制"""
 
+    # 绘制用颜色，所有实例共享，不在每次绘制时构造
+    _SELECTED_BG = QColor("#0D7ACC")
+    _HOVER_BG = QColor("#3A3A3A")
+    _NAME_COLOR = QColor("#FFFFFF")
+    _TIME_COLOR_SELECTED = QColor("#E0E0E0")
+    _TIME_COLOR = QColor("#808080")
+    _AEP_V0_COLOR = QColor("#FF9800")
+    _VERSION_COLOR = QColor("#4CAF50")
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.icon_size = 64
@@ -39,6 +156,9 @@ class FileItemDelegate(QStyledItemDelegate):
         self.name_font = QFont("MiSans", 12, QFont.Bold)
         self.time_font = QFont("MiSans", 9)
         self.size_font = QFont("MiSans", 9)
+        self.version_metrics = QFontMetrics(self.version_font)
+        # 版本字符串 -> 绘制宽度
+        self._version_widths = {}
 
     def paint(self, painter: QPainter, option: QStyleOptionViewItem, index):
         painter.save()
@@ -52,10 +172,11 @@ class FileItemDelegate(QStyledItemDelegate):
         rect = option.rect
 
         # 背景
-        if option.state & QStyle.State_Selected:
-            painter.fillRect(rect, QColor("#0D7ACC"))
+        selected = option.state & QStyle.State_Selected
+        if selected:
+            painter.fillRect(rect, self._SELECTED_BG)
         elif option.state & QStyle.State_MouseOver:
-            painter.fillRect(rect, QColor("#3A3A3A"))
+            painter.fillRect(rect, self._HOVER_BG)
 
         # 图标
         icon = index.data(Qt.DecorationRole)
@@ -73,18 +194,16 @@ class FileItemDelegate(QStyledItemDelegate):
 
         # 文件名
         painter.setFont(self.name_font)
-        painter.setPen(QColor(
-            "#FFFFFF") if file_info.is_reuse_cut else Qt.white if option.state & QStyle.State_Selected else QColor(
-            "#FFFFFF"))
+        painter.setPen(self._NAME_COLOR)
         name_rect = QRect(text_left, rect.top() + self.padding, text_width, 25)
-        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, file_info.name)
+        name = f"{LOCK_PREFIX}{file_info.name}" if file_info.is_locked else file_info.name
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
 
         # 时间
         painter.setFont(self.time_font)
-        painter.setPen(QColor("#E0E0E0") if option.state & QStyle.State_Selected else QColor("#808080"))
-        time_text = file_info.modified_time.strftime("%Y-%m-%d %H:%M")
+        painter.setPen(self._TIME_COLOR_SELECTED if selected else self._TIME_COLOR)
         time_rect = QRect(text_left, rect.top() + self.padding + 30, text_width, 20)
-        painter.drawText(time_rect, Qt.AlignLeft | Qt.AlignVCenter, time_text)
+        painter.drawText(time_rect, Qt.AlignLeft | Qt.AlignVCenter, file_info.modified_time_text)
 
         # 文件大小
         if not file_info.is_folder and file_info.size > 0:
@@ -93,17 +212,20 @@ class FileItemDelegate(QStyledItemDelegate):
             size_rect = QRect(text_left, rect.top() + self.padding + 48, text_width, 20)
             painter.drawText(size_rect, Qt.AlignLeft | Qt.AlignVCenter, size_text)
 
-        # 版本号
-        if file_info.version is not None and file_info.version_str:
+        # 版本号（version_str 需经过版本映射，每次绘制只取一次）
+        version_str = file_info.version_str if file_info.version is not None else ""
+        if version_str:
             painter.setFont(self.version_font)
-            color = QColor("#FF9800") if file_info.is_aep and file_info.version == 0 else QColor("#4CAF50")
+            color = self._AEP_V0_COLOR if file_info.is_aep and file_info.version == 0 else self._VERSION_COLOR
             painter.setPen(color)
 
-            fm = QFontMetrics(self.version_font)
-            text_width = fm.horizontalAdvance(file_info.version_str)
+            text_width = self._version_widths.get(version_str)
+            if text_width is None:
+                text_width = self.version_metrics.horizontalAdvance(version_str)
+                self._version_widths[version_str] = text_width
             version_rect = QRect(rect.right() - text_width - 15, rect.top() + rect.height() // 2 - 20,
                                  text_width + 10, 40)
-            painter.drawText(version_rect, Qt.AlignCenter, file_info.version_str)
+            painter.drawText(version_rect, Qt.AlignCenter, version_str)
 
         painter.restore()
 
@@ -118,30 +240,30 @@ class DetailedFileListWidget(QListWidget):
         super().__init__(parent)
         self.setItemDelegate(FileItemDelegate(self))
         self.setSpacing(4)
-        self.setUniformItemSizes(False)
+        # 委托的 sizeHint 对所有项相同，Qt 只需计算一次
+        self.setUniformItemSizes(True)
         self.setAlternatingRowColors(False)
         self.setSelectionMode(QAbstractItemView.SingleSelection)
+        # 只放大全局缓存上限，不缩小其他地方设置的值
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), _ICON_CACHE_LIMIT_KB))
         self._load_icons()
 
+        # 缩略图在后台生成；列表清空后代次递增，旧代次的结果直接丢弃
+        self._thumbnail_generation = 0
+        self._thumbnail_signals = _ThumbnailSignals(self)
+        self._thumbnail_signals.loaded.connect(self._on_thumbnail_loaded)
+
     def _load_icons(self):
-        """加载图标"""
-        icon_base = Path("cx_project_manager/ui/_icons")
-        icon_types = [
-            'aep', 'psd', 'folder', 'image', 'video', 'file', 'clip',
-            'maya', '3dsmax', 'blender', 'c4d', 'fbx', 'pld', '3d',
-            'png_seq', 'no_render'
-        ]
-
-        self.icons = {}
-        for icon_type in icon_types:
-            icon_path = icon_base / f"{icon_type}_icon.png"
-            if icon_path.exists():
-                icon = QIcon(str(icon_path))
-                if not icon.isNull():
-                    self.icons[icon_type] = icon
+        """加载图标（共享全局图标表，不再逐个实例检查图标文件）"""
+        self.icons = _icons()
+
+    def clear(self):
+        """清空列表，尚未完成的缩略图结果随之作废"""
+        self._thumbnail_generation += 1
+        super().clear()
 
     def add_file_item(self, file_info: FileInfo):
-        """添加文件项"""
+        """添加文件项；缩略图未缓存时先显示类型图标，后台生成后再替换"""
         item = QListWidgetItem()
         item.setData(Qt.UserRole, str(file_info.path))
         item.setData(Qt.UserRole + 1, file_info)
@@ -152,8 +274,55 @@ class DetailedFileListWidget(QListWidget):
         else:
             item.setIcon(self.icons.get('file', QIcon()))
 
+        row = self.count()
         self.addItem(item)
 
+        thumbnail_source = self._thumbnail_source(file_info)
+        if thumbnail_source is not None:
+            self._request_thumbnail(item, row, thumbnail_source)
+
+    def _request_thumbnail(self, item: QListWidgetItem, row: int, path: Path):
+        """内存缓存命中时直接设置缩略图，否则交给后台线程生成"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return
+
+        pixmap = QPixmap()
+        if QPixmapCache.find(_icon_cache_key(path, mtime_ns), pixmap):
+            item.setIcon(QIcon(pixmap))
+            return
+
+        _thumbnail_pool().start(_ThumbnailJob(
+            self._thumbnail_signals, self._thumbnail_generation, row, item.data(Qt.UserRole), path, mtime_ns
+        ))
+
+    def _on_thumbnail_loaded(self, generation: int, row: int, item_path: str, key: str, image: QImage):
+        """后台缩略图生成完成，更新对应文件项的图标"""
+        if generation != self._thumbnail_generation:
+            return
+        # 期间可能有项被移除（takeItem）导致行号变化，按文件路径核对，不符时重新查找
+        item = self.item(row)
+        if item is None or item.data(Qt.UserRole) != item_path:
+            item = self._find_item_by_path(item_path)
+            if item is None:
+                return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(key, pixmap)
+        item.setIcon(QIcon(pixmap))
+
+    def add_file_items(self, file_infos: list):
+        """批量添加文件项，期间暂停重绘和信号，结束后统一重绘一次"""
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            for file_info in file_infos:
+                self.add_file_item(file_info)
+        finally:
+            self.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
+
     def load_files(self, directory: Path, pattern: str = "*", expand_folders: bool = False):
         """加载目录中的文件"""
         self.clear()
@@ -161,86 +330,96 @@ class DetailedFileListWidget(QListWidget):
         if not directory.exists():
             return
 
+        # scandir 的 DirEntry 自带类型与 stat 结果，每个条目无需再单独 stat
+        # 路径是文件或无法访问时与 Path.glob 一致，不显示任何内容
         files = []
-        for file_path in directory.glob(pattern):
-            if expand_folders and file_path.is_dir():
-                for sub_file in file_path.rglob("*"):
-                    if sub_file.is_file():
-                        files.append(get_file_info(sub_file))
-            else:
-                files.append(get_file_info(file_path))
+        folders = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if not fnmatch.fnmatch(entry.name, pattern):
+                        continue
+                    if expand_folders and entry.is_dir():
+                        folders.append(entry.path)
+                    else:
+                        files.append(get_file_info_from_entry(entry))
+        except OSError:
+            return
+
+        # 展开的文件夹之间互不依赖，多个时在线程池中并行遍历，重叠网络盘上的 stat 等待
+        if len(folders) > 1:
+            max_workers = min(8, len(folders))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for folder_files in executor.map(self._collect_files_recursive, folders):
+                    files.extend(folder_files)
+        elif folders:
+            files.extend(self._collect_files_recursive(folders[0]))
 
         files.sort(key=lambda f: f.modified_time, reverse=True)
 
-        for file_info in files:
-            self.add_file_item(file_info)
+        self.add_file_items(files)
 
-    def _get_file_icon(self, file_info: FileInfo) -> Optional[QIcon]:
-        """获取文件图标（支持自定义缩略图）"""
+    @staticmethod
+    def _collect_files_recursive(folder: str) -> list:
+        """递归收集文件夹中所有文件的信息"""
+        files = []
+        stack = [folder]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            files.append(get_file_info_from_entry(entry))
+            except OSError:
+                continue
+        return files
+
+    def _find_item_by_path(self, item_path: str) -> Optional[QListWidgetItem]:
+        """按 Qt.UserRole 中的文件路径查找列表项"""
+        for row in range(self.count()):
+            item = self.item(row)
+            if item.data(Qt.UserRole) == item_path:
+                return item
+        return None
+
+    @staticmethod
+    def _thumbnail_source(file_info: FileInfo) -> Optional[Path]:
+        """用作图标的图片：自定义缩略图、PNG序列第一帧或图片文件本身；没有时返回 None"""
         if file_info.is_no_render:
-            return self.icons.get('no_render')
+            return None
 
         # 优先使用自定义缩略图
-        if hasattr(file_info, 'thumbnail_path') and file_info.thumbnail_path:
-            try:
-                pixmap = QPixmap(str(file_info.thumbnail_path))
-                if not pixmap.isNull():
-                    # 缩放到合适的尺寸，保持纵横比
-                    scaled_pixmap = pixmap.scaled(
-                        64, 64,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation
-                    )
-                    return QIcon(scaled_pixmap)
-            except Exception as e:
-                print(f"加载缩略图失败: {e}")
-                # 如果加载失败，继续使用默认图标
+        if file_info.thumbnail_path:
+            return file_info.thumbnail_path
 
         if file_info.is_folder:
-            if file_info.is_png_seq and file_info.first_png:
-                try:
-                    pixmap = QPixmap(str(file_info.first_png))
-                    if not pixmap.isNull():
-                        return QIcon(pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-                except:
-                    pass
-                return self.icons.get('png_seq', self.icons.get('folder'))
-            return self.icons.get('folder')
+            return file_info.first_png if file_info.is_png_seq else None
 
         ext = file_info.path.suffix.lower()
+        if ext in IMAGE_EXTENSIONS and ext not in _ext_icons():
+            return file_info.path
+        return None
 
-        # 特定文件类型
-        ext_to_icon = {
-            '.aep': 'aep',
-            '.psd': 'psd',
-            '.clip': 'clip',
-            '.ma': 'maya', '.mb': 'maya',
-            '.max': '3dsmax', '.3ds': '3dsmax',
-            '.blend': 'blender',
-            '.c4d': 'c4d',
-            '.pld': 'pld'
-        }
+    def _get_file_icon(self, file_info: FileInfo) -> Optional[QIcon]:
+        """获取文件类型图标（有缩略图时作为生成完成前的占位图标）"""
+        if file_info.is_no_render:
+            return self.icons.get('no_render')
 
-        if ext in ext_to_icon:
-            return self.icons.get(ext_to_icon[ext], self.icons.get('3d' if ext in THREED_EXTENSIONS else 'file'))
+        if file_info.is_folder:
+            if file_info.is_png_seq and file_info.first_png:
+                return self.icons.get('png_seq', self.icons.get('folder'))
+            return self.icons.get('folder')
 
-        if ext in ['.fbx', '.obj', '.dae', '.abc', '.usd', '.usda', '.usdc']:
-            return self.icons.get('fbx', self.icons.get('3d'))
+        ext = file_info.path.suffix.lower()
 
-        if ext in THREED_EXTENSIONS:
-            return self.icons.get('3d')
+        # 特定文件类型、三维与视频文件直接查表
+        ext_icons = _ext_icons()
+        if ext in ext_icons:
+            return ext_icons[ext]
 
         if ext in IMAGE_EXTENSIONS:
-            try:
-                pixmap = QPixmap(str(file_info.path))
-                if not pixmap.isNull():
-                    return QIcon(pixmap.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            except:
-                pass
             return self.icons.get('image')
 
-        if ext in VIDEO_EXTENSIONS:
-            # 对于视频文件，如果有缩略图，已经在上面处理了
-            return self.icons.get('video')
-
         return self.icons.get('file')
\ No newline at end of file
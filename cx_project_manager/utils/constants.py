@@ -41,6 +41,13 @@ CUT_PATTERN = re.compile(r'^(\d+)([A-Za-z]?)$')
 PROJECT_REGISTRY_FILE = "project_registry.json"
 PROJECT_SETTINGS_DIR = "_proj_settings"
 
+# 锁定文件在列表中显示时的名称前缀（只在绘制时添加，FileInfo.name 保持原始文件名）
+LOCK_PREFIX = "🔒 "
+
+# 查找 01_vfx / 06_render 时的最大目录深度
+# 项目根目录/01_vfx（单集模式）为 1，项目根目录/ep01/01_vfx 为 2
+VFX_DEPTH = 2
+
 # ================================ 枚举定义 ================================ #
 
 class EpisodeType(Enum):
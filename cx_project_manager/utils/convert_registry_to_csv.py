@@ -10,32 +10,61 @@ import os
 from pathlib import Path
 from typing import Optional, cast
 
+# ijson 为可选依赖：安装后逐条流式读取注册表，否则整体读入
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _iter_registry(f):
+    """逐条返回注册表中的 (项目名, 项目信息)，f 为以二进制模式打开的JSON文件"""
+    if ijson is not None:
+        return ijson.kvitems(f, '')
+    return json.load(f).items()
+
+
+def _csv_up_to_date(json_path: Path, csv_path: Path) -> bool:
+    """CSV 是否晚于JSON写入；修改时间相同时无法区分先后，视为需要更新"""
+    try:
+        return os.stat(csv_path).st_mtime_ns > os.stat(json_path).st_mtime_ns
+    except OSError:
+        return False
+
 
 def convert_registry_to_csv(project_base: Optional[Path] = None) -> bool:
-    """将JSON注册表转换为CSV格式"""
+    """将JSON注册表转换为CSV格式，CSV已是最新时直接返回"""
 
     # 路径配置
     json_path = Path(project_base) / 'project_registry.json'
     csv_path = Path(project_base) / 'project_registry.csv'
+    tmp_path = csv_path.with_name(csv_path.name + '.tmp')
+
+    if _csv_up_to_date(json_path, csv_path):
+        return True
 
-    # 读取JSON
+    # 打开JSON；未安装 ijson 时在此处整体解析
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        json_file = open(json_path, 'rb')
+        try:
+            registry_items = _iter_registry(json_file)
+        except Exception:
+            json_file.close()
+            raise
     except Exception as e:
         print(f"读取JSON失败: {e}")
         return False
 
-    # 写入CSV
+    # 边读取边写入临时文件，完成后原子替换，Bridge 不会读到写了一半的CSV
     try:
-        with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        with json_file, open(tmp_path, 'w', encoding='utf-8', newline='') as f:
             writer = csv.writer(f)
 
             # 写入表头
             writer.writerow(['project_name', 'project_display_name', 'project_path', 'no_episode', 'last_accessed'])
 
             # 写入数据
-            for project_name, project_info in data.items():
+            for project_name, project_info in registry_items:
                 writer.writerow([
                     project_name,
                     project_info.get('project_display_name', ''),
@@ -44,11 +73,16 @@ def convert_registry_to_csv(project_base: Optional[Path] = None) -> bool:
                     project_info.get('last_accessed', '')
                 ])
 
+        os.replace(tmp_path, csv_path)
         print(f"成功创建CSV文件: {csv_path}")
         return True
 
     except Exception as e:
         print(f"写入CSV失败: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
         return False
 
 
@@ -72,14 +106,10 @@ def watch_and_convert(base_path: Optional[Path] = None):
         print(f"JSON文件不存在: {json_path}")
         return
 
-    json_mtime = json_path.stat().st_mtime
-
     # 检查CSV是否需要更新
-    if csv_path.exists():
-        csv_mtime = csv_path.stat().st_mtime
-        if csv_mtime >= json_mtime:
-            print("CSV文件已是最新")
-            return
+    if _csv_up_to_date(json_path, csv_path):
+        print("CSV文件已是最新")
+        return
 
     # 执行转换
     convert_registry_to_csv(base_path)
@@ -5,6 +5,7 @@
 
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -78,16 +79,17 @@ class ReuseCut:
         """获取显示名称"""
         return "_".join(self.cuts)
 
+    @cached_property
+    def _cut_numbers(self) -> frozenset:
+        """各Cut编号的数字部分，首次使用时解析一次"""
+        return frozenset(match.group(1) for match in map(CUT_PATTERN.match, self.cuts) if match)
+
     def contains_cut(self, cut_id: str) -> bool:
-        """检查是否包含指定cut"""
-        for cut in self.cuts:
-            if cut == cut_id:
-                return True
-            match1 = CUT_PATTERN.match(cut)
-            match2 = CUT_PATTERN.match(cut_id)
-            if match1 and match2 and match1.group(1) == match2.group(1):
-                return True
-        return False
+        """检查是否包含指定cut（编号完全相同，或数字部分相同）"""
+        if cut_id in self.cuts:
+            return True
+        match = CUT_PATTERN.match(cut_id)
+        return bool(match) and match.group(1) in self._cut_numbers
 
 
 @dataclass
@@ -107,6 +109,11 @@ class FileInfo:
     is_reuse_cut: bool = False
     thumbnail_path: Optional[Path] = None  # 添加缩略图路径属性
 
+    @cached_property
+    def modified_time_text(self) -> str:
+        """列表中显示的修改时间，首次使用时格式化一次"""
+        return self.modified_time.strftime("%Y-%m-%d %H:%M")
+
     @property
     def version_str(self) -> str:
         """获取版本字符串"""
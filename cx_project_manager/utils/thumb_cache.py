@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+缩略图磁盘缓存模块
+将缩放后的小图保存为 PNG，下次启动时直接读取，无需重新解码原始大图
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Optional
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QImageReader
+
+from .utils import ensure_dir
+
+# 缓存目录与容量上限
+THUMB_CACHE_DIR = Path.home() / ".cx_project_manager" / "thumbs"
+THUMB_CACHE_LIMIT_MB = 256
+# 每写入多少张缩略图检查一次容量
+_PRUNE_INTERVAL = 200
+
+_lock = threading.Lock()
+_writes_since_prune = 0
+_dir_ready = False
+
+
+def _cache_path(path: Path, mtime_ns: int, size: int) -> Path:
+    """缓存文件路径，由源文件路径、修改时间和尺寸决定"""
+    digest = hashlib.sha1(f"{path}|{mtime_ns}|{size}".encode("utf-8")).hexdigest()
+    return THUMB_CACHE_DIR / f"{digest}.png"
+
+
+def _read_scaled(path: Path, size: int) -> Optional[QImage]:
+    """按目标尺寸读取图片；支持缩放解码的格式（如JPEG）不必解码完整分辨率"""
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(size, size, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    # 无法预知原始尺寸时读取的是原图，这里再缩放一次
+    if image.width() > size or image.height() > size:
+        image = image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return image
+
+
+def load_cached_thumbnail(path: Path, mtime_ns: int, size: int) -> Optional[QImage]:
+    """
+    读取缩放到 size 的缩略图，优先使用磁盘缓存
+    缓存不存在时解码原图并缩放，写入缓存后返回；原图无法读取时返回 None
+    """
+    global _writes_since_prune, _dir_ready
+
+    cache_path = _cache_path(path, mtime_ns, size)
+    image = QImage()
+    if image.load(str(cache_path)):
+        return image
+
+    image = _read_scaled(path, size)
+    if image is None:
+        return None
+
+    try:
+        with _lock:
+            if not _dir_ready:
+                ensure_dir(THUMB_CACHE_DIR)
+                _dir_ready = True
+                _writes_since_prune = _PRUNE_INTERVAL
+            _writes_since_prune += 1
+            prune = _writes_since_prune >= _PRUNE_INTERVAL
+            if prune:
+                _writes_since_prune = 0
+        if prune:
+            prune_thumb_cache()
+        _save_atomic(image, cache_path)
+    except OSError as e:
+        print(f"写入缩略图缓存失败: {e}")
+    return image
+
+
+def _save_atomic(image: QImage, cache_path: Path) -> None:
+    """
+    先写入缓存目录中的临时文件，再原子替换到目标位置
+    其他线程可能同时读取同一缓存文件，不能让它们读到写了一半的PNG
+    """
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=THUMB_CACHE_DIR)
+    os.close(fd)
+    try:
+        # QImage.save 失败时只返回 False，不会抛出异常
+        if not image.save(tmp_path, "PNG"):
+            raise OSError(f"无法保存 {cache_path.name}")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def prune_thumb_cache(limit_mb: int = THUMB_CACHE_LIMIT_MB) -> None:
+    """缓存超过上限时，从最旧的缩略图开始删除"""
+    entries = []
+    total_size = 0
+    try:
+        with os.scandir(THUMB_CACHE_DIR) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total_size += stat.st_size
+    except OSError:
+        return
+
+    limit = limit_mb * 1024 * 1024
+    if total_size <= limit:
+        return
+
+    entries.sort()
+    for _mtime, file_size, file_path in entries:
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total_size -= file_size
+        if total_size <= limit:
+            break
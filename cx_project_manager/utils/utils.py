@@ -3,10 +3,17 @@
 工具函数模块 - 完整版本
 """
 
+import errno
+import os
 import shutil
 import subprocess
 import platform
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -24,6 +31,85 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def is_dir_not_empty(path: Path) -> bool:
+    """检查目录是否非空（读到第一个条目即返回）"""
+    try:
+        with os.scandir(path) as it:
+            return next(it, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def get_dir_size(path, cancelled: Optional[threading.Event] = None) -> int:
+    """递归计算目录总大小，复用 DirEntry 缓存的 stat 结果；cancelled 被设置后尽快返回"""
+    total_size = 0
+    stack = [path]
+    while stack:
+        if cancelled is not None and cancelled.is_set():
+            break
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total_size += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total_size
+
+
+def get_dir_size_parallel(path, max_workers: Optional[int] = None,
+                          cancelled: Optional[threading.Event] = None) -> int:
+    """
+    按顶层子目录拆分，在线程池中并行计算目录总大小
+    网络盘上 stat 的延迟占主导，并行遍历可以重叠等待时间
+    """
+    total_size = 0
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total_size += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
+    # 子目录过少时不值得启动线程池
+    if len(subdirs) < 2:
+        return total_size + sum(get_dir_size(subdir, cancelled) for subdir in subdirs)
+
+    if max_workers is None:
+        max_workers = min(16, (os.cpu_count() or 4) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        total_size += sum(executor.map(partial(get_dir_size, cancelled=cancelled), subdirs))
+    return total_size
+
+
+def get_dir_signature(path: Path) -> Tuple[int, int, float]:
+    """递归统计目录，返回 (文件数, 总大小, 最新修改时间)"""
+    file_count = 0
+    total_size = 0
+    latest_mtime = 0.0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        stat = entry.stat(follow_symlinks=False)
+                        file_count += 1
+                        total_size += stat.st_size
+                        latest_mtime = max(latest_mtime, stat.st_mtime)
+        except OSError:
+            continue
+    return file_count, total_size, latest_mtime
+
+
 def copy_file_safe(src: Path, dst: Path) -> bool:
     """安全复制文件"""
     try:
@@ -35,6 +121,116 @@ def copy_file_safe(src: Path, dst: Path) -> bool:
         return False
 
 
+# reflink（写时复制克隆）：Linux 下的 FICLONE ioctl 编号
+_FICLONE = 0x40049409
+# 表示文件系统不支持克隆的错误码
+_REFLINK_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS
+}
+# 已确认不支持克隆的 (源设备, 目标设备)，之后直接走普通复制
+_reflink_unsupported_devices = set()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    """尝试以 reflink 方式克隆文件（btrfs/XFS/APFS），不支持时返回 False"""
+    if sys.platform.startswith("linux"):
+        import fcntl
+        dev_key = (os.stat(src).st_dev, os.stat(dst.parent).st_dev)
+        if dev_key in _reflink_unsupported_devices:
+            return False
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError as e:
+            if e.errno in _REFLINK_UNSUPPORTED_ERRNOS:
+                _reflink_unsupported_devices.add(dev_key)
+            return False
+        return True
+
+    if sys.platform == "darwin":
+        import ctypes
+        dev_key = (os.stat(src).st_dev, os.stat(dst.parent).st_dev)
+        if dev_key in _reflink_unsupported_devices:
+            return False
+        libc = ctypes.CDLL(None, use_errno=True)
+        if not hasattr(libc, "clonefile"):
+            _reflink_unsupported_devices.add(dev_key)
+            return False
+        # clonefile 要求目标不存在
+        dst.unlink(missing_ok=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            err = ctypes.get_errno()
+            if err in _REFLINK_UNSUPPORTED_ERRNOS or err == errno.ENOTSUP:
+                _reflink_unsupported_devices.add(dev_key)
+            return False
+        return True
+
+    return False
+
+
+def clone_file_safe(src: Path, dst: Path) -> bool:
+    """复制文件，优先使用 reflink 克隆，文件系统不支持时退回普通复制"""
+    try:
+        ensure_dir(dst.parent)
+        if _reflink(src, dst):
+            shutil.copystat(src, dst)
+            return True
+    except OSError:
+        pass
+    return copy_file_safe(src, dst)
+
+
+def copy_file_fast(src, dst) -> str:
+    """
+    供 shutil.copytree 使用的 copy_function
+    目标文件大小与修改时间（纳秒）都与源文件相同时跳过，否则优先 reflink 克隆，再退回 copy2
+    复制时会保留修改时间，因此只有完全相同才视为未变化；较旧的版本重新导入时同样会复制
+    """
+    src_stat = os.stat(src)
+    try:
+        dst_stat = os.stat(dst)
+    except FileNotFoundError:
+        dst_stat = None
+
+    if (dst_stat is not None and dst_stat.st_size == src_stat.st_size and
+            src_stat.st_mtime_ns == dst_stat.st_mtime_ns):
+        return dst
+
+    if _reflink(Path(src), Path(dst)):
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+    return dst
+
+
+def remove_extra_entries(src, dst) -> None:
+    """
+    删除目标目录中源目录没有的文件和文件夹（类型不同的同名条目也删除）
+    与 copytree(dirs_exist_ok=True) 配合，使原地更新后的目标与源完全一致
+    """
+    stack = [(os.fspath(src), os.fspath(dst))]
+    while stack:
+        src_dir, dst_dir = stack.pop()
+        try:
+            with os.scandir(src_dir) as it:
+                src_types = {entry.name: entry.is_dir() for entry in it}
+            with os.scandir(dst_dir) as it:
+                dst_entries = list(it)
+        except OSError:
+            continue
+
+        for entry in dst_entries:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if src_types.get(entry.name) == is_dir:
+                if is_dir:
+                    stack.append((os.path.join(src_dir, entry.name), entry.path))
+                continue
+            if is_dir:
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+
+
 def open_in_file_manager(path: Path) -> None:
     """在文件管理器中打开路径"""
     if not path or not path.exists():
@@ -58,24 +254,28 @@ def open_in_file_manager(path: Path) -> None:
         print(f"打开文件管理器失败: {e}")
 
 
+# 文件名中任意位置的 _G0 / _S0 / _T0 / _P0 / _V0（不区分大小写）
+_V0_PATTERN = re.compile(r'_[gstpv]0', re.IGNORECASE)
+
+
 def extract_version_from_filename(filename: str) -> Optional[int]:
     """从文件名中提取版本号"""
-    # 检查所有前缀的v0情况
-    filename_lower = filename.lower()
-    for prefix in ['g', 's', 't', 'p', 'v']:
-        if f"_{prefix}0" in filename_lower:
-            return 0
+    # 检查所有前缀的v0情况（一次搜索，不生成小写副本）
+    if _V0_PATTERN.search(filename):
+        return 0
 
     match = VERSION_PATTERN.search(filename)
     return int(match.group(1)) if match else None
 
 
+# 文件名末尾的版本字符串，如 _T3 / _v12（可带扩展名）
+_VERSION_STRING_PATTERN = re.compile(r'_([GSTPVgsptv])(\d+)(?:\.\w+)?$')
+
+
 def extract_version_string_from_filename(filename: str) -> Optional[str]:
     """从文件名中提取完整版本字符串"""
     # 查找最后一个_后跟字母和数字的模式
-    import re
-    pattern = re.compile(r'_([GSTPVgsptv])(\d+)(?:\.\w+)?$')
-    match = pattern.search(filename)
+    match = _VERSION_STRING_PATTERN.search(filename)
     if match:
         prefix = match.group(1).lower()
         number = match.group(2)
@@ -90,8 +290,9 @@ def extract_version_string_from_filename(filename: str) -> Optional[str]:
     return None
 
 
+@lru_cache(maxsize=4096)
 def format_file_size(size: int) -> str:
-    """格式化文件大小"""
+    """格式化文件大小（结果按字节数缓存，列表重绘时重复的大小不再格式化）"""
     for unit in ['B', 'KB', 'MB', 'GB']:
         if size < 1024.0:
             return f"{size:.1f} {unit}"
@@ -99,25 +300,36 @@ def format_file_size(size: int) -> str:
     return f"{size:.1f} TB"
 
 
+# 文件名中以下划线分隔的三位数字段（Cut编号），兼用cut文件名中至少有两段
+_CUT_NUMBER_PART_PATTERN = re.compile(r'(?:^|_)\d{3}(?=_|$)')
+
+
 def get_file_info(path: Path) -> FileInfo:
     """获取文件信息"""
-    stat = path.stat()
+    return _make_file_info(path, path.stat(), path.is_file(), path.is_dir())
+
+
+def get_file_info_from_entry(entry: os.DirEntry) -> FileInfo:
+    """由 os.scandir 的 DirEntry 获取文件信息，复用其缓存的类型与 stat 结果"""
+    return _make_file_info(Path(entry.path), entry.stat(), entry.is_file(), entry.is_dir())
+
+
+def _make_file_info(path: Path, stat: os.stat_result, is_file: bool, is_dir: bool) -> FileInfo:
+    """根据已获取的 stat 结果构建 FileInfo"""
     is_aep = path.suffix.lower() == '.aep'
 
     # 检查是否是兼用cut文件
-    is_reuse_cut = False
-    if path.stem.count('_') > 3:
-        parts = path.stem.split('_')
-        consecutive_nums = sum(1 for part in parts if part.isdigit() and len(part) == 3)
-        is_reuse_cut = consecutive_nums > 1
+    stem = path.stem
+    is_reuse_cut = (stem.count('_') > 3 and
+                    len(_CUT_NUMBER_PART_PATTERN.findall(stem)) > 1)
 
     return FileInfo(
         path=path,
         name=path.name,
         version=extract_version_from_filename(path.stem),
         modified_time=datetime.fromtimestamp(stat.st_mtime),
-        size=stat.st_size if path.is_file() else 0,
-        is_folder=path.is_dir(),
+        size=stat.st_size if is_file else 0,
+        is_folder=is_dir,
         is_aep=is_aep,
         is_reuse_cut=is_reuse_cut
     )
@@ -126,12 +338,14 @@ def get_file_info(path: Path) -> FileInfo:
 def get_png_seq_info(png_seq_path: Path) -> FileInfo:
     """获取PNG序列文件夹信息"""
     stat = png_seq_path.stat()
-    png_files = sorted(png_seq_path.glob("*.png"))
-    first_png = png_files[0] if png_files else None
+    # 只读取目录项名称，不对每一帧单独 stat
+    with os.scandir(png_seq_path) as it:
+        png_names = sorted(entry.name for entry in it if entry.name.lower().endswith('.png'))
+    first_png = png_seq_path / png_names[0] if png_names else None
 
     return FileInfo(
         path=png_seq_path,
-        name=f"{png_seq_path.name} ({len(png_files)} frames)" if png_files else png_seq_path.name,
+        name=f"{png_seq_path.name} ({len(png_names)} frames)" if png_names else png_seq_path.name,
         modified_time=datetime.fromtimestamp(stat.st_mtime),
         size=0,
         is_folder=True,
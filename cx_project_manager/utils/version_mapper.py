@@ -5,6 +5,7 @@ CXProjectManager 全局版本映射管理器
 这是应用程序级别的全局设置，所有项目共享同一套版本映射规则
 """
 
+from functools import lru_cache
 from typing import Dict, Optional
 
 
@@ -27,6 +28,18 @@ class VersionMapper:
         """初始化版本映射器"""
         # 使用类级别的固定映射配置
         self.version_mapping = self.VERSION_MAPPING.copy()
+        self._build_lookup()
+
+    def _build_lookup(self):
+        """预先建立不区分大小写的查找表：完整版本号映射与单字母前缀映射"""
+        # 与逐项比较时一致：大小写重复的键以先出现的为准
+        self._exact_lookup = {}
+        self._prefix_lookup = {}
+        for mapping_key, mapping_value in self.version_mapping.items():
+            key = mapping_key.lower()
+            self._exact_lookup.setdefault(key, mapping_value)
+            if len(mapping_key) == 1:
+                self._prefix_lookup.setdefault(key, mapping_value)
 
     def get_version_label(self, version_str: str) -> str:
         """
@@ -42,23 +55,20 @@ class VersionMapper:
             return ""
 
         # 先检查特定版本号映射（不区分大小写）
-        for mapping_key, mapping_value in self.version_mapping.items():
-            if version_str.lower() == mapping_key.lower():
-                return mapping_value
+        version_lower = version_str.lower()
+        exact = self._exact_lookup.get(version_lower)
+        if exact is not None:
+            return exact
 
         # 检查字母前缀映射（不区分大小写）
         if len(version_str) >= 2:
-            prefix = version_str[0]  # 获取前缀字母 (v, V, p, f等)
-            number_part = version_str[1:]  # 获取数字部分
-
-            # 查找匹配的前缀（不区分大小写）
-            for mapping_key, mapping_value in self.version_mapping.items():
-                if len(mapping_key) == 1 and prefix.lower() == mapping_key.lower():
-                    template = mapping_value
-                    if "{}" in template:
-                        return template.format(number_part)
-                    else:
-                        return template
+            template = self._prefix_lookup.get(version_lower[0])  # 前缀字母 (v, V, p, f等)
+            if template is not None:
+                number_part = version_str[1:]  # 获取数字部分
+                if "{}" in template:
+                    return template.format(number_part)
+                else:
+                    return template
 
         # 如果没有匹配的映射，返回原版本号
         return version_str
@@ -78,6 +88,7 @@ class VersionMapper:
         """
         if version_mapping:
             cls.VERSION_MAPPING.update(version_mapping)
+            get_version_label_global.cache_clear()
 
     def get_supported_prefixes(self) -> list:
         """
@@ -123,9 +134,11 @@ def get_global_version_mapper() -> VersionMapper:
     return _global_version_mapper
 
 
+@lru_cache(maxsize=256)
 def get_version_label_global(version_str: str) -> str:
     """
     全局版本标签获取函数
+    结果按版本字符串缓存，映射配置更新时清空
 
     Args:
         version_str: 版本字符串